@@ -1,13 +1,21 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Form
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from typing import List, Optional
+from typing import List, Optional, Dict, Any, AsyncIterator
+import asyncio
+import json
+import logging
 
 from app.config import settings
-from app.services.ai_service import ai_service
 from app.services.auth_service import AuthService
 from app.services.job_analyzer import JobAnalyzer
-from app.models.resume import JobDescription, MatchAnalysis
-from app.database.crud import ResumeCRUD, JobDescriptionCRUD
+from app.services.job_queue import match_job_queue, QueueFullError
+from app.services.match_service import match_service
+from app.models.resume import JobDescription, MatchAnalysis, MatchJob, MatchJobStatus
+from app.database.crud import ResumeCRUD, JobDescriptionCRUD, MatchJobCRUD
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 security = HTTPBearer()
@@ -15,6 +23,7 @@ auth_service = AuthService()
 job_analyzer = JobAnalyzer()
 resume_crud = ResumeCRUD()
 job_crud = JobDescriptionCRUD()
+match_job_crud = MatchJobCRUD()
 
 @router.post("/analyze-job", response_model=dict)
 async def analyze_job_description(
@@ -71,79 +80,194 @@ async def analyze_job_description(
 async def match_resume_to_job(
     resume_id: str = Form(...),
     job_description_id: str = Form(...),
+    bypass_cache: bool = Form(False),
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
     """Match resume against job description and generate AI suggestions"""
     try:
         user = await auth_service.get_current_user(credentials.credentials)
 
-        # Get user's API key
-        user_api_key = await auth_service.get_user_api_key(user.id)
-        if not user_api_key:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="OpenAI API key not configured. Please set your API key first."
-            )
-
-        # Get resume and job description
-        resume = await resume_crud.get_resume(resume_id, user.id)
-        job_desc = await job_crud.get_job_description(job_description_id, user.id)
-
-        if not resume or not job_desc:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Resume or job description not found"
-            )
-
-        # Convert resume content to dict for AI processing
-        resume_sections = {
-            "summary": resume.content.summary,
-            "experience": [exp.dict() for exp in resume.content.experience],
-            "skills": resume.content.skills,
-            "education": [edu.dict() for edu in resume.content.education],
-            "projects": [proj.dict() for proj in resume.content.projects]
-        }
-
-        # Generate AI suggestions
-        suggestions = await ai_service.enhance_resume_content(
-            resume_sections=resume_sections,
-            job_description=job_desc.content,
-            user_api_key=user_api_key
+        return await match_service.match_resume(
+            user.id,
+            resume_id,
+            job_description_id,
+            bypass_cache=bypass_cache
         )
 
-        # Calculate match score
-        match_score = await job_analyzer.calculate_match_score(
-            resume_sections, 
-            job_desc.content,
-            user_api_key=user_api_key
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Resume matching failed: {str(e)}"
         )
 
-        # Check ATS compliance
-        resume_text = await job_analyzer.convert_resume_to_text(resume.content)
-        ats_analysis = await ai_service.check_ats_compliance(
-            resume_text, 
-            user_api_key=user_api_key
+@router.post("/match-resume/jobs", status_code=status.HTTP_202_ACCEPTED)
+async def submit_match_job(
+    resume_id: str = Form(...),
+    job_description_id: str = Form(...),
+    bypass_cache: bool = Form(False),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    """Queue a resume match to run in the background and return its job ID"""
+    user = await auth_service.get_current_user(credentials.credentials)
+
+    resume = await resume_crud.get_resume(resume_id, user.id)
+    job_desc = await job_crud.get_job_description(job_description_id, user.id)
+
+    if not resume or not job_desc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Resume or job description not found"
         )
 
-        # Create match analysis
-        match_analysis = MatchAnalysis(
+    try:
+        job = await match_job_queue.submit(MatchJob(
+            user_id=user.id,
             resume_id=resume_id,
             job_description_id=job_description_id,
-            overall_score=match_score,
-            keyword_matches=job_desc.extracted_keywords,
-            missing_keywords=[],
-            suggestions=suggestions,
-            ats_compliance_score=ats_analysis.get("overall_score", 0)
+            bypass_cache=bypass_cache
+        ))
+    except QueueFullError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
         )
 
-        return match_analysis
+    return {"job_id": job.id, "status": job.status}
 
-    except Exception as e:
+@router.get("/match-resume/jobs/{job_id}")
+async def get_match_job_status(
+    job_id: str,
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    """Get the status of a background match job"""
+    user = await auth_service.get_current_user(credentials.credentials)
+
+    job = await match_job_crud.get_job(job_id, user.id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Match job not found"
+        )
+
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "attempts": job.attempts,
+        "error": job.error,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at
+    }
+
+@router.get("/match-resume/jobs/{job_id}/result", response_model=MatchAnalysis)
+async def get_match_job_result(
+    job_id: str,
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    """Get the match analysis produced by a finished background job"""
+    user = await auth_service.get_current_user(credentials.credentials)
+
+    job = await match_job_crud.get_job(job_id, user.id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Match job not found"
+        )
+
+    if job.status == MatchJobStatus.FAILED:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Resume matching failed: {str(e)}"
+            detail=f"Resume matching failed: {job.error}"
+        )
+    if job.status != MatchJobStatus.SUCCEEDED:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Match job is still {job.status.value}"
+        )
+
+    return job.result
+
+@router.post("/match-resume/stream")
+async def stream_match_resume_to_job(
+    resume_id: str = Form(...),
+    job_description_id: str = Form(...),
+    bypass_cache: bool = Form(False),
+    stream_format: str = Form("ndjson"),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    """Stream AI suggestions as they are generated, then the match score and ATS result.
+
+    Each event is a JSON object with a "type" of "suggestion", "match_score",
+    "ats_compliance", "done" or "error". Events are sent as NDJSON lines, or
+    as server-sent events when stream_format is "sse".
+    """
+    if stream_format not in ("ndjson", "sse"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="stream_format must be 'ndjson' or 'sse'"
         )
 
+    user = await auth_service.get_current_user(credentials.credentials)
+
+    # Missing keys, resumes or jobs are reported with a status code before streaming starts
+    inputs = await match_service.load_inputs(user.id, resume_id, job_description_id)
+
+    async def events() -> AsyncIterator[Dict[str, Any]]:
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def report(event_type: str, data: Any):
+            await queue.put({"type": event_type, "data": data})
+
+        async def run():
+            try:
+                match_analysis = await match_service.match_resume(
+                    user.id,
+                    resume_id,
+                    job_description_id,
+                    bypass_cache=bypass_cache,
+                    inputs=inputs,
+                    on_progress=report
+                )
+                await queue.put({
+                    "type": "done",
+                    "data": {
+                        "match_id": match_analysis.id,
+                        "suggestion_count": len(match_analysis.suggestions),
+                        "is_degraded": match_analysis.is_degraded,
+                        "reused_suggestions": match_analysis.reused_suggestions,
+                        "regenerated_suggestions": match_analysis.regenerated_suggestions
+                    }
+                })
+            except Exception as e:
+                # Headers are already sent, so errors are reported in-band
+                logger.error(f"Streaming resume match failed: {str(e)}")
+                await queue.put({"type": "error", "detail": f"Resume matching failed: {str(e)}"})
+            finally:
+                await queue.put(None)
+
+        task = asyncio.create_task(run())
+        try:
+            while (event := await queue.get()) is not None:
+                yield event
+        finally:
+            # The client may disconnect mid-stream
+            task.cancel()
+
+    async def encoded_events() -> AsyncIterator[str]:
+        async for event in events():
+            payload = json.dumps(jsonable_encoder(event))
+            if stream_format == "sse":
+                yield f"event: {event['type']}\ndata: {payload}\n\n"
+            else:
+                yield payload + "\n"
+
+    media_type = "text/event-stream" if stream_format == "sse" else "application/x-ndjson"
+    return StreamingResponse(
+        encoded_events(),
+        media_type=media_type,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @router.get("/my-jobs", response_model=List[JobDescription])
 async def get_user_job_descriptions(
     credentials: HTTPAuthorizationCredentials = Depends(security)
@@ -1,12 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException, status, File, UploadFile
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import List, Optional
 import os
-import uuid
 from datetime import datetime
 
 from app.config import settings
 from app.services.auth_service import AuthService
+from app.services.bulk_import import ARCHIVE_EXTENSION, bulk_importer, discard_staged
+from app.services.file_store import FileTooLargeError, save_temporary, save_upload
+from app.services.parser_pool import ParserPoolFullError, ParserTimeoutError
 from app.services.resume_parser import ResumeParser
 from app.models.resume import Resume, ResumeContent
 from app.database.crud import ResumeCRUD
@@ -26,8 +30,8 @@ async def upload_resume(
     try:
         user = await auth_service.get_current_user(credentials.credentials)
 
-        # Validate file
-        if file.size > settings.MAX_FILE_SIZE:
+        # Validate file; the declared size may be missing, so the limit is also enforced while copying
+        if file.size is not None and file.size > settings.MAX_FILE_SIZE:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="File too large"
@@ -40,30 +44,94 @@ async def upload_resume(
                 detail="Unsupported file format"
             )
 
-        # Save file
-        file_id = str(uuid.uuid4())
-        file_path = os.path.join(settings.UPLOAD_DIRECTORY, f"{file_id}{file_ext}")
-
-        with open(file_path, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
+        # Save file in chunks; identical uploads share one stored copy and one parse
+        try:
+            stored = await save_upload(file, file_ext, settings.MAX_FILE_SIZE)
+        except FileTooLargeError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="File too large"
+            )
 
         # Parse resume
-        parsed_content = await resume_parser.parse_resume(file_path, file_ext)
+        try:
+            parsed = await resume_parser.parse_resume(stored["file_path"], file_ext, stored["content_hash"])
+        except ParserPoolFullError as e:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=str(e)
+            )
+        except ParserTimeoutError as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Could not parse resume: {str(e)}"
+            )
 
         return {
-            "file_id": file_id,
+            "file_id": stored["content_hash"],
             "filename": file.filename,
-            "parsed_content": parsed_content,
+            "parsed_content": parsed["parsed_content"],
+            "extraction": parsed["extraction"],
+            "cached": parsed["cached"],
             "message": "Resume uploaded and parsed successfully"
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Upload failed: {str(e)}"
         )
 
+@router.post("/bulk-upload")
+async def bulk_upload_resumes(
+    files: List[UploadFile] = File(...),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    """Upload many resumes or ZIP archives of resumes; streams one NDJSON parse result per file"""
+    staged = []
+    try:
+        user = await auth_service.get_current_user(credentials.credentials)
+
+        if len(files) > settings.BULK_IMPORT_MAX_FILES:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Import is limited to {settings.BULK_IMPORT_MAX_FILES} files"
+            )
+
+        # Store everything before streaming; the request body is gone once the response starts
+        for file in files:
+            file_ext = os.path.splitext(file.filename or "")[1].lower()
+            try:
+                if file_ext == ARCHIVE_EXTENSION:
+                    archive = await save_temporary(file, settings.BULK_IMPORT_MAX_ARCHIVE_SIZE)
+                    staged.append({"filename": file.filename, "archive": archive})
+                elif file_ext in settings.ALLOWED_EXTENSIONS:
+                    stored = await save_upload(file, file_ext, settings.MAX_FILE_SIZE)
+                    staged.append({"filename": file.filename, "file_ext": file_ext, **stored})
+                else:
+                    staged.append({"filename": file.filename, "error": "Unsupported file format"})
+            except FileTooLargeError:
+                staged.append({"filename": file.filename, "error": "File too large"})
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        discard_staged(staged)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Bulk upload failed: {str(e)}"
+        )
+
+    # The stream deletes staged archives as it ends; the background task covers a client
+    # that disconnects before the first line, when the stream never starts
+    return StreamingResponse(
+        bulk_importer.run(staged),
+        media_type="application/x-ndjson",
+        background=BackgroundTask(discard_staged, staged)
+    )
+
 @router.post("/save", response_model=dict)
 async def save_resume(
     resume_data: dict,
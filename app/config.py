@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Optional, Dict, List
 import os
 
 class Settings(BaseSettings):
@@ -18,7 +18,74 @@ class Settings(BaseSettings):
     # AI Services
     OPENAI_API_KEY: Optional[str] = None
     OPENAI_MODEL: str = "gpt-4.1-preview"
-    MAX_TOKENS: int = 4000
+    OPENAI_BASE_URL: Optional[str] = None  # e.g. http://localhost:8001/v1 for scripts/openai_stub.py
+    MAX_TOKENS: int = 4000  # Hard ceiling on any completion's max_tokens
+    AI_CONTEXT_WINDOW_TOKENS: int = 128000
+    AI_MAX_TOKENS_JD_ANALYSIS: int = 800  # Output budget per stage
+    AI_MAX_TOKENS_BULLET: int = 250
+    AI_MAX_TOKENS_BATCH_OVERHEAD: int = 50  # Added to AI_MAX_TOKENS_BULLET x batch size
+    AI_JD_PROMPT_TOKEN_BUDGET: int = 6000  # Longer job descriptions are truncated
+    AI_PROMPT_MAX_SKILLS: int = 25  # Caps on JD context repeated in bullet prompts
+    AI_PROMPT_MAX_RESPONSIBILITIES: int = 10
+    AI_PROMPT_CONTEXT_TOKEN_BUDGET: int = 600
+    AI_MODEL_PRICES: Dict[str, List[float]] = {  # USD per 1M [input, output] tokens, matched by model prefix
+        "gpt-4.1-nano": [0.10, 0.40],
+        "gpt-4.1-mini": [0.40, 1.60],
+        "gpt-4.1": [2.00, 8.00],
+        "gpt-4o-mini": [0.15, 0.60],
+        "gpt-4o": [2.50, 10.00]
+    }
+    OPENAI_CLIENT_POOL_SIZE: int = 64  # Warm clients kept, one per API key
+    OPENAI_MAX_CONNECTIONS: int = 20  # Per client
+    OPENAI_MAX_KEEPALIVE_CONNECTIONS: int = 10  # Per client
+    OPENAI_KEEPALIVE_EXPIRY: float = 30.0  # Seconds an idle connection is kept open
+    OPENAI_TIMEOUT_SECONDS: float = 30.0  # Per attempt; the SDK default is 10 minutes
+    AI_MAX_CONCURRENCY_PER_REQUEST: int = 8  # Parallel bullet enhancements per request
+    AI_MAX_CONCURRENCY_PER_KEY: int = 16  # Parallel completions per API key across requests
+    AI_PRIORITY_WEIGHT_INTERACTIVE: int = 4  # Share of per-key slots given to interactive requests...
+    AI_PRIORITY_WEIGHT_BULK: int = 1  # ...versus background (bulk) jobs when both are queued
+    AI_KEY_QUEUE_IDLE_SECONDS: int = 600  # Drop an API key's fair queue after this long unused
+    AI_BULLET_BATCH_SIZE: int = 10  # Bullets per completion; 1 disables batching
+    AI_BATCH_PROMPT_TOKEN_BUDGET: int = 2000  # Prompt tokens a single batch may use
+    AI_MAX_BULLETS_TO_ENHANCE: Optional[int] = None  # Most relevant bullets sent to the LLM; defaults to MAX_AI_SUGGESTIONS, 0 sends all
+    ATS_CACHE_MAX_ENTRIES: int = 1024  # ATS compliance results kept, keyed by resume text and job keywords
+
+    # LLM Rate Limiting (per API key)
+    AI_RATE_LIMIT_RPM: int = 500  # Provider quota, requests per minute
+    AI_RATE_LIMIT_TPM: int = 200000  # Provider quota, tokens per minute
+    AI_RATE_LIMIT_HEADROOM: float = 0.9  # Fraction of the quota actually used
+    AI_RATE_LIMIT_BURST_SECONDS: float = 10.0  # Bucket size, in seconds of quota
+    AI_MAX_RETRIES: int = 4
+    AI_RETRY_BASE_DELAY: float = 0.5
+    AI_RETRY_MAX_DELAY: float = 30.0
+
+    # LLM Circuit Breaker
+    AI_BREAKER_ENABLED: bool = True
+    AI_BREAKER_WINDOW_SECONDS: float = 60.0  # Rolling window the rates are computed over
+    AI_BREAKER_MIN_CALLS: int = 10  # Calls in the window before the circuit may open
+    AI_BREAKER_ERROR_RATE: float = 0.5
+    AI_BREAKER_LATENCY_SLO_SECONDS: float = 15.0  # Calls slower than this count as slow
+    AI_BREAKER_SLOW_CALL_RATE: float = 0.5
+    AI_BREAKER_OPEN_SECONDS: float = 30.0  # Time served from the rule-based path before a probe
+
+    # LLM Response Cache
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_MAX_ENTRIES: int = 1024
+    LLM_CACHE_TTL_SECONDS: int = 7 * 24 * 60 * 60  # 7 days
+    LLM_CACHE_DB_PATH: Optional[str] = None  # e.g. ./cache/llm_cache.db to persist across restarts
+    LLM_CACHE_SHARE_ACROSS_KEYS: bool = False  # Serve completions cached under one API key to other keys
+
+    # Job Description Analysis Cache
+    JD_CACHE_ENABLED: bool = True
+    JD_CACHE_MAX_ENTRIES: int = 512
+    JD_CACHE_TTL_SECONDS: int = 30 * 24 * 60 * 60  # 30 days
+    JD_CACHE_DB_PATH: Optional[str] = None
+    JD_CACHE_SHARE_LLM_ANALYSES: bool = False  # Share LLM-derived analyses between users' API keys
+
+    # Background Match Jobs
+    MATCH_JOB_WORKERS: int = 4  # Match jobs processed concurrently
+    MATCH_JOB_MAX_PENDING: int = 1000  # Submissions beyond this are rejected with 503
+    MATCH_JOB_MAX_ATTEMPTS: int = 3  # Jobs interrupted by a restart are retried up to this many times
 
     # OAuth
     GOOGLE_CLIENT_ID: Optional[str] = None
@@ -27,8 +94,30 @@ class Settings(BaseSettings):
     # File Storage
     UPLOAD_DIRECTORY: str = "./uploads"
     MAX_FILE_SIZE: int = 10 * 1024 * 1024  # 10MB
+    UPLOAD_CHUNK_SIZE: int = 64 * 1024  # Bytes held in memory per upload while it is copied to disk
     ALLOWED_EXTENSIONS: list = [".pdf", ".docx", ".doc"]
 
+    # Resume Parsing
+    PARSER_POOL_WORKERS: int = 2  # Warm processes extracting PDF/DOCX text; 0 parses in a thread (no timeout)
+    PARSER_POOL_MAX_PENDING: int = 100  # Files queued or parsing before uploads are rejected with 503
+    PARSER_TIMEOUT_SECONDS: float = 30.0  # Per file; the worker is killed and replaced when exceeded
+    PDF_ENGINES: list = ["pymupdf", "pdfplumber", "pypdf2"]  # Tried in order until one returns text
+    SKILLS_DICTIONARY_PATH: Optional[str] = None  # Extra skills, one per line, added to the built-in list
+
+    # Parse Result Cache (keyed by uploaded file content)
+    PARSE_CACHE_ENABLED: bool = True
+    PARSE_CACHE_MAX_ENTRIES: int = 1024
+    PARSE_CACHE_TTL_SECONDS: int = 30 * 24 * 60 * 60  # 30 days
+    PARSE_CACHE_DB_PATH: Optional[str] = None  # e.g. ./cache/parse_cache.db to persist across restarts
+
+    # Bulk Import
+    BULK_IMPORT_MAX_FILES: int = 500  # Resumes per request, counting ZIP entries
+    BULK_IMPORT_MAX_ARCHIVE_SIZE: int = 200 * 1024 * 1024  # 200MB per ZIP
+    BULK_IMPORT_MAX_REQUEST_SIZE: int = 250 * 1024 * 1024  # 250MB per bulk-upload request, all parts together
+    BULK_IMPORT_MAX_IN_FLIGHT: int = 8  # Files of one import parsing at once; keep below BULK_IMPORT_MAX_PARSING
+    BULK_IMPORT_MAX_PARSING: int = 50  # Files of all imports in the parser pool at once; keep below PARSER_POOL_MAX_PENDING
+    BULK_IMPORT_POOL_WAIT_SECONDS: float = 30.0  # How long an import file retries while the parser pool is full
+
     # Email (Optional)
     SMTP_SERVER: Optional[str] = None
     SMTP_PORT: int = 587
@@ -85,6 +85,22 @@ class MatchAnalysisModel(Base):
     ats_compliance_score = Column(Integer, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
 
+class MatchJobModel(Base):
+    __tablename__ = "match_jobs"
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    user_id = Column(String, ForeignKey("users.id"), nullable=False, index=True)
+    resume_id = Column(String, ForeignKey("resumes.id"), nullable=False)
+    job_description_id = Column(String, ForeignKey("job_descriptions.id"), nullable=False)
+    bypass_cache = Column(Boolean, default=False)
+    status = Column(String, nullable=False, default="queued", index=True)
+    attempts = Column(Integer, default=0)
+    error = Column(Text, nullable=True)
+    result = Column(Text, nullable=True)  # JSON string of the MatchAnalysis
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
 class ExportHistoryModel(Base):
     __tablename__ = "export_history"
 
@@ -5,13 +5,16 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, delete
 from cryptography.fernet import Fernet
 import base64
+from datetime import datetime
 
 from app.database.connection import (
     UserModel, ResumeModel, JobDescriptionModel, 
-    MatchAnalysisModel, ExportHistoryModel, AsyncSessionLocal
+    MatchAnalysisModel, MatchJobModel, ExportHistoryModel, AsyncSessionLocal
 )
 from app.models.user import User, UserCreate
-from app.models.resume import Resume, JobDescription, ResumeContent
+from app.models.resume import (
+    Resume, JobDescription, ResumeContent, MatchAnalysis, AISuggestion, MatchJob, MatchJobStatus
+)
 from app.config import settings
 
 # Create encryption key for API keys
@@ -301,3 +304,172 @@ class JobDescriptionCRUD:
                 .where(JobDescriptionModel.id == job_id, JobDescriptionModel.user_id == user_id)
             )
             await session.commit()
+
+class MatchAnalysisCRUD:
+    async def create_match_analysis(self, match_analysis: MatchAnalysis) -> MatchAnalysis:
+        """Store a match run, including the bullet fingerprints of its suggestions"""
+        async with AsyncSessionLocal() as session:
+            db_match = MatchAnalysisModel(
+                resume_id=match_analysis.resume_id,
+                job_description_id=match_analysis.job_description_id,
+                overall_score=match_analysis.overall_score,
+                keyword_matches=json.dumps(match_analysis.keyword_matches),
+                missing_keywords=json.dumps(match_analysis.missing_keywords),
+                # Rejected bullet suggestions share the column, flagged, so no schema change is needed
+                suggestions=json.dumps(
+                    [s.dict() for s in match_analysis.suggestions]
+                    + [{**s.dict(), "is_rejected": True} for s in match_analysis.rejected_suggestions],
+                    default=str
+                ),
+                ats_compliance_score=match_analysis.ats_compliance_score
+            )
+
+            session.add(db_match)
+            await session.commit()
+            await session.refresh(db_match)
+
+            match_analysis.id = db_match.id
+            return match_analysis
+
+    async def get_latest_match_analysis(self, resume_id: str, job_description_id: str) -> Optional[MatchAnalysis]:
+        """Get the most recent match run for a resume/job description pair"""
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(MatchAnalysisModel)
+                .where(
+                    MatchAnalysisModel.resume_id == resume_id,
+                    MatchAnalysisModel.job_description_id == job_description_id
+                )
+                .order_by(MatchAnalysisModel.created_at.desc())
+                .limit(1)
+            )
+            db_match = result.scalar_one_or_none()
+
+            if not db_match:
+                return None
+
+            stored = json.loads(db_match.suggestions or '[]')
+            return MatchAnalysis(
+                id=db_match.id,
+                resume_id=db_match.resume_id,
+                job_description_id=db_match.job_description_id,
+                overall_score=db_match.overall_score,
+                keyword_matches=json.loads(db_match.keyword_matches or '[]'),
+                missing_keywords=json.loads(db_match.missing_keywords or '[]'),
+                suggestions=[AISuggestion(**s) for s in stored if not s.get("is_rejected")],
+                rejected_suggestions=[AISuggestion(**s) for s in stored if s.get("is_rejected")],
+                ats_compliance_score=db_match.ats_compliance_score or 0,
+                created_at=db_match.created_at
+            )
+
+class MatchJobCRUD:
+    def _to_match_job(self, db_job: MatchJobModel) -> MatchJob:
+        return MatchJob(
+            id=db_job.id,
+            user_id=db_job.user_id,
+            resume_id=db_job.resume_id,
+            job_description_id=db_job.job_description_id,
+            bypass_cache=bool(db_job.bypass_cache),
+            status=MatchJobStatus(db_job.status),
+            attempts=db_job.attempts or 0,
+            error=db_job.error,
+            result=MatchAnalysis(**json.loads(db_job.result)) if db_job.result else None,
+            created_at=db_job.created_at,
+            started_at=db_job.started_at,
+            finished_at=db_job.finished_at
+        )
+
+    async def create_job(self, job: MatchJob) -> MatchJob:
+        """Persist a newly submitted match job"""
+        async with AsyncSessionLocal() as session:
+            db_job = MatchJobModel(
+                user_id=job.user_id,
+                resume_id=job.resume_id,
+                job_description_id=job.job_description_id,
+                bypass_cache=job.bypass_cache,
+                status=MatchJobStatus.QUEUED.value
+            )
+
+            session.add(db_job)
+            await session.commit()
+            await session.refresh(db_job)
+
+            return self._to_match_job(db_job)
+
+    async def get_job(self, job_id: str, user_id: Optional[str] = None) -> Optional[MatchJob]:
+        """Get a match job by ID, optionally scoped to its owner"""
+        async with AsyncSessionLocal() as session:
+            query = select(MatchJobModel).where(MatchJobModel.id == job_id)
+            if user_id is not None:
+                query = query.where(MatchJobModel.user_id == user_id)
+
+            result = await session.execute(query)
+            db_job = result.scalar_one_or_none()
+
+            return self._to_match_job(db_job) if db_job else None
+
+    async def claim_job(self, job_id: str) -> Optional[MatchJob]:
+        """Move a queued job to running; returns None if it is no longer queued"""
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                update(MatchJobModel)
+                .where(MatchJobModel.id == job_id, MatchJobModel.status == MatchJobStatus.QUEUED.value)
+                .values(
+                    status=MatchJobStatus.RUNNING.value,
+                    attempts=MatchJobModel.attempts + 1,
+                    started_at=datetime.utcnow()
+                )
+            )
+            await session.commit()
+
+        if result.rowcount == 0:
+            return None
+        return await self.get_job(job_id)
+
+    async def finish_job(self, job_id: str, result: Optional[MatchAnalysis] = None, error: Optional[str] = None):
+        """Record the outcome of a running job"""
+        async with AsyncSessionLocal() as session:
+            await session.execute(
+                update(MatchJobModel)
+                .where(MatchJobModel.id == job_id)
+                .values(
+                    status=(MatchJobStatus.FAILED if error is not None else MatchJobStatus.SUCCEEDED).value,
+                    result=json.dumps(result.dict(), default=str) if result is not None else None,
+                    error=error,
+                    finished_at=datetime.utcnow()
+                )
+            )
+            await session.commit()
+
+    async def recover_jobs(self, max_attempts: int) -> List[str]:
+        """Requeue jobs a previous process left running and return all queued job IDs, oldest first.
+
+        Jobs that have already been attempted max_attempts times are failed
+        instead, so a job that crashes the worker cannot loop forever.
+        """
+        async with AsyncSessionLocal() as session:
+            await session.execute(
+                update(MatchJobModel)
+                .where(
+                    MatchJobModel.status == MatchJobStatus.RUNNING.value,
+                    MatchJobModel.attempts >= max_attempts
+                )
+                .values(
+                    status=MatchJobStatus.FAILED.value,
+                    error="Interrupted too many times",
+                    finished_at=datetime.utcnow()
+                )
+            )
+            await session.execute(
+                update(MatchJobModel)
+                .where(MatchJobModel.status == MatchJobStatus.RUNNING.value)
+                .values(status=MatchJobStatus.QUEUED.value)
+            )
+            await session.commit()
+
+            result = await session.execute(
+                select(MatchJobModel.id)
+                .where(MatchJobModel.status == MatchJobStatus.QUEUED.value)
+                .order_by(MatchJobModel.created_at)
+            )
+            return list(result.scalars().all())
@@ -9,10 +9,17 @@ import uvicorn
 from app.config import settings
 from app.api import auth, resume, job_match, export
 from app.database.connection import init_db
-from app.services.ai_service import AIService
-
-# Initialize AI service
-ai_service = AIService()
+from app.services.ai_service import ai_service
+from app.services.ats_engine import ats_engine
+from app.services.auth_service import AuthService
+from app.services.job_queue import match_job_queue
+from app.services.openai_clients import openai_client_pool
+from app.services.parse_cache import parse_result_cache
+from app.services.parser_pool import parser_pool
+from app.services.resume_parser import extraction_metrics, parse_flights
+from app.services.telemetry import telemetry
+from app.services.token_budget import token_usage
+from app.utils.upload_limit import MULTIPART_OVERHEAD, UploadSizeLimitMiddleware
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -24,9 +31,15 @@ async def lifespan(app: FastAPI):
     os.makedirs(settings.UPLOAD_DIRECTORY, exist_ok=True)
     os.makedirs("exports", exist_ok=True)
 
+    await match_job_queue.start()
+    parser_pool.start()
+
     yield
     # Shutdown
     print("Shutting down...")
+    await match_job_queue.stop()
+    await parser_pool.stop()
+    await openai_client_pool.close_all()
 
 # Create FastAPI app
 app = FastAPI(
@@ -36,6 +49,16 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# Stop oversized uploads while the body is still arriving, before multipart parsing spools it.
+# Added before CORS so it runs inside it and its 413s carry CORS headers
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    limits={
+        "/api/resume/upload": settings.MAX_FILE_SIZE + MULTIPART_OVERHEAD,
+        "/api/resume/bulk-upload": settings.BULK_IMPORT_MAX_REQUEST_SIZE + MULTIPART_OVERHEAD
+    }
+)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -47,6 +70,11 @@ app.add_middleware(
 
 # Security
 security = HTTPBearer()
+auth_service = AuthService()
+
+async def require_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    """Metrics expose cost, token usage and queue state, so only signed-in users may read them"""
+    return await auth_service.get_current_user(credentials.credentials)
 
 # Include routers
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
@@ -62,9 +90,38 @@ async def root():
         "status": "active"
     }
 
+@app.get("/metrics/llm", dependencies=[Depends(require_user)])
+async def llm_metrics():
+    return {
+        "queues": ai_service.queue_stats(),
+        "rate_limits": ai_service.scheduler.stats(),
+        "circuit": ai_service.breaker.stats()
+    }
+
+@app.get("/metrics/telemetry", dependencies=[Depends(require_user)])
+async def llm_telemetry():
+    return {
+        **telemetry.snapshot(),
+        "token_budget": token_usage.stats(),
+        "ats_cache": ats_engine.stats()
+    }
+
+@app.get("/metrics/parser", dependencies=[Depends(require_user)])
+async def parser_metrics():
+    return {
+        "pool": parser_pool.stats(),
+        "extraction": extraction_metrics.stats(),
+        "cache": parse_result_cache.stats(),
+        "coalescing": parse_flights.stats()
+    }
+
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "ai_service": ai_service.is_available()}
+    return {
+        "status": "healthy",
+        "ai_service": ai_service.is_available(),
+        "llm_circuit": ai_service.breaker.state
+    }
 
 if __name__ == "__main__":
     uvicorn.run(
@@ -21,6 +21,9 @@ class AISuggestion(BaseModel):
     suggestion_type: SuggestionType
     created_at: datetime = Field(default_factory=datetime.now)
     is_accepted: bool = False
+    is_degraded: bool = False  # Produced by the rule-based fallback instead of the LLM
+    is_reused: bool = False  # Carried over from an earlier run of the same resume/job pair
+    fingerprint: Optional[str] = None  # Bullet text + JD context it was generated for
 
 class PersonalInfo(BaseModel):
     name: str
@@ -94,14 +97,40 @@ class JobDescription(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now)
 
 class MatchAnalysis(BaseModel):
+    id: Optional[str] = None
     resume_id: str
     job_description_id: str
     overall_score: int = Field(ge=0, le=100)
     keyword_matches: List[str] = []
     missing_keywords: List[str] = []
     suggestions: List[AISuggestion] = []
+    # Bullet suggestions scored below MIN_RELEVANCE_SCORE; stored so the next run reuses them, never returned
+    rejected_suggestions: List[AISuggestion] = Field(default=[], exclude=True)
     ats_compliance_score: int = Field(ge=0, le=100)
+    is_degraded: bool = False  # Some suggestions were skipped or rule-based while the LLM circuit was open
+    reused_suggestions: int = 0  # Bullet suggestions carried over from the previous run
+    regenerated_suggestions: int = 0  # Bullet suggestions generated by this run
+    created_at: datetime = Field(default_factory=datetime.now)
+
+class MatchJobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+class MatchJob(BaseModel):
+    id: Optional[str] = None
+    user_id: str
+    resume_id: str
+    job_description_id: str
+    bypass_cache: bool = False
+    status: MatchJobStatus = MatchJobStatus.QUEUED
+    attempts: int = 0
+    error: Optional[str] = None
+    result: Optional[MatchAnalysis] = None
     created_at: datetime = Field(default_factory=datetime.now)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
 
 class ExportRequest(BaseModel):
     resume_id: str
@@ -1,122 +1,518 @@
-import openai
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, AsyncIterator, Awaitable
 import json
 import asyncio
+from contextlib import asynccontextmanager
 from datetime import datetime
 import logging
+import time
 
 from app.config import settings
 from app.models.resume import AISuggestion, SuggestionType
+from app.services.ats_engine import ats_engine
+from app.services.bullet_ranker import BulletRanker
+from app.services.circuit_breaker import CircuitOpenError, llm_circuit_breaker
+from app.services.fair_queue import FairQueue, FairQueueMetrics, INTERACTIVE, BULK
+from app.services.jd_cache import jd_analysis_cache, jd_analysis_flights
+from app.services.job_analyzer import JobAnalyzer
+from app.services.llm_cache import LLMResponseCache
+from app.services.llm_scheduler import llm_scheduler
+from app.services.openai_clients import openai_client_pool
+from app.services.single_flight import SingleFlight
+from app.services.telemetry import telemetry
+from app.services.token_budget import (
+    estimate_tokens, estimate_message_tokens, truncate_to_tokens,
+    fit_items_to_budget, token_usage
+)
+from app.utils.constants import MAX_AI_SUGGESTIONS, MIN_RELEVANCE_SCORE
+from app.utils.helpers import hash_string
 
 logger = logging.getLogger(__name__)
 
+
+def is_relevant(suggestion: AISuggestion) -> bool:
+    """Whether to show a suggestion; bullet suggestions scored below MIN_RELEVANCE_SCORE are only kept for reuse"""
+    return not suggestion.fingerprint or suggestion.relevance_score >= MIN_RELEVANCE_SCORE
+
+
 class AIService:
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or settings.OPENAI_API_KEY
         self.model = settings.OPENAI_MODEL
         self.client = None
+        self._key_queues: Dict[str, FairQueue] = {}
+        self.fair_queue_metrics = FairQueueMetrics()
+        self.cache = None
+        self.jd_cache = jd_analysis_cache
+        self.scheduler = llm_scheduler
+        self.single_flight = SingleFlight()
+        self.telemetry = telemetry
+        self.bullet_ranker = BulletRanker()
+        self.jd_flights = jd_analysis_flights
+        self.breaker = llm_circuit_breaker
+        self.job_analyzer = JobAnalyzer()
+
+        if settings.LLM_CACHE_ENABLED:
+            self.cache = LLMResponseCache(
+                max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+                ttl_seconds=settings.LLM_CACHE_TTL_SECONDS,
+                db_path=settings.LLM_CACHE_DB_PATH
+            )
 
         if self.api_key:
-            self.client = openai.AsyncOpenAI(api_key=self.api_key)
+            # Held for the life of the service, so the pool must never close it
+            self.client = openai_client_pool.pin(self.api_key)
 
     def set_api_key(self, api_key: str):
         """Allow dynamic API key setting"""
+        if self.api_key and self.api_key != api_key:
+            openai_client_pool.unpin(self.api_key)
         self.api_key = api_key
-        self.client = openai.AsyncOpenAI(api_key=api_key)
+        self.client = openai_client_pool.pin(api_key)
 
     def is_available(self) -> bool:
         """Check if AI service is properly configured"""
         return self.client is not None and self.api_key is not None
 
+    def is_degraded(self) -> bool:
+        """Whether LLM calls are currently being refused by the circuit breaker"""
+        return not self.breaker.is_closed()
+
+    def _get_key_queue(self, client) -> FairQueue:
+        """Get the fair queue capping concurrent completions for the client's API key"""
+        key_hash = hash_string(getattr(client, "api_key", None) or "")
+        queue = self._key_queues.get(key_hash)
+        if queue is None:
+            self._evict_idle_key_queues()
+            queue = FairQueue(
+                settings.AI_MAX_CONCURRENCY_PER_KEY,
+                class_weights={
+                    INTERACTIVE: settings.AI_PRIORITY_WEIGHT_INTERACTIVE,
+                    BULK: settings.AI_PRIORITY_WEIGHT_BULK
+                },
+                metrics=self.fair_queue_metrics
+            )
+            self._key_queues[key_hash] = queue
+        return queue
+
+    def _evict_idle_key_queues(self):
+        # One queue per API key ever seen would otherwise grow without bound
+        idle = [
+            key_hash for key_hash, queue in self._key_queues.items()
+            if queue.is_idle(settings.AI_KEY_QUEUE_IDLE_SECONDS)
+        ]
+        for key_hash in idle:
+            del self._key_queues[key_hash]
+
+    def queue_stats(self) -> Dict[str, Any]:
+        """Queue depth and wait time per priority class across all API keys"""
+        return {
+            "keys": len(self._key_queues),
+            "active": sum(queue.stats()["active"] for queue in self._key_queues.values()),
+            "classes": self.fair_queue_metrics.stats()
+        }
+
+    @asynccontextmanager
+    async def _lease_client(self, user_api_key: Optional[str] = None):
+        """Hold the pooled client for the user's key, falling back to the pinned server key"""
+        if user_api_key:
+            async with openai_client_pool.lease(user_api_key) as client:
+                yield client
+            return
+        if not self.is_available():
+            raise ValueError("OpenAI API key not configured")
+        yield self.client
+
+    async def _complete_json(
+        self,
+        client,
+        system_prompt: str,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        stage: str,
+        bypass_cache: bool = False,
+        cache_scope: Optional[str] = None
+    ) -> Any:
+        """Run a chat completion and parse its JSON reply, serving repeats from the cache.
+
+        max_tokens is the stage's output budget; it is clamped to
+        settings.MAX_TOKENS and to what is left of the context window.
+        cache_scope overrides who may reuse the cached reply.
+        """
+
+        api_key = getattr(client, "api_key", None)
+
+        cache_key = None
+        if self.cache is not None:
+            # Completions are only reused under the key that paid for them unless sharing is on
+            scope = cache_scope
+            if scope is None:
+                scope = "shared" if settings.LLM_CACHE_SHARE_ACROSS_KEYS else hash_string(api_key or "")
+            cache_key = LLMResponseCache.make_key(self.model, system_prompt, prompt, temperature, scope)
+            if not bypass_cache:
+                cached = await self.cache.get(cache_key)
+                self.telemetry.record_cache_lookup(stage, self.model, hit=cached is not None)
+                if cached is not None:
+                    return json.loads(cached)
+
+        # Identical calls already in flight for this key (e.g. a double-click) share one completion
+        flight_key = hash_string(json.dumps([
+            self.model, system_prompt, prompt, temperature, max_tokens, hash_string(api_key or "")
+        ]))
+        content = await self.single_flight.do(
+            flight_key,
+            lambda: self._request_completion(
+                client, system_prompt, prompt, temperature, max_tokens, stage, cache_key
+            )
+        )
+
+        # Each waiter parses its own copy so callers can't mutate a shared result
+        return json.loads(content)
+
+    async def _request_completion(
+        self,
+        client,
+        system_prompt: str,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        stage: str,
+        cache_key: Optional[str] = None
+    ) -> str:
+        """Call the provider and return the reply content once it has parsed as JSON"""
+
+        estimated_prompt_tokens = estimate_message_tokens(system_prompt, prompt)
+        max_tokens = min(
+            max_tokens,
+            settings.MAX_TOKENS,
+            settings.AI_CONTEXT_WINDOW_TOKENS - estimated_prompt_tokens
+        )
+        if max_tokens <= 0:
+            raise ValueError(f"Prompt for {stage} exceeds the model context window")
+
+        if not self.breaker.allow_request():
+            raise CircuitOpenError(f"LLM circuit is open; {stage} call skipped")
+
+        retries = 0
+        attempt_latency = 0.0
+
+        def count_retry():
+            nonlocal retries
+            retries += 1
+
+        async def attempt():
+            # The breaker judges the provider, so only the request itself is timed,
+            # not rate-limit queueing, key pauses or retry backoff
+            nonlocal attempt_latency
+            attempt_started = time.monotonic()
+            try:
+                return await client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": prompt}
+                    ],
+                    max_tokens=max_tokens,
+                    temperature=temperature
+                )
+            finally:
+                attempt_latency = time.monotonic() - attempt_started
+
+        started = time.monotonic()
+        try:
+            response = await self.scheduler.run(
+                getattr(client, "api_key", None),
+                attempt,
+                estimated_tokens=estimated_prompt_tokens + max_tokens,
+                on_retry=count_retry
+            )
+        except asyncio.CancelledError:
+            self.breaker.release()
+            raise
+        except Exception as e:
+            latency = time.monotonic() - started
+            self.telemetry.record_llm_call(stage, self.model, latency, retries=retries, error=True)
+            # Only provider trouble counts against the circuit. A bad key or request says
+            # nothing about the provider either way, so it must not close a half-open circuit
+            if self.scheduler.is_retryable(e):
+                self.breaker.record_failure(attempt_latency)
+            else:
+                self.breaker.release()
+            raise
+
+        latency = time.monotonic() - started
+        self.breaker.record_success(attempt_latency)
+
+        usage = getattr(response, "usage", None)
+        self.telemetry.record_llm_call(
+            stage,
+            self.model,
+            latency,
+            retries=retries,
+            prompt_tokens=getattr(usage, "prompt_tokens", None),
+            completion_tokens=getattr(usage, "completion_tokens", None)
+        )
+        token_usage.record(
+            stage,
+            estimated_prompt_tokens,
+            max_tokens,
+            prompt_tokens=getattr(usage, "prompt_tokens", None),
+            completion_tokens=getattr(usage, "completion_tokens", None)
+        )
+
+        content = response.choices[0].message.content
+        json.loads(content)
+
+        # Only replies that parsed are cached, so a bad completion is retried next time
+        if cache_key is not None:
+            await self.cache.set(cache_key, content)
+
+        return content
+
     async def enhance_resume_content(
         self, 
         resume_sections: Dict[str, Any], 
         job_description: str,
-        user_api_key: Optional[str] = None
+        user_api_key: Optional[str] = None,
+        bypass_cache: bool = False,
+        previous_suggestions: Optional[List[AISuggestion]] = None,
+        user_id: Optional[str] = None,
+        priority: str = INTERACTIVE
     ) -> List[AISuggestion]:
-        """Generate AI-powered suggestions for resume enhancement"""
+        """Generate AI-powered suggestions for resume enhancement.
+
+        Experience suggestions from previous_suggestions (an earlier run on
+        the same resume and job) are reused for bullets whose fingerprint
+        is unchanged; only new or edited bullets go to the LLM. Completions
+        are queued fairly per user_id within the priority class. Bullet
+        suggestions that fail is_relevant are included for the caller to
+        store and hide.
+        """
 
-        if user_api_key:
-            temp_client = openai.AsyncOpenAI(api_key=user_api_key)
-        elif not self.is_available():
-            raise ValueError("OpenAI API key not configured")
-        else:
-            temp_client = self.client
+        async with self._lease_client(user_api_key) as temp_client:
+            # Half-open, only the one request that can take the probe goes to the LLM
+            if not self.breaker.is_closed() and not self.breaker.probe_available():
+                return await self._fallback_suggestions(resume_sections, job_description)
 
-        try:
-            suggestions = []
-
-            # Analyze job description first
-            jd_analysis = await self._analyze_job_description(job_description, temp_client)
-
-            # Generate suggestions for each resume section
-            for section_name, section_content in resume_sections.items():
-                if section_name in ['experience', 'skills', 'summary']:
-                    section_suggestions = await self._enhance_section(
-                        section_name, 
-                        section_content, 
-                        jd_analysis, 
-                        temp_client
+            try:
+                suggestions = []
+
+                # Analyze job description first
+                with self.telemetry.time_stage("jd_analysis"):
+                    jd_analysis = await self._analyze_job_description(
+                        job_description,
+                        temp_client,
+                        bypass_cache=bypass_cache
                     )
-                    suggestions.extend(section_suggestions)
 
-            return suggestions
+                # Generate suggestions for each resume section
+                for section_name, section_content in resume_sections.items():
+                    if section_name in ['experience', 'skills', 'summary']:
+                        with self.telemetry.time_stage(f"enhance_{section_name}"):
+                            section_suggestions = await self._enhance_section(
+                                section_name, 
+                                section_content, 
+                                jd_analysis, 
+                                temp_client,
+                                bypass_cache=bypass_cache,
+                                previous_suggestions=previous_suggestions,
+                                user_id=user_id,
+                                priority=priority
+                            )
+                        suggestions.extend(section_suggestions)
+
+                return suggestions
+
+            except CircuitOpenError:
+                return await self._fallback_suggestions(resume_sections, job_description)
+
+            except Exception as e:
+                logger.error(f"AI service error: {str(e)}")
+                raise Exception(f"AI processing failed: {str(e)}")
+
+    async def stream_resume_suggestions(
+        self,
+        resume_sections: Dict[str, Any],
+        job_description: str,
+        user_api_key: Optional[str] = None,
+        bypass_cache: bool = False,
+        previous_suggestions: Optional[List[AISuggestion]] = None,
+        user_id: Optional[str] = None,
+        priority: str = INTERACTIVE
+    ) -> AsyncIterator[AISuggestion]:
+        """Yield AI suggestions as soon as each one is ready.
+
+        Skills and summary suggestions need no extra completion and come
+        first; experience suggestions follow in completion order. If the
+        circuit opens once suggestions have been yielded, CircuitOpenError
+        is raised so the caller can mark the run degraded. As with
+        enhance_resume_content, suggestions that fail is_relevant are
+        yielded too.
+        """
 
-        except Exception as e:
-            logger.error(f"AI service error: {str(e)}")
-            raise Exception(f"AI processing failed: {str(e)}")
+        async with self._lease_client(user_api_key) as client:
+            try:
+                if not self.breaker.is_closed() and not self.breaker.probe_available():
+                    raise CircuitOpenError("LLM circuit is open")
+
+                jd_analysis = await self._analyze_job_description(
+                    job_description,
+                    client,
+                    bypass_cache=bypass_cache
+                )
+
+            except CircuitOpenError:
+                for suggestion in await self._fallback_suggestions(resume_sections, job_description):
+                    yield suggestion
+                return
+
+            for section_name in ['skills', 'summary']:
+                if section_name in resume_sections:
+                    for suggestion in await self._enhance_section(
+                        section_name,
+                        resume_sections[section_name],
+                        jd_analysis,
+                        client
+                    ):
+                        yield suggestion
+
+            tasks = [
+                asyncio.ensure_future(job)
+                for job in self._experience_jobs(
+                    resume_sections.get("experience") or [],
+                    jd_analysis,
+                    client,
+                    bypass_cache=bypass_cache,
+                    previous_suggestions=previous_suggestions,
+                    user_id=user_id,
+                    priority=priority
+                )
+            ]
+
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    for suggestion in await next_done:
+                        if suggestion is not None:
+                            yield suggestion
+            finally:
+                # The consumer may stop early, e.g. when the client disconnects
+                for task in tasks:
+                    task.cancel()
+
+    async def _fallback_suggestions(
+        self,
+        resume_sections: Dict[str, Any],
+        job_description: str
+    ) -> List[AISuggestion]:
+        """Rule-based suggestions served while the LLM circuit is open"""
 
-    async def _analyze_job_description(self, job_description: str, client) -> Dict[str, Any]:
-        """Extract key information from job description"""
+        logger.warning("LLM circuit open; serving rule-based suggestions")
 
-        prompt = f"""
-        Analyze the following job description and extract key information:
+        jd_analysis = await self.job_analyzer.analyze_job_description(job_description)
 
-        Job Description:
-        {job_description}
+        suggestions = []
+        for section_name, section_content in resume_sections.items():
+            if section_name in ['skills', 'summary']:
+                suggestions.extend(await self._enhance_section(section_name, section_content, jd_analysis, None))
 
-        Please provide a JSON response with the following structure:
-        {{
-            "required_skills": ["skill1", "skill2", ...],
-            "preferred_qualifications": ["qual1", "qual2", ...],
-            "key_responsibilities": ["resp1", "resp2", ...],
-            "company_culture_keywords": ["keyword1", "keyword2", ...],
-            "experience_level": "junior/mid/senior",
-            "industry": "technology/finance/healthcare/etc"
-        }}
-        """
+        for suggestion in suggestions:
+            suggestion.is_degraded = True
 
-        try:
-            response = await client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert HR analyst specializing in job description analysis."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=settings.MAX_TOKENS,
-                temperature=0.3
-            )
+        return suggestions
+
+    async def _analyze_job_description(
+        self,
+        job_description: str,
+        client,
+        bypass_cache: bool = False
+    ) -> Dict[str, Any]:
+        """Extract key information from job description"""
 
-            content = response.choices[0].message.content
-            return json.loads(content)
+        source = f"llm:{self.model}"
+        tenant = getattr(client, "api_key", None)
 
-        except Exception as e:
-            logger.error(f"Job description analysis failed: {str(e)}")
-            return {}
+        if not bypass_cache:
+            cached = await self.jd_cache.get(job_description, source, tenant)
+            if cached is not None:
+                return cached
+
+        async def analyze() -> Dict[str, Any]:
+            # Long postings are trimmed so the prompt and its reply fit the context window
+            job_description_budget = min(
+                settings.AI_JD_PROMPT_TOKEN_BUDGET,
+                settings.AI_CONTEXT_WINDOW_TOKENS - settings.AI_MAX_TOKENS_JD_ANALYSIS - 200
+            )
+            prompt_job_description = truncate_to_tokens(job_description, job_description_budget)
+
+            prompt = f"""
+            Analyze the following job description and extract key information:
+
+            Job Description:
+            {prompt_job_description}
+
+            Please provide a JSON response with the following structure:
+            {{
+                "required_skills": ["skill1", "skill2", ...],
+                "preferred_qualifications": ["qual1", "qual2", ...],
+                "key_responsibilities": ["resp1", "resp2", ...],
+                "company_culture_keywords": ["keyword1", "keyword2", ...],
+                "experience_level": "junior/mid/senior",
+                "industry": "technology/finance/healthcare/etc"
+            }}
+            """
+
+            try:
+                analysis = await self._complete_json(
+                    client,
+                    "You are an expert HR analyst specializing in job description analysis.",
+                    prompt,
+                    temperature=0.3,
+                    max_tokens=settings.AI_MAX_TOKENS_JD_ANALYSIS,
+                    stage="jd_analysis",
+                    bypass_cache=bypass_cache,
+                    # JD_CACHE_SHARE_LLM_ANALYSES must also govern the completion cached underneath
+                    cache_scope=self.jd_cache.scope(source, tenant)
+                )
+
+            except CircuitOpenError:
+                raise
+
+            except Exception as e:
+                logger.error(f"Job description analysis failed: {str(e)}")
+                return {}
+
+            await self.jd_cache.set(job_description, source, analysis, tenant)
+            return analysis
+
+        # Concurrent analyses of the same posting (by anyone sharing its cache scope) run once
+        flight_key = self.jd_cache.make_key(job_description, source, tenant)
+        return await self.jd_flights.do(flight_key, analyze)
 
     async def _enhance_section(
         self, 
         section_name: str, 
         section_content: Any, 
         jd_analysis: Dict[str, Any], 
-        client
+        client,
+        bypass_cache: bool = False,
+        previous_suggestions: Optional[List[AISuggestion]] = None,
+        user_id: Optional[str] = None,
+        priority: str = INTERACTIVE
     ) -> List[AISuggestion]:
         """Generate suggestions for a specific resume section"""
 
         suggestions = []
 
         if section_name == "experience":
-            suggestions = await self._enhance_experience_section(section_content, jd_analysis, client)
+            suggestions = await self._enhance_experience_section(
+                section_content,
+                jd_analysis,
+                client,
+                bypass_cache=bypass_cache,
+                previous_suggestions=previous_suggestions,
+                user_id=user_id,
+                priority=priority
+            )
         elif section_name == "skills":
             suggestions = await self._enhance_skills_section(section_content, jd_analysis, client)
         elif section_name == "summary":
@@ -128,71 +524,367 @@ class AIService:
         self, 
         experience_data: List[Dict], 
         jd_analysis: Dict[str, Any], 
-        client
+        client,
+        bypass_cache: bool = False,
+        previous_suggestions: Optional[List[AISuggestion]] = None,
+        user_id: Optional[str] = None,
+        priority: str = INTERACTIVE
     ) -> List[AISuggestion]:
-        """Enhance experience bullet points"""
+        """Enhance experience bullet points concurrently, preserving bullet order"""
+
+        jobs = self._experience_jobs(
+            experience_data,
+            jd_analysis,
+            client,
+            bypass_cache=bypass_cache,
+            previous_suggestions=previous_suggestions,
+            user_id=user_id,
+            priority=priority
+        )
 
-        suggestions = []
-        required_skills = jd_analysis.get("required_skills", [])
-        key_responsibilities = jd_analysis.get("key_responsibilities", [])
+        job_results = await asyncio.gather(*jobs)
+
+        # Reused and regenerated bullets come from different jobs, so restore bullet order
+        return sorted(
+            (
+                suggestion
+                for results in job_results
+                for suggestion in results
+                if suggestion is not None
+            ),
+            key=lambda suggestion: (suggestion.subsection_index, suggestion.item_index)
+        )
 
-        for exp_idx, experience in enumerate(experience_data):
-            bullets = experience.get("bullets", [])
+    def _experience_jobs(
+        self,
+        experience_data: List[Dict],
+        jd_analysis: Dict[str, Any],
+        client,
+        bypass_cache: bool = False,
+        previous_suggestions: Optional[List[AISuggestion]] = None,
+        user_id: Optional[str] = None,
+        priority: str = INTERACTIVE
+    ) -> List[Awaitable[List[Optional[AISuggestion]]]]:
+        """Build one awaitable per completion (a batch or a single bullet).
+
+        Only the bullets ranked most relevant to the job locally are
+        enhanced. Of those, bullets whose fingerprint matches a previous
+        suggestion get an awaitable that returns that suggestion instead of
+        calling the LLM; these come first, followed by the LLM work in
+        bullet order. Suggestions the model scores below
+        MIN_RELEVANCE_SCORE are returned too, so their fingerprints can be
+        stored and the bullet is not sent again; see is_relevant.
+        """
 
-            for bullet_idx, bullet in enumerate(bullets):
-                prompt = f"""
-                Enhance the following resume bullet point to better match the job requirements:
+        required_skills, key_responsibilities = self._fit_jd_context(jd_analysis)
 
-                Original bullet point: "{bullet}"
+        # bypass_cache asks for fresh suggestions, so nothing is reused
+        reusable = {} if bypass_cache else {
+            suggestion.fingerprint: suggestion
+            for suggestion in previous_suggestions or []
+            if suggestion.fingerprint
+        }
 
-                Job requirements: {', '.join(required_skills)}
-                Key responsibilities: {', '.join(key_responsibilities)}
+        request_semaphore = asyncio.Semaphore(settings.AI_MAX_CONCURRENCY_PER_REQUEST)
+        key_queue = self._get_key_queue(client)
+        user = user_id or "anonymous"
+
+        def fingerprint(bullet: str) -> str:
+            return self._bullet_fingerprint(bullet, required_skills, key_responsibilities)
+
+        async def enhance_bounded(exp_idx: int, bullet_idx: int, bullet: str) -> Optional[AISuggestion]:
+            async with request_semaphore, key_queue.slot(user, priority):
+                suggestion = await self._enhance_bullet(
+                    exp_idx,
+                    bullet_idx,
+                    bullet,
+                    required_skills,
+                    key_responsibilities,
+                    client,
+                    bypass_cache=bypass_cache
+                )
+
+            if suggestion is not None:
+                suggestion.fingerprint = fingerprint(bullet)
+            return suggestion
+
+        async def enhance_single(item: tuple) -> List[Optional[AISuggestion]]:
+            return [await enhance_bounded(*item)]
+
+        async def enhance_batch_bounded(batch: List[tuple]) -> List[Optional[AISuggestion]]:
+            async with request_semaphore, key_queue.slot(user, priority, cost=len(batch)):
+                results = await self._enhance_bullet_batch(
+                    batch,
+                    required_skills,
+                    key_responsibilities,
+                    client,
+                    bypass_cache=bypass_cache
+                )
+
+            for (_, _, bullet), result in zip(batch, results):
+                if result is not None:
+                    result.fingerprint = fingerprint(bullet)
+
+            # Bullets the batch reply didn't cover fall back to the per-bullet path
+            fallbacks = [
+                enhance_bounded(*item)
+                for item, result in zip(batch, results)
+                if result is None
+            ]
+            if fallbacks:
+                fallback_results = iter(await asyncio.gather(*fallbacks))
+                results = [
+                    result if result is not None else next(fallback_results)
+                    for result in results
+                ]
+
+            return results
+
+        async def reuse(exp_idx: int, bullet_idx: int, previous: AISuggestion) -> List[Optional[AISuggestion]]:
+            # The bullet may have moved since the earlier run
+            return [AISuggestion(**{
+                **previous.dict(),
+                "subsection_index": exp_idx,
+                "item_index": bullet_idx,
+                "is_reused": True
+            })]
+
+        candidates = [
+            (exp_idx, bullet_idx, bullet)
+            for exp_idx, experience in enumerate(experience_data)
+            for bullet_idx, bullet in enumerate(experience.get("bullets", []))
+        ]
+
+        # LLM spend scales with the cap rather than with resume length
+        limit = settings.AI_MAX_BULLETS_TO_ENHANCE
+        selected = self.bullet_ranker.select(
+            [bullet for _, _, bullet in candidates],
+            jd_analysis.get("required_skills", []),
+            jd_analysis.get("key_responsibilities", []),
+            MAX_AI_SUGGESTIONS if limit is None else limit
+        )
+        if len(selected) < len(candidates):
+            logger.info(f"Enhancing the {len(selected)} most relevant of {len(candidates)} bullets")
+
+        items = []
+        reused_jobs = []
+        for exp_idx, bullet_idx, bullet in (candidates[i] for i in selected):
+            previous = reusable.get(fingerprint(bullet))
+            if previous is not None:
+                reused_jobs.append(reuse(exp_idx, bullet_idx, previous))
+            else:
+                items.append((exp_idx, bullet_idx, bullet))
+
+        if settings.AI_BULLET_BATCH_SIZE > 1:
+            batches = self._build_bullet_batches(items, required_skills, key_responsibilities)
+            return reused_jobs + [enhance_batch_bounded(batch) for batch in batches]
+
+        return reused_jobs + [enhance_single(item) for item in items]
+
+    def _bullet_fingerprint(self, bullet: str, required_skills: List[str], key_responsibilities: List[str]) -> str:
+        """Identify a bullet together with the model and JD context it is enhanced against"""
+        return hash_string(json.dumps([self.model, bullet.strip(), required_skills, key_responsibilities]))
+
+    def _fit_jd_context(self, jd_analysis: Dict[str, Any]) -> tuple:
+        """Cap the skills and responsibilities repeated in every bullet prompt"""
+
+        required_skills = fit_items_to_budget(
+            jd_analysis.get("required_skills", []),
+            settings.AI_PROMPT_MAX_SKILLS,
+            settings.AI_PROMPT_CONTEXT_TOKEN_BUDGET // 2
+        )
+        key_responsibilities = fit_items_to_budget(
+            jd_analysis.get("key_responsibilities", []),
+            settings.AI_PROMPT_MAX_RESPONSIBILITIES,
+            settings.AI_PROMPT_CONTEXT_TOKEN_BUDGET - estimate_tokens(", ".join(required_skills))
+        )
 
-                Please provide:
-                1. An enhanced version that includes specific metrics, achievements, and relevant keywords
-                2. A brief explanation of what was improved
-                3. A relevance score (0-100) indicating how well it matches the job
+        return required_skills, key_responsibilities
+
+    def _build_bullet_batches(
+        self,
+        items: List[tuple],
+        required_skills: List[str],
+        key_responsibilities: List[str]
+    ) -> List[List[tuple]]:
+        """Pack (exp_idx, bullet_idx, bullet) items into batches bounded by size and prompt budget"""
+
+        context_tokens = estimate_tokens(", ".join(required_skills + key_responsibilities))
+        budget = max(settings.AI_BATCH_PROMPT_TOKEN_BUDGET - context_tokens, 0)
+
+        batches = []
+        current = []
+        current_tokens = 0
+
+        for item in items:
+            bullet_tokens = estimate_tokens(item[2]) + 8
+            if current and (
+                len(current) >= settings.AI_BULLET_BATCH_SIZE
+                or current_tokens + bullet_tokens > budget
+            ):
+                batches.append(current)
+                current = []
+                current_tokens = 0
+
+            current.append(item)
+            current_tokens += bullet_tokens
+
+        if current:
+            batches.append(current)
+
+        return batches
+
+    async def _enhance_bullet_batch(
+        self,
+        batch: List[tuple],
+        required_skills: List[str],
+        key_responsibilities: List[str],
+        client,
+        bypass_cache: bool = False
+    ) -> List[Optional[AISuggestion]]:
+        """Enhance several bullet points with one completion.
+
+        Returns one entry per batch item; entries the reply did not cover
+        (or the whole batch, if the reply is malformed) are None.
+        """
 
-                Respond in JSON format:
+        bullet_lines = "\n".join(
+            f'{batch_idx}. "{bullet}"' for batch_idx, (_, _, bullet) in enumerate(batch)
+        )
+
+        prompt = f"""
+        Enhance each of the following resume bullet points to better match the job requirements:
+
+        Bullet points:
+        {bullet_lines}
+
+        Job requirements: {', '.join(required_skills)}
+        Key responsibilities: {', '.join(key_responsibilities)}
+
+        For every bullet point provide:
+        1. An enhanced version that includes specific metrics, achievements, and relevant keywords
+        2. A brief explanation of what was improved
+        3. A relevance score (0-100) indicating how well it matches the job
+
+        Respond in JSON format, with one entry per bullet point using its number as "id":
+        {{
+            "bullets": [
                 {{
+                    "id": 0,
                     "enhanced_bullet": "improved version here",
                     "improvement_explanation": "explanation here",
                     "relevance_score": 85
                 }}
-                """
-
-                try:
-                    response = await client.chat.completions.create(
-                        model=self.model,
-                        messages=[
-                            {"role": "system", "content": "You are a professional resume writer with expertise in ATS optimization."},
-                            {"role": "user", "content": prompt}
-                        ],
-                        max_tokens=settings.MAX_TOKENS,
-                        temperature=0.4
-                    )
+            ]
+        }}
+        """
 
-                    content = response.choices[0].message.content
-                    result = json.loads(content)
-
-                    suggestion = AISuggestion(
-                        section="experience",
-                        subsection_index=exp_idx,
-                        item_index=bullet_idx,
-                        original_content=bullet,
-                        suggested_content=result["enhanced_bullet"],
-                        explanation=result["improvement_explanation"],
-                        relevance_score=result["relevance_score"],
-                        suggestion_type=SuggestionType.ENHANCEMENT
-                    )
+        results: List[Optional[AISuggestion]] = [None] * len(batch)
+
+        try:
+            result = await self._complete_json(
+                client,
+                "You are a professional resume writer with expertise in ATS optimization.",
+                prompt,
+                temperature=0.4,
+                max_tokens=settings.AI_MAX_TOKENS_BULLET * len(batch) + settings.AI_MAX_TOKENS_BATCH_OVERHEAD,
+                stage="bullet_batch",
+                bypass_cache=bypass_cache
+            )
+            entries = result["bullets"]
 
-                    suggestions.append(suggestion)
+        except CircuitOpenError:
+            # Not a bad reply: the caller must serve the run as degraded
+            raise
+
+        except Exception as e:
+            logger.error(f"Failed to enhance bullet batch: {str(e)}")
+            return results
 
-                except Exception as e:
-                    logger.error(f"Failed to enhance bullet point: {str(e)}")
+        for entry in entries:
+            try:
+                batch_idx = int(entry["id"])
+                if not 0 <= batch_idx < len(batch) or results[batch_idx] is not None:
                     continue
 
-        return suggestions
+                exp_idx, bullet_idx, bullet = batch[batch_idx]
+                results[batch_idx] = AISuggestion(
+                    section="experience",
+                    subsection_index=exp_idx,
+                    item_index=bullet_idx,
+                    original_content=bullet,
+                    suggested_content=entry["enhanced_bullet"],
+                    explanation=entry["improvement_explanation"],
+                    relevance_score=entry["relevance_score"],
+                    suggestion_type=SuggestionType.ENHANCEMENT
+                )
+
+            except Exception as e:
+                logger.warning(f"Skipping malformed batch entry: {str(e)}")
+
+        return results
+
+    async def _enhance_bullet(
+        self,
+        exp_idx: int,
+        bullet_idx: int,
+        bullet: str,
+        required_skills: List[str],
+        key_responsibilities: List[str],
+        client,
+        bypass_cache: bool = False
+    ) -> Optional[AISuggestion]:
+        """Enhance a single experience bullet point"""
+
+        prompt = f"""
+        Enhance the following resume bullet point to better match the job requirements:
+
+        Original bullet point: "{bullet}"
+
+        Job requirements: {', '.join(required_skills)}
+        Key responsibilities: {', '.join(key_responsibilities)}
+
+        Please provide:
+        1. An enhanced version that includes specific metrics, achievements, and relevant keywords
+        2. A brief explanation of what was improved
+        3. A relevance score (0-100) indicating how well it matches the job
+
+        Respond in JSON format:
+        {{
+            "enhanced_bullet": "improved version here",
+            "improvement_explanation": "explanation here",
+            "relevance_score": 85
+        }}
+        """
+
+        try:
+            result = await self._complete_json(
+                client,
+                "You are a professional resume writer with expertise in ATS optimization.",
+                prompt,
+                temperature=0.4,
+                max_tokens=settings.AI_MAX_TOKENS_BULLET,
+                stage="bullet",
+                bypass_cache=bypass_cache
+            )
+
+            return AISuggestion(
+                section="experience",
+                subsection_index=exp_idx,
+                item_index=bullet_idx,
+                original_content=bullet,
+                suggested_content=result["enhanced_bullet"],
+                explanation=result["improvement_explanation"],
+                relevance_score=result["relevance_score"],
+                suggestion_type=SuggestionType.ENHANCEMENT
+            )
+
+        except CircuitOpenError:
+            raise
+
+        except Exception as e:
+            logger.error(f"Failed to enhance bullet point: {str(e)}")
+            return None
 
     async def _enhance_skills_section(
         self, 
@@ -245,22 +937,14 @@ class AIService:
 
         return [suggestion]
 
-    async def check_ats_compliance(self, resume_content: str, user_api_key: Optional[str] = None) -> Dict[str, Any]:
-        """Check resume for ATS compliance"""
-
-        # Simplified ATS compliance check
-        return {
-            "overall_score": 85,
-            "compliance_factors": {
-                "section_headings": {"score": 90, "feedback": "Good standard headings"},
-                "formatting": {"score": 80, "feedback": "Minor formatting issues"},
-                "keywords": {"score": 75, "feedback": "Could use more industry keywords"},
-                "structure": {"score": 95, "feedback": "Well organized structure"},
-                "readability": {"score": 88, "feedback": "Clear and concise"}
-            },
-            "recommendations": ["Add more industry keywords", "Improve formatting consistency"],
-            "critical_issues": []
-        }
+    async def check_ats_compliance(
+        self,
+        resume_content: str,
+        user_api_key: Optional[str] = None,
+        keywords: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Check resume for ATS compliance with the local rules engine; no LLM call is made"""
+        return ats_engine.analyze(resume_content, keywords)
 
 # Create global AI service instance
 ai_service = AIService()
@@ -0,0 +1,295 @@
+import copy
+import re
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence
+
+from app.config import settings
+from app.utils.constants import ATS_COMPLIANCE_FACTORS, COMMON_TECHNICAL_SKILLS
+from app.utils.helpers import hash_string
+
+# Bump when rules change so cached results are recomputed
+RULES_VERSION = "1"
+
+HEADING_PATTERN = re.compile(
+    r"^\s*(?P<heading>summary|professional summary|profile|objective|"
+    r"(?:work |professional )?experience|employment history|education|"
+    r"(?:technical )?skills|projects|certifications|languages)\s*(?::|$)",
+    re.IGNORECASE
+)
+BULLET_PATTERN = re.compile(r"^\s*[-•*▪◦●‣]\s+")
+EMAIL_PATTERN = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+PHONE_PATTERN = re.compile(r"(?:\+?\d{1,3}[\s.-]?)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}")
+LINKEDIN_PATTERN = re.compile(r"linkedin\.com/in/", re.IGNORECASE)
+METRIC_PATTERN = re.compile(r"\d+(?:[.,]\d+)?\s*(?:%|x\b|k\b|m\b|\+)|[$€£]\s?\d|\b\d{2,}\b", re.IGNORECASE)
+WORD_PATTERN = re.compile(r"[A-Za-z][A-Za-z'+#.-]*")
+ARTIFACT_PATTERN = re.compile(r"\(cid:\d+\)|�|[\x00-\x08\x0b\x0c\x0e-\x1f]")
+DECORATION_PATTERN = re.compile(r"[\t|]|[─-➿\U0001f300-\U0001faff]| {3,}")
+
+DATE_FORMATS = {
+    "month_year": re.compile(r"\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.? \d{4}\b", re.IGNORECASE),
+    "mm/yyyy": re.compile(r"\b(?:0?[1-9]|1[0-2])/\d{4}\b"),
+    "yyyy-mm": re.compile(r"\b\d{4}-(?:0[1-9]|1[0-2])\b"),
+    "mm/yy": re.compile(r"\b(?:0?[1-9]|1[0-2])/\d{2}\b(?!/)"),
+}
+YEAR_PATTERN = re.compile(r"\b(?:19|20)\d{2}\b")
+
+ACTION_VERBS = frozenset("""
+achieved analyzed architected automated built collaborated created cut decreased delivered designed developed
+drove engineered established grew implemented improved increased launched led managed mentored migrated
+optimized owned reduced refactored resolved scaled shipped spearheaded streamlined
+""".split())
+
+REQUIRED_HEADINGS = ("experience", "education", "skills")
+
+
+def _canonical_heading(heading: str) -> str:
+    heading = heading.lower()
+    for canonical in ("experience", "education", "skills", "summary", "projects", "certifications", "languages"):
+        if canonical in heading:
+            return canonical
+    if heading in ("profile", "objective", "professional summary"):
+        return "summary"
+    return heading
+
+
+class ATSComplianceEngine:
+    """Scores resume text on the ATS_COMPLIANCE_FACTORS with local rules.
+
+    All patterns are compiled at import and the text is scanned once, line
+    by line, so a typical resume is scored in well under a few
+    milliseconds. Results are cached by a hash of the text and the job
+    keywords it was scored against; callers get a copy, so changing one
+    cannot change the cached entry.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def analyze(self, text: str, keywords: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """Return the overall score, per-factor scores and feedback, recommendations and critical issues"""
+        keywords = [keyword for keyword in keywords or [] if keyword and keyword.strip()]
+        cache_key = hash_string("\0".join([RULES_VERSION, text or ""] + sorted(k.lower() for k in keywords)))
+
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self._cache.move_to_end(cache_key)
+            self.hits += 1
+            return copy.deepcopy(cached)
+
+        self.misses += 1
+        result = self._score(text or "", keywords)
+
+        self._cache[cache_key] = result
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+        return copy.deepcopy(result)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else None
+        }
+
+    def _score(self, text: str, keywords: List[str]) -> Dict[str, Any]:
+        headings: List[str] = []
+        bullets: List[str] = []
+        date_formats = set()
+        lines = 0
+        words = 0
+        decorated_lines = 0
+        artifact_lines = 0
+        has_email = has_phone = has_linkedin = has_year = False
+        contact_line = None
+
+        # Single pass over the text collecting every signal the rules need
+        for line_number, line in enumerate(text.splitlines()):
+            if not line.strip():
+                continue
+            lines += 1
+            words += len(WORD_PATTERN.findall(line))
+
+            heading = HEADING_PATTERN.match(line)
+            if heading:
+                headings.append(_canonical_heading(heading.group("heading")))
+
+            if BULLET_PATTERN.match(line):
+                bullets.append(BULLET_PATTERN.sub("", line, count=1))
+
+            if not has_email and EMAIL_PATTERN.search(line):
+                has_email = True
+                contact_line = line_number if contact_line is None else contact_line
+            if not has_phone and PHONE_PATTERN.search(line):
+                has_phone = True
+                contact_line = line_number if contact_line is None else contact_line
+            if not has_linkedin and LINKEDIN_PATTERN.search(line):
+                has_linkedin = True
+
+            for name, pattern in DATE_FORMATS.items():
+                if pattern.search(line):
+                    date_formats.add(name)
+            if not has_year and YEAR_PATTERN.search(line):
+                has_year = True
+
+            if DECORATION_PATTERN.search(line):
+                decorated_lines += 1
+            if ARTIFACT_PATTERN.search(line):
+                artifact_lines += 1
+
+        # Bare years (e.g. graduation) only count as a format when nothing more specific is used
+        if has_year and not date_formats:
+            date_formats.add("year")
+
+        lowered = text.lower()
+        factors = {
+            "section_headings": self._section_headings(headings),
+            "formatting": self._formatting(decorated_lines, lines),
+            "keywords": self._keywords(lowered, keywords),
+            "structure": self._structure(headings, contact_line, bullets),
+            "readability": self._readability(bullets),
+            "file_format": self._file_format(artifact_lines, lines),
+            "length": self._length(words),
+            "contact_info": self._contact_info(has_email, has_phone, has_linkedin),
+            "date_format": self._date_format(date_formats),
+            "bullet_points": self._bullet_points(bullets)
+        }
+        compliance_factors = {factor: factors[factor] for factor in ATS_COMPLIANCE_FACTORS}
+
+        return {
+            "overall_score": round(sum(f["score"] for f in compliance_factors.values()) / len(compliance_factors)),
+            "compliance_factors": compliance_factors,
+            "recommendations": [f["feedback"] for f in compliance_factors.values() if f["score"] < 70],
+            "critical_issues": [f["feedback"] for f in compliance_factors.values() if f["score"] < 40]
+        }
+
+    @staticmethod
+    def _factor(score: float, feedback: str) -> Dict[str, Any]:
+        return {"score": max(0, min(100, round(score))), "feedback": feedback}
+
+    def _section_headings(self, headings: List[str]) -> Dict[str, Any]:
+        missing = [heading for heading in REQUIRED_HEADINGS if heading not in headings]
+        if not missing:
+            return self._factor(100 if "summary" in headings else 90, "Standard section headings found")
+        return self._factor(
+            100 * (len(REQUIRED_HEADINGS) - len(missing)) / len(REQUIRED_HEADINGS),
+            f"Add standard section headings: {', '.join(h.title() for h in missing)}"
+        )
+
+    def _formatting(self, decorated_lines: int, lines: int) -> Dict[str, Any]:
+        if not decorated_lines:
+            return self._factor(100, "No tables, columns or decorative symbols detected")
+        return self._factor(
+            100 - 200 * decorated_lines / max(lines, 1),
+            "Remove tables, column layouts, tabs and decorative symbols that ATS parsers misread"
+        )
+
+    def _keywords(self, lowered: str, keywords: List[str]) -> Dict[str, Any]:
+        if keywords:
+            missing = [k for k in keywords if not self._contains_term(lowered, k)]
+            if not missing:
+                return self._factor(100, "Resume covers all job keywords")
+            return self._factor(
+                100 * (len(keywords) - len(missing)) / len(keywords),
+                f"Add missing job keywords where accurate: {', '.join(missing[:5])}"
+            )
+
+        found = sum(1 for skill in COMMON_TECHNICAL_SKILLS if self._contains_term(lowered, skill))
+        if found >= 8:
+            return self._factor(100, "Good range of industry keywords")
+        return self._factor(40 + found * 7.5, "Could use more industry keywords")
+
+    def _structure(self, headings: List[str], contact_line: Optional[int], bullets: List[str]) -> Dict[str, Any]:
+        score = 100
+        issues = []
+        if contact_line is None or contact_line > 5:
+            score -= 30
+            issues.append("put contact details at the top")
+        if "experience" not in headings:
+            score -= 40
+            issues.append("add an experience section")
+        elif not bullets:
+            score -= 20
+            issues.append("list experience as bullet points")
+        if len(headings) != len(set(headings)):
+            score -= 10
+            issues.append("merge repeated sections")
+
+        if not issues:
+            return self._factor(score, "Well organized structure")
+        return self._factor(score, f"Improve structure: {'; '.join(issues)}")
+
+    def _readability(self, bullets: List[str]) -> Dict[str, Any]:
+        if not bullets:
+            return self._factor(60, "Use short bullet points so achievements are easy to scan")
+
+        lengths = [len(WORD_PATTERN.findall(bullet)) for bullet in bullets]
+        too_long = sum(1 for length in lengths if length > 35)
+        too_short = sum(1 for length in lengths if length < 5)
+        score = 100 - 100 * (too_long + 0.5 * too_short) / len(lengths)
+        if score >= 90:
+            return self._factor(score, "Clear and concise")
+        return self._factor(score, "Keep bullet points between 5 and 35 words")
+
+    def _file_format(self, artifact_lines: int, lines: int) -> Dict[str, Any]:
+        if not lines:
+            return self._factor(0, "No text could be read from the resume")
+        if not artifact_lines:
+            return self._factor(100, "Text extracts cleanly")
+        return self._factor(
+            100 - 300 * artifact_lines / lines,
+            "Text extraction produced garbled characters; export a text-based PDF or DOCX"
+        )
+
+    def _length(self, words: int) -> Dict[str, Any]:
+        if 300 <= words <= 900:
+            return self._factor(100, "Appropriate length")
+        if words < 300:
+            return self._factor(100 * words / 300, "Resume is short; add detail on impact and skills")
+        return self._factor(100 - (words - 900) / 10, "Resume is long; trim to the most relevant two pages")
+
+    def _contact_info(self, has_email: bool, has_phone: bool, has_linkedin: bool) -> Dict[str, Any]:
+        score = 50 * has_email + 40 * has_phone + 10 * has_linkedin
+        missing = [name for name, present in (("email", has_email), ("phone", has_phone), ("LinkedIn", has_linkedin)) if not present]
+        if not missing:
+            return self._factor(score, "Complete contact information")
+        return self._factor(score, f"Add contact information: {', '.join(missing)}")
+
+    def _date_format(self, date_formats: set) -> Dict[str, Any]:
+        if not date_formats:
+            return self._factor(50, "Add dates to experience and education entries")
+        if len(date_formats) == 1:
+            return self._factor(100, "Dates use a consistent format")
+        return self._factor(100 - 20 * (len(date_formats) - 1), "Use one date format throughout, e.g. 'Jan 2020'")
+
+    def _bullet_points(self, bullets: List[str]) -> Dict[str, Any]:
+        if not bullets:
+            return self._factor(30, "Describe experience with bullet points")
+
+        action = sum(1 for bullet in bullets if bullet.split(" ", 1)[0].lower().strip(".,") in ACTION_VERBS)
+        metrics = sum(1 for bullet in bullets if METRIC_PATTERN.search(bullet))
+        score = 40 + 30 * action / len(bullets) + 30 * metrics / len(bullets)
+        if score >= 85:
+            return self._factor(score, "Bullets lead with action verbs and quantify results")
+        return self._factor(score, "Start bullets with action verbs and add measurable results")
+
+    @staticmethod
+    def _contains_term(lowered: str, term: str) -> bool:
+        term = term.lower()
+        start = lowered.find(term)
+        while start != -1:
+            end = start + len(term)
+            before = lowered[start - 1] if start else " "
+            after = lowered[end] if end < len(lowered) else " "
+            if not (before.isalnum() or before in "+#") and not (after.isalnum() or after in "+#"):
+                return True
+            start = lowered.find(term, start + 1)
+        return False
+
+
+ats_engine = ATSComplianceEngine(max_entries=settings.ATS_CACHE_MAX_ENTRIES)
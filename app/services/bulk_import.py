@@ -0,0 +1,205 @@
+import asyncio
+import json
+import logging
+import os
+import zipfile
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+
+from app.config import settings
+from app.services.file_store import FileTooLargeError, save_file_object
+from app.services.parser_pool import ParserPoolFullError
+from app.services.resume_parser import ResumeParser
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_EXTENSION = ".zip"
+
+
+def _ndjson(record: Dict[str, Any]) -> str:
+    return json.dumps(record, default=str) + "\n"
+
+
+def _failed(filename: str, error: str) -> Dict[str, Any]:
+    return {"type": "result", "filename": filename, "status": "failed", "error": error}
+
+
+def discard_staged(items: List[Dict[str, Any]]):
+    """Delete the scratch copies of staged archives; safe to call more than once"""
+    for item in items:
+        if "archive" in item and os.path.exists(item["archive"]):
+            os.remove(item["archive"])
+
+
+class BulkImporter:
+    """Parses a batch of resumes and yields one NDJSON line per file as each finishes.
+
+    The batch arrives as staged items: stored files (see file_store),
+    ZIP archives saved to a scratch path, or files rejected at upload
+    with an error. Archive entries are extracted one at a time and at
+    most max_in_flight files are parsing at once, so memory use does
+    not grow with the size of the batch. Results are streamed in
+    completion order, not upload order.
+
+    All imports together keep at most max_parsing files in the parser
+    pool, leaving the rest of its queue to interactive uploads. If the
+    pool is full anyway, a file waits and retries for up to
+    pool_wait_seconds before it is reported as failed.
+    """
+
+    def __init__(
+        self,
+        parser: ResumeParser,
+        max_in_flight: int = 8,
+        max_files: int = 500,
+        max_parsing: int = 50,
+        pool_wait_seconds: float = 30.0
+    ):
+        self.parser = parser
+        self.max_in_flight = max_in_flight
+        self.max_files = max_files
+        self.max_parsing = max_parsing
+        self.pool_wait_seconds = pool_wait_seconds
+        # Created on first use, inside the event loop that serves requests
+        self._parsing: Optional[asyncio.Semaphore] = None
+
+    async def run(self, items: List[Dict[str, Any]]) -> AsyncIterator[str]:
+        in_flight: Set[asyncio.Task] = set()
+        counts = {"files": 0, "parsed": 0, "failed": 0}
+
+        def finished(tasks) -> List[str]:
+            lines = []
+            for task in tasks:
+                result = task.result()
+                counts["parsed" if result["status"] == "parsed" else "failed"] += 1
+                lines.append(_ndjson(result))
+            return lines
+
+        try:
+            async for source in self._sources(items):
+                counts["files"] += 1
+                if "error" in source:
+                    counts["failed"] += 1
+                    yield _ndjson(_failed(source["filename"], source["error"]))
+                    continue
+
+                in_flight.add(asyncio.create_task(self._parse(source)))
+
+                done = {task for task in in_flight if task.done()}
+                if len(in_flight) >= self.max_in_flight and not done:
+                    done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                in_flight -= done
+                for line in finished(done):
+                    yield line
+
+            while in_flight:
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for line in finished(done):
+                    yield line
+
+            yield _ndjson({"type": "summary", **counts})
+        finally:
+            # The client went away or the stream failed: stop outstanding parses
+            for task in in_flight:
+                task.cancel()
+            discard_staged(items)
+
+    async def _sources(self, items: List[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
+        """Files to parse, expanding archives entry by entry, up to max_files"""
+        count = 0
+        for item in items:
+            entries = self._archive_entries(item) if "archive" in item else self._single(item)
+            async for source in entries:
+                count += 1
+                if count > self.max_files:
+                    await entries.aclose()
+                    yield {"filename": source["filename"], "error": f"Import is limited to {self.max_files} files"}
+                    return
+                yield source
+
+    @staticmethod
+    async def _single(item: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        yield item
+
+    async def _archive_entries(self, item: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        try:
+            archive = zipfile.ZipFile(item["archive"])
+        except zipfile.BadZipFile:
+            yield {"filename": item["filename"], "error": "Not a valid ZIP archive"}
+            return
+
+        with archive:
+            for info in archive.infolist():
+                name = info.filename
+                if info.is_dir() or name.startswith("__MACOSX/") or os.path.basename(name).startswith("."):
+                    continue
+
+                filename = f"{item['filename']}/{name}"
+                file_ext = os.path.splitext(name)[1].lower()
+                if file_ext not in settings.ALLOWED_EXTENSIONS:
+                    yield {"filename": filename, "error": "Unsupported file format"}
+                    continue
+                if info.file_size > settings.MAX_FILE_SIZE:
+                    yield {"filename": filename, "error": "File too large"}
+                    continue
+
+                try:
+                    stored = await asyncio.to_thread(self._extract_entry, archive, info, file_ext)
+                except FileTooLargeError:
+                    # The header understated the size; the limit is enforced while decompressing
+                    yield {"filename": filename, "error": "File too large"}
+                    continue
+                except (zipfile.BadZipFile, RuntimeError, NotImplementedError) as e:
+                    yield {"filename": filename, "error": f"Could not extract file: {str(e)}"}
+                    continue
+
+                yield {"filename": filename, "file_ext": file_ext, **stored}
+
+    @staticmethod
+    def _extract_entry(archive: zipfile.ZipFile, info: zipfile.ZipInfo, file_ext: str) -> Dict[str, Any]:
+        with archive.open(info) as entry:
+            return save_file_object(entry, file_ext, settings.MAX_FILE_SIZE)
+
+    async def _parse(self, source: Dict[str, Any]) -> Dict[str, Any]:
+        if self._parsing is None:
+            self._parsing = asyncio.Semaphore(self.max_parsing)
+        try:
+            async with self._parsing:
+                parsed = await self._parse_when_pool_has_room(source)
+        except ParserPoolFullError:
+            return _failed(source["filename"], "Parser is busy; try this file again later")
+        except Exception as e:
+            logger.warning(f"Bulk import could not parse {source['filename']}: {str(e)}")
+            return _failed(source["filename"], str(e) or type(e).__name__)
+
+        return {
+            "type": "result",
+            "filename": source["filename"],
+            "status": "parsed",
+            "file_id": source["content_hash"],
+            "parsed_content": parsed["parsed_content"],
+            "extraction": parsed["extraction"],
+            "cached": parsed["cached"]
+        }
+
+    async def _parse_when_pool_has_room(self, source: Dict[str, Any]) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.pool_wait_seconds
+        delay = 0.05
+        while True:
+            try:
+                return await self.parser.parse_resume(source["file_path"], source["file_ext"], source["content_hash"])
+            except ParserPoolFullError:
+                # Interactive uploads filled the pool; back off instead of failing the file
+                if loop.time() + delay > deadline:
+                    raise
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 1.0)
+
+
+bulk_importer = BulkImporter(
+    ResumeParser(),
+    max_in_flight=settings.BULK_IMPORT_MAX_IN_FLIGHT,
+    max_files=settings.BULK_IMPORT_MAX_FILES,
+    max_parsing=settings.BULK_IMPORT_MAX_PARSING,
+    pool_wait_seconds=settings.BULK_IMPORT_POOL_WAIT_SECONDS
+)
@@ -0,0 +1,91 @@
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Sequence
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+
+STOP_WORDS = frozenset("""
+a an and are as at be by for from has have in into is it its of on or our that the their this to was
+were will with we you your using used use via across over per than within
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens without stop words; keeps terms like c++, c# and node.js intact"""
+    return [token for token in TOKEN_PATTERN.findall((text or "").lower()) if token not in STOP_WORDS]
+
+
+class BulletRanker:
+    """Scores resume bullets against a job's skills and responsibilities without the LLM.
+
+    The score (0-100) blends keyword overlap, i.e. how many required
+    skills a bullet names, with the TF-IDF cosine similarity between the
+    bullet and the job context. IDF is computed over the resume's own
+    bullets, so generic words shared by every bullet count for little.
+    """
+
+    def __init__(self, keyword_weight: float = 0.6, skills_for_full_credit: int = 3):
+        self.keyword_weight = keyword_weight
+        self.skills_for_full_credit = skills_for_full_credit
+
+    def score(self, bullets: Sequence[str], required_skills: Sequence[str], key_responsibilities: Sequence[str]) -> List[float]:
+        skill_patterns = [
+            re.compile(r"(?<![\w+#])" + re.escape(skill.lower()) + r"(?![\w+#])")
+            for skill in required_skills if skill and skill.strip()
+        ]
+
+        context_tokens = tokenize(" ".join(list(required_skills) + list(key_responsibilities)))
+        bullet_tokens = [tokenize(bullet) for bullet in bullets]
+        idf = self._idf(bullet_tokens + [context_tokens])
+        context_vector = self._tfidf(context_tokens, idf)
+
+        scores = []
+        for bullet, tokens in zip(bullets, bullet_tokens):
+            lowered = bullet.lower()
+            matched = sum(1 for pattern in skill_patterns if pattern.search(lowered))
+            overlap = min(1.0, matched / self.skills_for_full_credit) if skill_patterns else 0.0
+            similarity = self._cosine(self._tfidf(tokens, idf), context_vector)
+            scores.append(round(100 * (self.keyword_weight * overlap + (1 - self.keyword_weight) * similarity), 1))
+
+        return scores
+
+    def select(
+        self,
+        bullets: Sequence[str],
+        required_skills: Sequence[str],
+        key_responsibilities: Sequence[str],
+        limit: int
+    ) -> List[int]:
+        """Indices of the limit highest-scoring bullets, in their original order"""
+        if limit <= 0 or len(bullets) <= limit:
+            return list(range(len(bullets)))
+
+        scores = self.score(bullets, required_skills, key_responsibilities)
+        # Ties keep the earlier (usually more recent) bullet
+        ranked = sorted(range(len(bullets)), key=lambda i: (-scores[i], i))
+        return sorted(ranked[:limit])
+
+    @staticmethod
+    def _idf(documents: List[List[str]]) -> Dict[str, float]:
+        document_frequency = Counter(token for tokens in documents for token in set(tokens))
+        total = len(documents)
+        return {
+            token: math.log((1 + total) / (1 + frequency)) + 1
+            for token, frequency in document_frequency.items()
+        }
+
+    @staticmethod
+    def _tfidf(tokens: List[str], idf: Dict[str, float]) -> Dict[str, float]:
+        if not tokens:
+            return {}
+        counts = Counter(tokens)
+        return {token: count / len(tokens) * idf.get(token, 1.0) for token, count in counts.items()}
+
+    @staticmethod
+    def _cosine(a: Dict[str, float], b: Dict[str, float]) -> float:
+        if not a or not b:
+            return 0.0
+        dot = sum(weight * b.get(token, 0.0) for token, weight in a.items())
+        norm = math.sqrt(sum(w * w for w in a.values())) * math.sqrt(sum(w * w for w in b.values()))
+        return dot / norm if norm else 0.0
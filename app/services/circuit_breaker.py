@@ -0,0 +1,150 @@
+import time
+from collections import deque
+from typing import Any, Dict
+
+from app.config import settings
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is refused because the circuit is open"""
+
+
+class CircuitBreaker:
+    """Rolling-window circuit breaker on provider error rate and latency.
+
+    The circuit opens when, over the last window_seconds, at least
+    min_calls were made and either the error rate or the share of calls
+    slower than the latency SLO crosses its threshold. After open_seconds
+    a single probe is let through (half-open); its outcome closes or
+    re-opens the circuit. A disabled breaker never opens.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        window_seconds: float = 60.0,
+        min_calls: int = 10,
+        error_rate_threshold: float = 0.5,
+        latency_slo_seconds: float = 15.0,
+        slow_call_rate_threshold: float = 0.5,
+        open_seconds: float = 30.0,
+        enabled: bool = True
+    ):
+        self.enabled = enabled
+        self.window_seconds = window_seconds
+        self.min_calls = min_calls
+        self.error_rate_threshold = error_rate_threshold
+        self.latency_slo_seconds = latency_slo_seconds
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.open_seconds = open_seconds
+        self._calls: deque = deque()
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.times_opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+            self._state = self.HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def is_closed(self) -> bool:
+        return self.state == self.CLOSED
+
+    def probe_available(self) -> bool:
+        """Whether the circuit is half-open and its probe has not been taken yet"""
+        return self.state == self.HALF_OPEN and not self._probe_in_flight
+
+    def allow_request(self) -> bool:
+        """Whether a provider call may be attempted now"""
+        state = self.state
+        if state == self.CLOSED or not self.enabled:
+            return True
+        if state == self.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self, latency: float):
+        slow = latency > self.latency_slo_seconds
+        if self._state == self.HALF_OPEN:
+            self._probe_in_flight = False
+            if slow:
+                self._open()
+            else:
+                self._close()
+            return
+
+        self._record(ok=True, slow=slow)
+
+    def record_failure(self, latency: float):
+        if self._state == self.HALF_OPEN:
+            self._probe_in_flight = False
+            self._open()
+            return
+
+        self._record(ok=False, slow=latency > self.latency_slo_seconds)
+
+    def release(self):
+        """Forget an allowed call whose outcome is unknown, e.g. it was cancelled"""
+        if self._state == self.HALF_OPEN:
+            self._probe_in_flight = False
+
+    def stats(self) -> Dict[str, Any]:
+        self._prune(time.monotonic())
+        total = len(self._calls)
+        return {
+            "state": self.state,
+            "window_calls": total,
+            "error_rate": round(sum(1 for _, ok, _ in self._calls if not ok) / total, 3) if total else 0.0,
+            "slow_call_rate": round(sum(1 for _, _, slow in self._calls if slow) / total, 3) if total else 0.0,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected
+        }
+
+    def _record(self, ok: bool, slow: bool):
+        now = time.monotonic()
+        self._calls.append((now, ok, slow))
+        self._prune(now)
+
+        if not self.enabled or self._state != self.CLOSED or len(self._calls) < self.min_calls:
+            return
+
+        total = len(self._calls)
+        error_rate = sum(1 for _, call_ok, _ in self._calls if not call_ok) / total
+        slow_rate = sum(1 for _, _, call_slow in self._calls if call_slow) / total
+
+        if error_rate >= self.error_rate_threshold or slow_rate >= self.slow_call_rate_threshold:
+            self._open()
+
+    def _prune(self, now: float):
+        while self._calls and now - self._calls[0][0] > self.window_seconds:
+            self._calls.popleft()
+
+    def _open(self):
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+        self.times_opened += 1
+
+    def _close(self):
+        self._state = self.CLOSED
+        self._calls.clear()
+
+
+# Provider health is shared by every API key, so one breaker guards all LLM calls
+llm_circuit_breaker = CircuitBreaker(
+    window_seconds=settings.AI_BREAKER_WINDOW_SECONDS,
+    min_calls=settings.AI_BREAKER_MIN_CALLS,
+    error_rate_threshold=settings.AI_BREAKER_ERROR_RATE,
+    latency_slo_seconds=settings.AI_BREAKER_LATENCY_SLO_SECONDS,
+    slow_call_rate_threshold=settings.AI_BREAKER_SLOW_CALL_RATE,
+    open_seconds=settings.AI_BREAKER_OPEN_SECONDS,
+    enabled=settings.AI_BREAKER_ENABLED
+)
@@ -6,8 +6,8 @@ from datetime import datetime
 from app.models.resume import Resume, ExportRequest
 
 class ExportService:
-    def __init__(self):
-        self.export_directory = "exports"
+    def __init__(self, export_directory: str = "exports"):
+        self.export_directory = export_directory
         os.makedirs(self.export_directory, exist_ok=True)
 
     async def generate_resume_file(
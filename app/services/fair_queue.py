@@ -0,0 +1,201 @@
+import asyncio
+import math
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Optional, Tuple
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+
+
+class FairQueueMetrics:
+    """Queue depth and wait time per priority class, shared by every FairQueue"""
+
+    def __init__(self, sample_size: int = 1000):
+        self.sample_size = sample_size
+        self._classes: Dict[str, Dict[str, Any]] = {}
+
+    def _get(self, priority: str) -> Dict[str, Any]:
+        metrics = self._classes.get(priority)
+        if metrics is None:
+            metrics = {"depth": 0, "granted": 0, "max_wait": 0.0, "waits": deque(maxlen=self.sample_size)}
+            self._classes[priority] = metrics
+        return metrics
+
+    def queued(self, priority: str):
+        self._get(priority)["depth"] += 1
+
+    def dequeued(self, priority: str):
+        self._get(priority)["depth"] -= 1
+
+    def granted(self, priority: str, waited: float):
+        metrics = self._get(priority)
+        metrics["granted"] += 1
+        metrics["max_wait"] = max(metrics["max_wait"], waited)
+        metrics["waits"].append(waited)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        stats = {}
+        for priority, metrics in self._classes.items():
+            waits = sorted(metrics["waits"])
+            stats[priority] = {
+                "queue_depth": metrics["depth"],
+                "granted": metrics["granted"],
+                "avg_wait_ms": round(sum(waits) / len(waits) * 1000, 1) if waits else 0.0,
+                "p95_wait_ms": round(waits[max(0, math.ceil(0.95 * len(waits)) - 1)] * 1000, 1) if waits else 0.0,
+                "max_wait_ms": round(metrics["max_wait"] * 1000, 1)
+            }
+        return stats
+
+
+class FairQueue:
+    """Bounds concurrent LLM calls and hands free slots out fairly.
+
+    Waiters are queued per priority class and, within a class, per user.
+    Classes share slots by smooth weighted round robin, so bulk work still
+    progresses behind interactive traffic. Users within a class are served
+    by deficit round robin, where a call's cost is the number of bullets it
+    carries, so one user's large resume cannot starve everyone else.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        class_weights: Optional[Dict[str, int]] = None,
+        quantum: int = 1,
+        metrics: Optional[FairQueueMetrics] = None
+    ):
+        self.capacity = capacity
+        self.class_weights = class_weights or {INTERACTIVE: 4, BULK: 1}
+        self.quantum = quantum
+        self.metrics = metrics or FairQueueMetrics()
+        self._active = 0
+        self._queues: Dict[str, "OrderedDict[str, Deque[Tuple[int, float, asyncio.Future]]]"] = {}
+        self._deficits: Dict[Tuple[str, str], int] = {}
+        self._current_weights: Dict[str, int] = {}
+        self.last_used = time.monotonic()
+
+    @asynccontextmanager
+    async def slot(self, user: str, priority: str = INTERACTIVE, cost: int = 1) -> AsyncIterator[float]:
+        """Hold one slot for the duration of the block; yields the seconds waited"""
+        waited = await self.acquire(user, priority, cost)
+        try:
+            yield waited
+        finally:
+            self.release()
+
+    async def acquire(self, user: str, priority: str = INTERACTIVE, cost: int = 1) -> float:
+        if priority not in self.class_weights:
+            raise ValueError(f"Unknown priority class: {priority}")
+
+        started = time.monotonic()
+        self.last_used = started
+        future = asyncio.get_running_loop().create_future()
+        self._queues.setdefault(priority, OrderedDict()).setdefault(user, deque()).append(
+            (max(1, cost), started, future)
+        )
+        self.metrics.queued(priority)
+
+        # Grants immediately when a slot is free
+        self._dispatch()
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just as the waiter was cancelled
+                self.release()
+            raise
+
+        return time.monotonic() - started
+
+    def release(self):
+        self._active -= 1
+        self.last_used = time.monotonic()
+        self._dispatch()
+
+    def is_idle(self, idle_seconds: float) -> bool:
+        """No slot held, nobody waiting, and unused for at least idle_seconds"""
+        return self._active == 0 and self.depth() == 0 and time.monotonic() - self.last_used >= idle_seconds
+
+    def depth(self) -> int:
+        return sum(len(waiters) for users in self._queues.values() for waiters in users.values())
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "capacity": self.capacity,
+            "active": self._active,
+            "queued": self.depth(),
+            "classes": self.metrics.stats()
+        }
+
+    def _dispatch(self):
+        while self._active < self.capacity:
+            priority = self._next_class()
+            if priority is None:
+                return
+
+            granted = self._next_waiter(priority)
+            if granted is not None:
+                self._active += 1
+                granted.set_result(None)
+
+    def _next_class(self) -> Optional[str]:
+        """Smooth weighted round robin over the classes that have waiters"""
+        ready = [priority for priority, users in self._queues.items() if users]
+        if not ready:
+            return None
+
+        total = 0
+        for priority in ready:
+            self._current_weights[priority] = self._current_weights.get(priority, 0) + self.class_weights[priority]
+            total += self.class_weights[priority]
+
+        chosen = max(ready, key=lambda priority: self._current_weights[priority])
+        self._current_weights[chosen] -= total
+        return chosen
+
+    def _next_waiter(self, priority: str) -> Optional[asyncio.Future]:
+        """Deficit round robin over the users queued in a class"""
+        users = self._queues[priority]
+
+        while users:
+            user, waiters = next(iter(users.items()))
+            deficit_key = (priority, user)
+            cost, started, future = waiters[0]
+
+            if future.done():
+                # Cancelled while waiting
+                waiters.popleft()
+                self.metrics.dequeued(priority)
+                self._retire_if_idle(priority, user)
+                continue
+
+            deficit = self._deficits.get(deficit_key, 0)
+            if deficit < cost:
+                self._deficits[deficit_key] = deficit + self.quantum
+                if self._deficits[deficit_key] < cost:
+                    users.move_to_end(user)
+                continue
+
+            self._deficits[deficit_key] = deficit - cost
+            waiters.popleft()
+            self.metrics.dequeued(priority)
+            self.metrics.granted(priority, time.monotonic() - started)
+
+            if not self._retire_if_idle(priority, user) and self._deficits[deficit_key] < waiters[0][0]:
+                # This user's turn is over once its deficit can't cover the next call
+                users.move_to_end(user)
+
+            return future
+
+        return None
+
+    def _retire_if_idle(self, priority: str, user: str) -> bool:
+        users = self._queues[priority]
+        if users.get(user):
+            return False
+        users.pop(user, None)
+        self._deficits.pop((priority, user), None)
+        return True
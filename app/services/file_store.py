@@ -0,0 +1,115 @@
+import hashlib
+import os
+import uuid
+from typing import Any, BinaryIO, Dict, Optional
+
+import aiofiles
+from fastapi import UploadFile
+
+from app.config import settings
+
+class FileTooLargeError(Exception):
+    """Raised when a file grows past the size limit while it is being stored"""
+
+
+class _HashingWriter:
+    """Hashes and counts a file's bytes as they are written to a temporary path.
+
+    Callers do the writing, blocking or with aiofiles; update() checks each
+    chunk against max_size before it is stored, so an oversized file fails
+    as soon as it crosses the limit.
+    """
+
+    def __init__(self, max_size: Optional[int] = None):
+        os.makedirs(settings.UPLOAD_DIRECTORY, exist_ok=True)
+        self.temp_path = os.path.join(settings.UPLOAD_DIRECTORY, f".{uuid.uuid4()}.part")
+        self.max_size = max_size
+        self.digest = hashlib.sha256()
+        self.size = 0
+
+    def update(self, chunk: bytes):
+        self.size += len(chunk)
+        if self.max_size is not None and self.size > self.max_size:
+            raise FileTooLargeError(f"File exceeds the {self.max_size} byte limit")
+        self.digest.update(chunk)
+
+    def discard(self):
+        if os.path.exists(self.temp_path):
+            os.remove(self.temp_path)
+
+    def commit(self, file_ext: str) -> Dict[str, Any]:
+        """Move the file to its content-addressed path, or drop it if that content is already stored"""
+        content_hash = self.digest.hexdigest()
+        file_path = os.path.join(settings.UPLOAD_DIRECTORY, f"{content_hash}{file_ext}")
+        deduplicated = os.path.exists(file_path)
+        if deduplicated:
+            os.remove(self.temp_path)
+        else:
+            os.replace(self.temp_path, file_path)
+
+        return {
+            "content_hash": content_hash,
+            "file_path": file_path,
+            "size": self.size,
+            "deduplicated": deduplicated
+        }
+
+
+async def _copy_upload(file: UploadFile, writer: _HashingWriter):
+    # One chunk in memory at a time; disk writes do not block the event loop
+    async with aiofiles.open(writer.temp_path, "wb") as buffer:
+        while True:
+            chunk = await file.read(settings.UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            writer.update(chunk)
+            await buffer.write(chunk)
+
+
+async def save_upload(file: UploadFile, file_ext: str, max_size: Optional[int] = None) -> Dict[str, Any]:
+    """Store an upload under the SHA-256 of its bytes, hashing it as it is copied.
+
+    Identical uploads share one stored file; the second copy is discarded.
+    Raises FileTooLargeError as soon as more than max_size bytes have been
+    read, without trusting the client-reported size. Returns the content
+    hash (also used as the file id), path and size, and whether the
+    content was already stored.
+    """
+    writer = _HashingWriter(max_size)
+    try:
+        await _copy_upload(file, writer)
+    except BaseException:
+        writer.discard()
+        raise
+
+    return writer.commit(file_ext)
+
+
+def save_file_object(source: BinaryIO, file_ext: str, max_size: Optional[int] = None) -> Dict[str, Any]:
+    """save_upload for a blocking file object, e.g. a ZIP entry; run it in a thread"""
+    writer = _HashingWriter(max_size)
+    try:
+        with open(writer.temp_path, "wb") as buffer:
+            while True:
+                chunk = source.read(settings.UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                writer.update(chunk)
+                buffer.write(chunk)
+    except BaseException:
+        writer.discard()
+        raise
+
+    return writer.commit(file_ext)
+
+
+async def save_temporary(file: UploadFile, max_size: Optional[int] = None) -> str:
+    """Copy an upload to a scratch file the caller deletes, e.g. an archive read after the request body is gone"""
+    writer = _HashingWriter(max_size)
+    try:
+        await _copy_upload(file, writer)
+    except BaseException:
+        writer.discard()
+        raise
+
+    return writer.temp_path
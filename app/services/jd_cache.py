@@ -0,0 +1,95 @@
+import json
+import re
+from typing import Any, Dict, Optional
+
+from app.config import settings
+from app.services.llm_cache import LLMResponseCache
+from app.services.single_flight import SingleFlight
+from app.services.skill_matcher import skill_matcher
+from app.utils.helpers import hash_string
+
+# Lines that appear in many postings but say nothing about the role
+BOILERPLATE_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in [
+        r"equal (employment )?opportunity",
+        r"without regard to (race|color|religion|sex|gender|age)",
+        r"reasonable accommodation",
+        r"e-?verify",
+        r"click (the )?apply",
+        r"apply (now|today)",
+        r"share this (job|posting)",
+        r"we use cookies",
+        r"all rights reserved",
+    ]
+]
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_job_description(text: str) -> str:
+    """Normalize job description text so trivially different pastes hash the same"""
+    lines = [
+        line for line in (text or "").splitlines()
+        if not any(pattern.search(line) for pattern in BOILERPLATE_PATTERNS)
+    ]
+    return WHITESPACE_PATTERN.sub(" ", " ".join(lines)).strip().lower()
+
+
+class JDAnalysisCache:
+    """Cache of job description analyses keyed on normalized posting text.
+
+    Rule-based analyses are deterministic and always shared. LLM-derived
+    analyses are scoped to the API key that produced them unless
+    JD_CACHE_SHARE_LLM_ANALYSES allows sharing between tenants.
+    """
+
+    def __init__(self, store: Optional[LLMResponseCache] = None, share_llm_analyses: bool = False):
+        self.store = store
+        self.share_llm_analyses = share_llm_analyses
+
+    def scope(self, source: str, tenant: Optional[str] = None) -> str:
+        """Who may share an analysis from this source; also scopes the LLM completion behind it"""
+        if source == "rules":
+            # Rule-based results change whenever the skills dictionary does
+            return skill_matcher.fingerprint
+        if not self.share_llm_analyses:
+            return hash_string(tenant or "")
+        return "shared"
+
+    def make_key(self, job_description: str, source: str, tenant: Optional[str] = None) -> str:
+        """Build the cache key for an analysis of a posting by a given source"""
+        return hash_string(json.dumps([source, self.scope(source, tenant), normalize_job_description(job_description)]))
+
+    async def get(self, job_description: str, source: str, tenant: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Return a cached analysis, if any"""
+        if self.store is None:
+            return None
+
+        cached = await self.store.get(self.make_key(job_description, source, tenant))
+        return json.loads(cached) if cached is not None else None
+
+    async def set(self, job_description: str, source: str, analysis: Dict[str, Any], tenant: Optional[str] = None):
+        """Store an analysis; empty analyses (failed runs) are not cached"""
+        if self.store is None or not analysis:
+            return
+
+        await self.store.set(self.make_key(job_description, source, tenant), json.dumps(analysis))
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters of the underlying store"""
+        return self.store.stats() if self.store is not None else {}
+
+
+# Shared by AIService and JobAnalyzer so every endpoint reuses the same analyses
+jd_analysis_cache = JDAnalysisCache(
+    store=LLMResponseCache(
+        max_entries=settings.JD_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.JD_CACHE_TTL_SECONDS,
+        db_path=settings.JD_CACHE_DB_PATH
+    ) if settings.JD_CACHE_ENABLED else None,
+    share_llm_analyses=settings.JD_CACHE_SHARE_LLM_ANALYSES
+)
+
+# Coalesces concurrent analyses of the same posting within this process
+jd_analysis_flights = SingleFlight()
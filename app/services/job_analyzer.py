@@ -1,45 +1,42 @@
 from typing import Dict, Any, List, Optional
 import re
 from app.models.resume import ResumeContent
+from app.services.jd_cache import jd_analysis_cache, jd_analysis_flights
+from app.services.skill_matcher import skill_matcher
 
 class JobAnalyzer:
     def __init__(self):
-        pass
+        self.jd_cache = jd_analysis_cache
+        self.jd_flights = jd_analysis_flights
 
     async def analyze_job_description(self, job_content: str, user_api_key: Optional[str] = None) -> Dict[str, Any]:
         """Analyze job description and extract key information"""
 
-        # Simple keyword extraction - in production, you'd use NLP/AI
-        analysis = {
-            "required_skills": self._extract_skills(job_content),
-            "preferred_qualifications": self._extract_qualifications(job_content),
-            "key_responsibilities": self._extract_responsibilities(job_content),
-            "company_culture_keywords": self._extract_culture_keywords(job_content),
-            "experience_level": self._determine_experience_level(job_content),
-            "industry": self._determine_industry(job_content)
-        }
+        cached = await self.jd_cache.get(job_content, "rules")
+        if cached is not None:
+            return cached
 
-        return analysis
+        async def analyze() -> Dict[str, Any]:
+            # Simple keyword extraction - in production, you'd use NLP/AI
+            analysis = {
+                "required_skills": self._extract_skills(job_content),
+                "preferred_qualifications": self._extract_qualifications(job_content),
+                "key_responsibilities": self._extract_responsibilities(job_content),
+                "company_culture_keywords": self._extract_culture_keywords(job_content),
+                "experience_level": self._determine_experience_level(job_content),
+                "industry": self._determine_industry(job_content)
+            }
 
-    def _extract_skills(self, text: str) -> List[str]:
-        """Extract technical skills from job description"""
+            await self.jd_cache.set(job_content, "rules", analysis)
 
-        common_skills = [
-            'Python', 'Java', 'JavaScript', 'React', 'Node.js', 'SQL', 'AWS', 'Docker',
-            'Kubernetes', 'Git', 'HTML', 'CSS', 'MongoDB', 'PostgreSQL', 'Linux',
-            'Machine Learning', 'Data Analysis', 'Project Management', 'Agile', 'Scrum',
-            'REST API', 'GraphQL', 'TypeScript', 'Vue.js', 'Angular', 'Spring Boot',
-            'Django', 'Flask', 'Redis', 'Elasticsearch', 'Kafka', 'Jenkins', 'CI/CD'
-        ]
+            return analysis
 
-        found_skills = []
-        text_lower = text.lower()
+        # Concurrent requests for the same posting share one analysis
+        return await self.jd_flights.do(self.jd_cache.make_key(job_content, "rules"), analyze)
 
-        for skill in common_skills:
-            if skill.lower() in text_lower:
-                found_skills.append(skill)
-
-        return found_skills[:10]  # Limit to top 10
+    def _extract_skills(self, text: str) -> List[str]:
+        """Extract technical skills from job description"""
+        return skill_matcher.find(text, limit=10)  # Limit to top 10
 
     def _extract_qualifications(self, text: str) -> List[str]:
         """Extract preferred qualifications"""
@@ -149,6 +146,10 @@ class JobAnalyzer:
             text_parts.append(f"Email: {resume_content.personal_info.email}")
             if resume_content.personal_info.phone:
                 text_parts.append(f"Phone: {resume_content.personal_info.phone}")
+            if resume_content.personal_info.location:
+                text_parts.append(f"Location: {resume_content.personal_info.location}")
+            if resume_content.personal_info.linkedin:
+                text_parts.append(f"LinkedIn: {resume_content.personal_info.linkedin}")
 
         # Summary
         if resume_content.summary:
@@ -158,7 +159,8 @@ class JobAnalyzer:
         if resume_content.experience:
             text_parts.append("Experience:")
             for exp in resume_content.experience:
-                text_parts.append(f"{exp.title} at {exp.company}")
+                end_date = "Present" if exp.is_current else (exp.end_date or "Present")
+                text_parts.append(f"{exp.title} at {exp.company} ({exp.start_date} - {end_date})")
                 for bullet in exp.bullets:
                     text_parts.append(f"- {bullet}")
 
@@ -170,6 +172,7 @@ class JobAnalyzer:
         if resume_content.education:
             text_parts.append("Education:")
             for edu in resume_content.education:
-                text_parts.append(f"{edu.degree} from {edu.school}")
+                graduation = f" ({edu.graduation_year})" if edu.graduation_year else ""
+                text_parts.append(f"{edu.degree} from {edu.school}{graduation}")
 
         return "\n".join(text_parts)
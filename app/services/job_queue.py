@@ -0,0 +1,134 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from fastapi import HTTPException
+
+from app.config import settings
+from app.database.crud import MatchJobCRUD
+from app.models.resume import MatchAnalysis, MatchJob
+from app.services.fair_queue import BULK
+from app.services.match_service import match_service
+
+logger = logging.getLogger(__name__)
+
+
+class QueueFullError(Exception):
+    """Raised when a job is submitted while the queue is at capacity"""
+
+
+class MatchJobQueue:
+    """Durable queue of match-resume jobs drained by a fixed pool of asyncio workers.
+
+    Jobs are written to the database before they are queued in memory, so
+    work queued or running when the process stops is picked up again by
+    start(). Assumes a single application process owns the queue.
+    """
+
+    def __init__(
+        self,
+        run_job: Callable[[MatchJob], Awaitable[MatchAnalysis]],
+        crud: Optional[MatchJobCRUD] = None,
+        workers: int = 4,
+        max_pending: int = 1000,
+        max_attempts: int = 3
+    ):
+        self.run_job = run_job
+        self.crud = crud or MatchJobCRUD()
+        self.workers = workers
+        self.max_pending = max_pending
+        self.max_attempts = max_attempts
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self.running = 0
+        self.succeeded = 0
+        self.failed = 0
+
+    async def start(self):
+        """Requeue persisted jobs and start the workers"""
+        if self._tasks:
+            return
+
+        self._queue = asyncio.Queue()
+        for job_id in await self.crud.recover_jobs(self.max_attempts):
+            self._queue.put_nowait(job_id)
+
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        logger.info(f"Match job queue started with {self.workers} workers, {self._queue.qsize()} recovered jobs")
+
+    async def stop(self):
+        """Stop the workers; jobs they were running are requeued on the next start()"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def submit(self, job: MatchJob) -> MatchJob:
+        """Persist a job and queue it for a worker"""
+        if self._queue is None:
+            raise RuntimeError("Match job queue is not running")
+        if self._queue.qsize() >= self.max_pending:
+            raise QueueFullError("Too many match jobs are pending; try again later")
+
+        job = await self.crud.create_job(job)
+        self._queue.put_nowait(job.id)
+        return job
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": len(self._tasks),
+            "pending": self._queue.qsize() if self._queue is not None else 0,
+            "running": self.running,
+            "succeeded": self.succeeded,
+            "failed": self.failed
+        }
+
+    async def _worker(self):
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._process(job_id)
+            except Exception as e:
+                # Bookkeeping failures must not take the worker down
+                logger.error(f"Match job {job_id} could not be processed: {str(e)}")
+            finally:
+                self._queue.task_done()
+
+    async def _process(self, job_id: str):
+        job = await self.crud.claim_job(job_id)
+        if job is None:
+            return
+
+        self.running += 1
+        try:
+            result = await self.run_job(job)
+        except Exception as e:
+            self.failed += 1
+            error = e.detail if isinstance(e, HTTPException) else str(e)
+            logger.error(f"Match job {job_id} failed: {error}")
+            await self.crud.finish_job(job_id, error=str(error))
+            return
+        finally:
+            self.running -= 1
+
+        self.succeeded += 1
+        await self.crud.finish_job(job_id, result=result)
+
+
+async def run_match_job(job: MatchJob) -> MatchAnalysis:
+    # Background jobs yield LLM slots to interactive requests on shared keys
+    return await match_service.match_resume(
+        job.user_id,
+        job.resume_id,
+        job.job_description_id,
+        bypass_cache=job.bypass_cache,
+        priority=BULK
+    )
+
+
+match_job_queue = MatchJobQueue(
+    run_job=run_match_job,
+    workers=settings.MATCH_JOB_WORKERS,
+    max_pending=settings.MATCH_JOB_MAX_PENDING,
+    max_attempts=settings.MATCH_JOB_MAX_ATTEMPTS
+)
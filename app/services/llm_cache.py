@@ -0,0 +1,141 @@
+import asyncio
+import json
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from app.utils.helpers import hash_string
+
+
+class LLMResponseCache:
+    """Content-addressed cache for chat completion responses.
+
+    Entries live in an in-memory LRU tier bounded by size and TTL. When a
+    database path is configured, entries are also written through to a
+    SQLite file that survives restarts and is shared by every worker
+    process pointing at it.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: int = 86400, db_path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.db_path = db_path
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+
+        if self.db_path:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._init_db()
+
+    @staticmethod
+    def make_key(model: str, system_prompt: str, user_prompt: str, temperature: float, scope: str = "shared") -> str:
+        """Build the cache key for a completion request; scope separates tenants that must not share entries"""
+        return hash_string(json.dumps([model, system_prompt, user_prompt, temperature, scope]))
+
+    async def get(self, key: str) -> Optional[str]:
+        """Look up a cached response, checking memory before disk"""
+        now = time.time()
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, created_at = entry
+            if now - created_at <= self.ttl_seconds:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                self.memory_hits += 1
+                return value
+            del self._entries[key]
+
+        if self.db_path:
+            row = await asyncio.to_thread(self._db_get, key, now - self.ttl_seconds)
+            if row is not None:
+                value, created_at = row
+                self._remember(key, value, created_at)
+                self.hits += 1
+                self.disk_hits += 1
+                return value
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, value: str):
+        """Store a response in memory and, if configured, on disk"""
+        now = time.time()
+        self._remember(key, value, now)
+
+        if self.db_path:
+            self._writes += 1
+            prune = self._writes % 100 == 0
+            await asyncio.to_thread(self._db_set, key, value, now, prune)
+
+    def clear(self):
+        """Drop all in-memory entries"""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current size"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "memory_entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "persistent": bool(self.db_path)
+        }
+
+    def _remember(self, key: str, value: str, created_at: float):
+        self._entries[key] = (value, created_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _connect(self) -> sqlite3.Connection:
+        # WAL lets several uvicorn workers read while one writes
+        conn = sqlite3.connect(self.db_path, timeout=5)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def _init_db(self):
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+        conn.close()
+
+    def _db_get(self, key: str, min_created_at: float) -> Optional[tuple]:
+        conn = self._connect()
+        try:
+            return conn.execute(
+                "SELECT value, created_at FROM llm_cache WHERE key = ? AND created_at >= ?",
+                (key, min_created_at)
+            ).fetchone()
+        finally:
+            conn.close()
+
+    def _db_set(self, key: str, value: str, created_at: float, prune: bool):
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, value, created_at) VALUES (?, ?, ?)",
+                    (key, value, created_at)
+                )
+                if prune:
+                    conn.execute(
+                        "DELETE FROM llm_cache WHERE created_at < ?",
+                        (created_at - self.ttl_seconds,)
+                    )
+        finally:
+            conn.close()
@@ -0,0 +1,255 @@
+import asyncio
+import logging
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import openai
+
+from app.config import settings
+from app.utils.helpers import hash_string
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = {408, 409, 429}
+
+
+class TokenBucket:
+    """Continuously refilling token bucket"""
+
+    def __init__(self, rate_per_second: float, capacity: float):
+        self.rate_per_second = rate_per_second
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate_per_second)
+        self.updated = now
+
+    def delay_for(self, amount: float) -> float:
+        """Seconds until amount can be consumed (0 if available now)"""
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate_per_second
+
+    def consume(self, amount: float):
+        self._refill()
+        self.tokens -= min(amount, self.capacity)
+
+    def refund(self, amount: float):
+        """Return over-reserved tokens, e.g. when a reply was shorter than budgeted"""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+    def pause(self, seconds: float):
+        """Empty the bucket so nothing is admitted for the given time"""
+        self._refill()
+        self.tokens = min(self.tokens, -seconds * self.rate_per_second)
+
+    def is_full(self) -> bool:
+        self._refill()
+        return self.tokens >= self.capacity
+
+
+class KeyRateLimiter:
+    """Requests/min and tokens/min budget for one API key.
+
+    Waiters are admitted one at a time in arrival order, so a burst of
+    work from one caller cannot jump ahead of callers already waiting.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int, burst_seconds: float):
+        request_rate = requests_per_minute / 60
+        token_rate = tokens_per_minute / 60
+        self.requests = TokenBucket(request_rate, max(1.0, request_rate * burst_seconds))
+        self.tokens = TokenBucket(token_rate, max(1.0, token_rate * burst_seconds))
+        self._lock = asyncio.Lock()
+        self.waiting = 0
+        # Calls between their first acquire and their last attempt, retries included
+        self.in_use = 0
+
+    async def acquire(self, estimated_tokens: int) -> float:
+        """Wait until a request of estimated_tokens fits the budget; returns seconds waited"""
+        started = time.monotonic()
+        self.waiting += 1
+        try:
+            async with self._lock:
+                while True:
+                    delay = max(self.requests.delay_for(1), self.tokens.delay_for(estimated_tokens))
+                    if delay <= 0:
+                        self.requests.consume(1)
+                        self.tokens.consume(estimated_tokens)
+                        return time.monotonic() - started
+                    await asyncio.sleep(delay)
+        finally:
+            self.waiting -= 1
+
+    def settle(self, estimated_tokens: int, actual_tokens: Optional[int]):
+        """Correct the token reservation once the provider reports real usage"""
+        if actual_tokens is not None and actual_tokens < estimated_tokens:
+            self.tokens.refund(estimated_tokens - actual_tokens)
+
+    def pause(self, seconds: float):
+        self.requests.pause(seconds)
+
+    def is_idle(self) -> bool:
+        """Unused and refilled, so a fresh limiter would behave the same"""
+        return self.in_use == 0 and self.waiting == 0 and self.requests.is_full() and self.tokens.is_full()
+
+
+class RateLimitScheduler:
+    """Runs provider calls under per-key rate limits with retry and backoff.
+
+    Each API key gets a token bucket for requests/min and tokens/min, sized
+    a little under the real quota so throughput stays steady instead of
+    alternating between bursts and 429s. Rate limits, timeouts, connection
+    errors and 5xx replies are retried with jittered exponential backoff,
+    honoring Retry-After when the provider sends it.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        headroom: float = 0.9,
+        burst_seconds: float = 10.0,
+        max_retries: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0
+    ):
+        self.requests_per_minute = int(requests_per_minute * headroom)
+        self.tokens_per_minute = int(tokens_per_minute * headroom)
+        self.burst_seconds = burst_seconds
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._limiters: Dict[str, KeyRateLimiter] = {}
+        self.calls = 0
+        self.retries = 0
+        self.failures = 0
+        self.throttled_seconds = 0.0
+
+    def _get_limiter(self, api_key: Optional[str]) -> KeyRateLimiter:
+        key_hash = hash_string(api_key or "")
+        limiter = self._limiters.get(key_hash)
+        if limiter is None:
+            self._evict_idle_limiters()
+            limiter = KeyRateLimiter(self.requests_per_minute, self.tokens_per_minute, self.burst_seconds)
+            self._limiters[key_hash] = limiter
+        return limiter
+
+    def _evict_idle_limiters(self):
+        # Keys come from users, so one limiter per key ever seen would grow without bound
+        idle = [key_hash for key_hash, limiter in self._limiters.items() if limiter.is_idle()]
+        for key_hash in idle:
+            del self._limiters[key_hash]
+
+    async def run(
+        self,
+        api_key: Optional[str],
+        call: Callable[[], Awaitable[Any]],
+        estimated_tokens: int,
+        on_retry: Optional[Callable[[], None]] = None
+    ) -> Any:
+        """Run call() once the key's budget allows, retrying transient failures"""
+        limiter = self._get_limiter(api_key)
+        limiter.in_use += 1
+        try:
+            for attempt in range(self.max_retries + 1):
+                self.throttled_seconds += await limiter.acquire(estimated_tokens)
+                self.calls += 1
+
+                try:
+                    response = await call()
+                except Exception as e:
+                    if not self.is_retryable(e) or attempt == self.max_retries:
+                        self.failures += 1
+                        raise
+
+                    retry_after = self.retry_after(e)
+                    if getattr(e, "status_code", None) == 429:
+                        # Hold back every caller on this key, not just this one
+                        limiter.pause(retry_after if retry_after is not None else self.backoff(attempt))
+
+                    delay = retry_after if retry_after is not None else self.backoff(attempt)
+                    self.retries += 1
+                    if on_retry is not None:
+                        on_retry()
+                    logger.warning(
+                        f"Retrying LLM call in {delay:.2f}s (attempt {attempt + 1}/{self.max_retries}): {str(e)}"
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+
+                usage = getattr(response, "usage", None)
+                limiter.settle(estimated_tokens, getattr(usage, "total_tokens", None))
+                return response
+        finally:
+            limiter.in_use -= 1
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    @staticmethod
+    def is_retryable(error: Exception) -> bool:
+        if isinstance(error, openai.APIConnectionError):
+            return True
+        if isinstance(error, openai.APIStatusError):
+            return error.status_code in RETRYABLE_STATUS_CODES or error.status_code >= 500
+        return False
+
+    def retry_after(self, error: Exception) -> Optional[float]:
+        """Parse Retry-After (seconds or HTTP date) from a provider error"""
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None)
+        if not headers:
+            return None
+
+        retry_after_ms = headers.get("retry-after-ms")
+        if retry_after_ms:
+            try:
+                return min(float(retry_after_ms) / 1000, self.max_delay)
+            except ValueError:
+                pass
+
+        retry_after = headers.get("retry-after")
+        if not retry_after:
+            return None
+
+        try:
+            seconds = float(retry_after)
+        except ValueError:
+            try:
+                seconds = parsedate_to_datetime(retry_after).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+
+        return min(max(seconds, 0.0), self.max_delay)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return call, retry and throttling counters"""
+        return {
+            "calls": self.calls,
+            "retries": self.retries,
+            "failures": self.failures,
+            "throttled_seconds": round(self.throttled_seconds, 3),
+            "keys": len(self._limiters),
+            "waiting": sum(limiter.waiting for limiter in self._limiters.values())
+        }
+
+
+llm_scheduler = RateLimitScheduler(
+    requests_per_minute=settings.AI_RATE_LIMIT_RPM,
+    tokens_per_minute=settings.AI_RATE_LIMIT_TPM,
+    headroom=settings.AI_RATE_LIMIT_HEADROOM,
+    burst_seconds=settings.AI_RATE_LIMIT_BURST_SECONDS,
+    max_retries=settings.AI_MAX_RETRIES,
+    base_delay=settings.AI_RETRY_BASE_DELAY,
+    max_delay=settings.AI_RETRY_MAX_DELAY
+)
@@ -0,0 +1,175 @@
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from fastapi import HTTPException, status
+
+from app.models.resume import AISuggestion, Resume, MatchAnalysis
+from app.services.ai_service import ai_service, is_relevant
+from app.services.auth_service import AuthService
+from app.services.circuit_breaker import CircuitOpenError
+from app.services.fair_queue import INTERACTIVE
+from app.services.job_analyzer import JobAnalyzer
+from app.services.telemetry import telemetry
+from app.database.crud import ResumeCRUD, JobDescriptionCRUD, MatchAnalysisCRUD
+
+
+class MatchService:
+    """The match-resume pipeline, shared by the HTTP endpoint and background jobs"""
+
+    def __init__(self):
+        self.auth_service = AuthService()
+        self.job_analyzer = JobAnalyzer()
+        self.resume_crud = ResumeCRUD()
+        self.job_crud = JobDescriptionCRUD()
+        self.match_crud = MatchAnalysisCRUD()
+
+    @staticmethod
+    def resume_sections(resume: Resume) -> Dict[str, Any]:
+        """Convert resume content to the section dict used for AI processing"""
+        return {
+            "summary": resume.content.summary,
+            "experience": [exp.dict() for exp in resume.content.experience],
+            "skills": resume.content.skills,
+            "education": [edu.dict() for edu in resume.content.education],
+            "projects": [proj.dict() for proj in resume.content.projects]
+        }
+
+    async def load_inputs(self, user_id: str, resume_id: str, job_description_id: str) -> Dict[str, Any]:
+        """Fetch the user's API key, resume and job description, raising HTTP errors for missing ones"""
+
+        # Get user's API key
+        user_api_key = await self.auth_service.get_user_api_key(user_id)
+        if not user_api_key:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="OpenAI API key not configured. Please set your API key first."
+            )
+
+        # Get resume and job description
+        resume = await self.resume_crud.get_resume(resume_id, user_id)
+        job_desc = await self.job_crud.get_job_description(job_description_id, user_id)
+
+        if not resume or not job_desc:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Resume or job description not found"
+            )
+
+        return {"user_api_key": user_api_key, "resume": resume, "job_desc": job_desc}
+
+    async def match_resume(
+        self,
+        user_id: str,
+        resume_id: str,
+        job_description_id: str,
+        bypass_cache: bool = False,
+        priority: str = INTERACTIVE,
+        inputs: Optional[Dict[str, Any]] = None,
+        on_progress: Optional[Callable[[str, Any], Awaitable[None]]] = None
+    ) -> MatchAnalysis:
+        """Generate suggestions, match score and ATS result, and store the run.
+
+        inputs are the result of load_inputs, when the caller has already
+        loaded them. With on_progress, suggestions are generated in streaming
+        order and each one is reported as ("suggestion", suggestion) as soon
+        as it is ready, followed by ("match_score", ...) and
+        ("ats_compliance", ...).
+        """
+
+        started = time.monotonic()
+
+        if inputs is None:
+            inputs = await self.load_inputs(user_id, resume_id, job_description_id)
+        user_api_key, resume, job_desc = inputs["user_api_key"], inputs["resume"], inputs["job_desc"]
+
+        resume_sections = self.resume_sections(resume)
+
+        # Suggestions from the last run on this pair are reused for unchanged bullets,
+        # including rejected ones, so a low-scoring bullet is not sent to the LLM again
+        previous_match = await self.match_crud.get_latest_match_analysis(resume_id, job_description_id)
+        previous_suggestions = (
+            previous_match.suggestions + previous_match.rejected_suggestions if previous_match else None
+        )
+
+        # Generate AI suggestions
+        interrupted = False
+        if on_progress is None:
+            suggestions = await ai_service.enhance_resume_content(
+                resume_sections=resume_sections,
+                job_description=job_desc.content,
+                user_api_key=user_api_key,
+                bypass_cache=bypass_cache,
+                previous_suggestions=previous_suggestions,
+                user_id=user_id,
+                priority=priority
+            )
+        else:
+            suggestions: List[AISuggestion] = []
+            try:
+                with telemetry.time_stage("stream_suggestions"):
+                    async for suggestion in ai_service.stream_resume_suggestions(
+                        resume_sections=resume_sections,
+                        job_description=job_desc.content,
+                        user_api_key=user_api_key,
+                        bypass_cache=bypass_cache,
+                        previous_suggestions=previous_suggestions,
+                        user_id=user_id,
+                        priority=priority
+                    ):
+                        suggestions.append(suggestion)
+                        if is_relevant(suggestion):
+                            await on_progress("suggestion", suggestion)
+            except CircuitOpenError:
+                # The circuit opened mid-run; bullets not enhanced yet are skipped
+                interrupted = True
+
+        # Calculate match score
+        with telemetry.time_stage("scoring"):
+            match_score = await self.job_analyzer.calculate_match_score(
+                resume_sections,
+                job_desc.content,
+                user_api_key=user_api_key
+            )
+        if on_progress is not None:
+            await on_progress("match_score", {
+                "resume_id": resume_id,
+                "job_description_id": job_description_id,
+                "overall_score": match_score,
+                "keyword_matches": job_desc.extracted_keywords
+            })
+
+        # Check ATS compliance
+        with telemetry.time_stage("ats_compliance"):
+            resume_text = await self.job_analyzer.convert_resume_to_text(resume.content)
+            ats_analysis = await ai_service.check_ats_compliance(
+                resume_text,
+                user_api_key=user_api_key,
+                keywords=job_desc.required_skills
+            )
+        if on_progress is not None:
+            await on_progress("ats_compliance", ats_analysis)
+
+        rejected = [s for s in suggestions if not is_relevant(s)]
+        suggestions = [s for s in suggestions if is_relevant(s)]
+
+        # Create match analysis
+        match_analysis = MatchAnalysis(
+            resume_id=resume_id,
+            job_description_id=job_description_id,
+            overall_score=match_score,
+            keyword_matches=job_desc.extracted_keywords,
+            missing_keywords=[],
+            suggestions=suggestions,
+            rejected_suggestions=rejected,
+            ats_compliance_score=ats_analysis.get("overall_score", 0),
+            is_degraded=interrupted or ai_service.is_degraded() or any(s.is_degraded for s in suggestions),
+            reused_suggestions=sum(1 for s in suggestions if s.is_reused),
+            regenerated_suggestions=sum(1 for s in suggestions if s.fingerprint and not s.is_reused)
+        )
+
+        match_analysis = await self.match_crud.create_match_analysis(match_analysis)
+        telemetry.observe_stage("match_resume", time.monotonic() - started)
+
+        return match_analysis
+
+
+match_service = MatchService()
@@ -0,0 +1,186 @@
+import asyncio
+import logging
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+import httpx
+import openai
+
+from app.config import settings
+from app.utils.helpers import hash_string
+
+logger = logging.getLogger(__name__)
+
+
+class OpenAIClientPool:
+    """Registry of warm AsyncOpenAI clients keyed by API key hash.
+
+    Each client keeps its own keep-alive connection pool, so reusing a
+    client across requests skips the TCP/TLS handshake. The registry is
+    bounded and evicts the least recently used client. Callers hold a
+    client through lease(), and an evicted client is only closed once its
+    last lease is released. Pinned clients (the server key's) are never
+    evicted.
+    """
+
+    def __init__(
+        self,
+        max_clients: int = 64,
+        base_url: Optional[str] = None,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        timeout: float = 30.0
+    ):
+        self.max_clients = max_clients
+        self.base_url = base_url
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.timeout = timeout
+        self._clients: "OrderedDict[str, openai.AsyncOpenAI]" = OrderedDict()
+        self._pinned: Dict[str, openai.AsyncOpenAI] = {}
+        self._leases: Dict[int, int] = {}
+        self._retired: Dict[int, openai.AsyncOpenAI] = {}
+        self._closing: set = set()
+        self.created = 0
+        self.reused = 0
+        self.evicted = 0
+
+    def get(self, api_key: str) -> openai.AsyncOpenAI:
+        """Return the pooled client for an API key, creating it if needed.
+
+        The client may be evicted and closed once the caller yields to the
+        event loop; use lease() to hold it across requests.
+        """
+        key_hash = hash_string(api_key)
+
+        client = self._pinned.get(key_hash)
+        if client is not None:
+            self.reused += 1
+            return client
+
+        client = self._clients.get(key_hash)
+        if client is not None:
+            self._clients.move_to_end(key_hash)
+            self.reused += 1
+            return client
+
+        client = self._create_client(api_key)
+        self._clients[key_hash] = client
+        self.created += 1
+
+        while len(self._clients) > self.max_clients:
+            _, evicted = self._clients.popitem(last=False)
+            self.evicted += 1
+            self._retire(evicted)
+
+        return client
+
+    def pin(self, api_key: str) -> openai.AsyncOpenAI:
+        """Return the client for an API key held for the life of the process, e.g. the server key's"""
+        key_hash = hash_string(api_key)
+        client = self._pinned.get(key_hash)
+        if client is None:
+            client = self._clients.pop(key_hash, None) or self._create_client(api_key)
+            self._pinned[key_hash] = client
+        return client
+
+    def unpin(self, api_key: str):
+        """Return a pinned client to the LRU registry"""
+        client = self._pinned.pop(hash_string(api_key), None)
+        if client is not None:
+            self._clients[hash_string(api_key)] = client
+            while len(self._clients) > self.max_clients:
+                _, evicted = self._clients.popitem(last=False)
+                self.evicted += 1
+                self._retire(evicted)
+
+    @asynccontextmanager
+    async def lease(self, api_key: str) -> AsyncIterator[openai.AsyncOpenAI]:
+        """Hold the client for an API key; it is not closed while any lease is open"""
+        client = self.get(api_key)
+        self._leases[id(client)] = self._leases.get(id(client), 0) + 1
+        try:
+            yield client
+        finally:
+            remaining = self._leases.pop(id(client)) - 1
+            if remaining:
+                self._leases[id(client)] = remaining
+            elif self._retired.pop(id(client), None) is not None:
+                self._schedule_close(client)
+
+    async def close_all(self):
+        """Close every pooled client, e.g. on application shutdown"""
+        clients = list(self._clients.values()) + list(self._pinned.values()) + list(self._retired.values())
+        self._clients.clear()
+        self._pinned.clear()
+        self._retired.clear()
+
+        # Let closes already under way finish
+        await asyncio.gather(*self._closing, return_exceptions=True)
+
+        for client in clients:
+            await self._close_client(client)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return pool size and reuse counters"""
+        return {
+            "clients": len(self._clients),
+            "max_clients": self.max_clients,
+            "pinned": len(self._pinned),
+            "leased": len(self._leases),
+            "awaiting_close": len(self._retired),
+            "created": self.created,
+            "reused": self.reused,
+            "evicted": self.evicted
+        }
+
+    def _create_client(self, api_key: str) -> openai.AsyncOpenAI:
+        # Retries are owned by the rate-limit scheduler, so the SDK's own are disabled
+        return openai.AsyncOpenAI(
+            api_key=api_key,
+            base_url=self.base_url,
+            max_retries=0,
+            timeout=self.timeout,
+            http_client=httpx.AsyncClient(limits=self.limits)
+        )
+
+    def _retire(self, client: openai.AsyncOpenAI):
+        # Close now unless a lease still holds the client; the last release closes it
+        if self._leases.get(id(client)):
+            self._retired[id(client)] = client
+        else:
+            self._schedule_close(client)
+
+    def _schedule_close(self, client: openai.AsyncOpenAI):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop yet (e.g. at import time); nothing can be in flight
+            asyncio.run(self._close_client(client))
+            return
+
+        task = loop.create_task(self._close_client(client))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _close_client(self, client: openai.AsyncOpenAI):
+        try:
+            await client.close()
+        except Exception as e:
+            logger.warning(f"Failed to close OpenAI client: {str(e)}")
+
+
+# Shared by every AIService instance
+openai_client_pool = OpenAIClientPool(
+    max_clients=settings.OPENAI_CLIENT_POOL_SIZE,
+    base_url=settings.OPENAI_BASE_URL,
+    max_connections=settings.OPENAI_MAX_CONNECTIONS,
+    max_keepalive_connections=settings.OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry=settings.OPENAI_KEEPALIVE_EXPIRY,
+    timeout=settings.OPENAI_TIMEOUT_SECONDS
+)
@@ -0,0 +1,78 @@
+import json
+from typing import Any, Dict, Optional
+
+from app.config import settings
+from app.services.llm_cache import LLMResponseCache
+from app.services.skill_matcher import skill_matcher
+from app.utils.helpers import hash_string
+
+# Bump whenever extraction or parsing changes what a given file parses to
+PARSER_VERSION = "4"
+
+
+class ParseResultCache:
+    """Parse results keyed by the SHA-256 of the uploaded bytes.
+
+    The key also covers PARSER_VERSION, the PDF engine order and the skills
+    dictionary, so a parser change never serves results produced by the
+    old code. Each entry records how long the original parse took, which
+    is counted as time saved whenever the entry is reused.
+    """
+
+    def __init__(self, store: Optional[LLMResponseCache] = None):
+        self.store = store
+        self.hits = 0
+        self.misses = 0
+        self.seconds_saved = 0.0
+
+    def make_key(self, content_hash: str, file_ext: str) -> str:
+        """Build the cache key for a file's content under the current parser"""
+        return hash_string(json.dumps([
+            PARSER_VERSION,
+            list(settings.PDF_ENGINES),
+            skill_matcher.fingerprint,
+            file_ext.lower(),
+            content_hash
+        ]))
+
+    async def get(self, content_hash: str, file_ext: str) -> Optional[Dict[str, Any]]:
+        """Return a cached parse result, if any"""
+        if self.store is None:
+            return None
+
+        cached = await self.store.get(self.make_key(content_hash, file_ext))
+        if cached is None:
+            self.misses += 1
+            return None
+
+        result = json.loads(cached)
+        self.hits += 1
+        self.seconds_saved += result.get("parse_seconds", 0.0)
+        return result
+
+    async def set(self, content_hash: str, file_ext: str, result: Dict[str, Any]):
+        """Store a parse result"""
+        if self.store is None:
+            return
+
+        await self.store.set(self.make_key(content_hash, file_ext), json.dumps(result))
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.store is not None,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "seconds_saved": round(self.seconds_saved, 3),
+            "store": self.store.stats() if self.store is not None else {}
+        }
+
+
+parse_result_cache = ParseResultCache(
+    store=LLMResponseCache(
+        max_entries=settings.PARSE_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.PARSE_CACHE_TTL_SECONDS,
+        db_path=settings.PARSE_CACHE_DB_PATH
+    ) if settings.PARSE_CACHE_ENABLED else None
+)
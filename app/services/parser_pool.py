@@ -0,0 +1,213 @@
+import asyncio
+import importlib
+import logging
+import multiprocessing
+import pickle
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ParserPoolFullError(Exception):
+    """Raised when a parse is submitted while the pool's queue is at capacity"""
+
+
+class ParserTimeoutError(Exception):
+    """Raised when a parse runs past the per-file timeout; its worker is killed"""
+
+
+class ParserWorkerError(Exception):
+    """Raised when a worker process dies in the middle of a parse"""
+
+
+def _worker_main(conn, warm_modules: Sequence[str]):
+    # Import the heavy parsing libraries once, before the first file arrives
+    for module in warm_modules:
+        importlib.import_module(module)
+
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            return
+        if task is None:
+            return
+
+        func, args = task
+        try:
+            conn.send((True, func(*args)))
+        except Exception as e:
+            try:
+                conn.send((False, e))
+            except (pickle.PicklingError, TypeError, AttributeError):
+                conn.send((False, RuntimeError(f"{type(e).__name__}: {str(e)}")))
+
+
+class _Worker:
+    def __init__(self, context, warm_modules: Sequence[str]):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn, tuple(warm_modules)), daemon=True)
+        self.process.start()
+        child_conn.close()
+
+    def kill(self):
+        self.conn.close()
+        self.process.kill()
+        self.process.join(1)
+
+
+class ParserPool:
+    """Pool of warm worker processes that run CPU-bound parsing off the event loop.
+
+    Each worker imports warm_modules when it starts, so the first upload
+    does not pay for importing PyPDF2 and python-docx. A worker handles
+    one file at a time; a parse that runs past timeout seconds has its
+    worker killed and replaced, so a pathological file cannot hold a
+    slot forever. With workers=0 parses run in a thread instead, which
+    keeps the loop free but cannot enforce the timeout; use it for
+    development only.
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        max_pending: int = 100,
+        timeout: float = 30.0,
+        warm_modules: Sequence[str] = ()
+    ):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.warm_modules = tuple(warm_modules)
+        # Spawned workers do not inherit the parent's event loop, threads or locks
+        self._context = multiprocessing.get_context("spawn")
+        self._idle: Optional[asyncio.Queue] = None
+        self._respawning: set = set()
+        # Workers checked out for a parse, so stop() can reach them
+        self._busy: set = set()
+        self.pending = 0
+        self.completed = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.restarts = 0
+
+    def start(self):
+        """Start the worker processes; called at startup so they are warm before the first upload"""
+        if self._idle is not None or self.workers <= 0:
+            return
+
+        self._idle = asyncio.Queue()
+        for _ in range(self.workers):
+            self._idle.put_nowait(_Worker(self._context, self.warm_modules))
+        logger.info(f"Parser pool started with {self.workers} workers")
+
+    async def stop(self):
+        """Ask idle workers to exit and kill any still busy"""
+        if self._idle is None:
+            return
+
+        idle, self._idle = self._idle, None
+        await asyncio.gather(*self._respawning, return_exceptions=True)
+
+        # Their parses fail with ParserWorkerError; _replace then closes the pipes
+        for worker in list(self._busy):
+            worker.process.kill()
+            await asyncio.to_thread(worker.process.join, 5)
+
+        while not idle.empty():
+            worker = idle.get_nowait()
+            try:
+                worker.conn.send(None)
+            except OSError:
+                pass
+            await asyncio.to_thread(worker.process.join, 5)
+            await asyncio.to_thread(worker.kill)
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run func(*args) in a worker; func and its arguments must be picklable"""
+        if self.pending >= self.max_pending:
+            raise ParserPoolFullError("Too many files are waiting to be parsed; try again later")
+
+        self.pending += 1
+        try:
+            if self.workers <= 0:
+                result = await asyncio.to_thread(func, *args)
+            else:
+                result = await self._run_in_worker(func, args)
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.pending -= 1
+
+        self.completed += 1
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "idle": self._idle.qsize() if self._idle is not None else 0,
+            "pending": self.pending,
+            "max_pending": self.max_pending,
+            "completed": self.completed,
+            "failed": self.failed,
+            "timeouts": self.timeouts,
+            "restarts": self.restarts
+        }
+
+    async def _run_in_worker(self, func: Callable[..., Any], args: tuple) -> Any:
+        self.start()
+        idle = self._idle
+        worker = await idle.get()
+        self._busy.add(worker)
+        answered = False
+        try:
+            worker.conn.send((func, args))
+            ready = await asyncio.to_thread(worker.conn.poll, self.timeout)
+            if not ready:
+                self.timeouts += 1
+                raise ParserTimeoutError(f"Parsing took longer than {self.timeout:g} seconds")
+
+            try:
+                ok, value = worker.conn.recv()
+            except (EOFError, OSError) as e:
+                raise ParserWorkerError(f"Parser worker exited unexpectedly: {str(e)}")
+            answered = True
+        finally:
+            self._busy.discard(worker)
+            if answered:
+                idle.put_nowait(worker)
+            else:
+                # Timed out, crashed or cancelled mid-parse: the worker may still be busy
+                # or hold a stale reply, so it is replaced rather than reused. Killing and
+                # spawning block, so they run in a thread without holding up the caller
+                task = asyncio.get_running_loop().create_task(self._replace(worker, idle))
+                self._respawning.add(task)
+                task.add_done_callback(self._respawning.discard)
+
+        if not ok:
+            raise value
+        return value
+
+    async def _replace(self, worker: _Worker, idle: asyncio.Queue):
+        await asyncio.to_thread(worker.kill)
+        if self._idle is not idle:
+            # The pool was stopped; nothing to replace it for
+            return
+        replacement = await asyncio.to_thread(_Worker, self._context, self.warm_modules)
+        self.restarts += 1
+        if self._idle is idle:
+            idle.put_nowait(replacement)
+        else:
+            # The pool was stopped while the replacement was starting
+            await asyncio.to_thread(replacement.kill)
+
+
+parser_pool = ParserPool(
+    workers=settings.PARSER_POOL_WORKERS,
+    max_pending=settings.PARSER_POOL_MAX_PENDING,
+    timeout=settings.PARSER_TIMEOUT_SECONDS,
+    warm_modules=("app.services.resume_parser",)
+)
@@ -1,42 +1,238 @@
 import os
+import time
+from abc import ABC, abstractmethod
 import PyPDF2
 import docx
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 import re
 
+try:
+    import pymupdf
+except ImportError:
+    try:
+        import fitz as pymupdf  # Releases before 1.24 only ship the fitz name
+    except ImportError:
+        pymupdf = None
+
+try:
+    import pdfplumber
+except ImportError:
+    pdfplumber = None
+
+from app.config import settings
 from app.models.resume import PersonalInfo, Experience, Education, ResumeContent
+from app.services.parse_cache import parse_result_cache
+from app.services.parser_pool import parser_pool
+from app.services.section_segmenter import segment_sections
+from app.services.single_flight import SingleFlight
+from app.services.skill_matcher import skill_matcher
+from app.services.telemetry import Histogram, LATENCY_BUCKETS
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.docx', '.doc')
+
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PHONE_PATTERN = re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b|\(\d{3}\)\s*\d{3}[-.]?\d{4}')
+BULLET_CHARS = '•-*'
+
+
+class PDFEngine(ABC):
+    """Extracts the text of a PDF; raises when the file cannot be read"""
+
+    name = ""
+    module = None
+
+    @property
+    def available(self) -> bool:
+        return self.module is not None
+
+    @abstractmethod
+    def extract(self, file_path: str) -> str:
+        ...
+
+
+class PyMuPDFEngine(PDFEngine):
+    """MuPDF bindings; the fastest engine by a wide margin"""
+
+    name = "pymupdf"
+    module = pymupdf
+
+    def extract(self, file_path: str) -> str:
+        with pymupdf.open(file_path) as document:
+            return "\n".join(page.get_text() for page in document)
+
+
+class PdfPlumberEngine(PDFEngine):
+    """Slower, but rebuilds reading order from character positions on multi-column layouts"""
+
+    name = "pdfplumber"
+    module = pdfplumber
+
+    def extract(self, file_path: str) -> str:
+        with pdfplumber.open(file_path) as pdf:
+            return "\n".join(page.extract_text() or "" for page in pdf.pages)
+
+
+class PyPDF2Engine(PDFEngine):
+    """Pure Python; last resort"""
+
+    name = "pypdf2"
+    module = PyPDF2
+
+    def extract(self, file_path: str) -> str:
+        text = ""
+        with open(file_path, 'rb') as file:
+            pdf_reader = PyPDF2.PdfReader(file)
+            for page in pdf_reader.pages:
+                text += page.extract_text() + "\n"
+        return text
+
+
+PDF_ENGINES = {engine.name: engine for engine in (PyMuPDFEngine(), PdfPlumberEngine(), PyPDF2Engine())}
+
+
+class ExtractionMetrics:
+    """Which engine produced each upload's text, and how long extraction took per engine"""
 
-class ResumeParser:
     def __init__(self):
-        pass
+        self.wins: Dict[str, int] = {}
+        self.fallbacks = 0
+        self.seconds: Dict[str, Histogram] = {}
+
+    def record(self, extraction: Dict[str, Any]):
+        engine = extraction["engine"]
+        self.wins[engine] = self.wins.get(engine, 0) + 1
+        if len(extraction["attempts"]) > 1:
+            self.fallbacks += 1
+
+        for attempt in extraction["attempts"]:
+            histogram = self.seconds.get(attempt["engine"])
+            if histogram is None:
+                histogram = Histogram(LATENCY_BUCKETS)
+                self.seconds[attempt["engine"]] = histogram
+            histogram.observe(attempt["seconds"])
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "wins": dict(self.wins),
+            "fallbacks": self.fallbacks,
+            "seconds": {engine: histogram.snapshot() for engine, histogram in sorted(self.seconds.items())}
+        }
+
+
+extraction_metrics = ExtractionMetrics()
+
+# Coalesces concurrent parses of the same file content within this process
+parse_flights = SingleFlight()
+
+
+def parse_resume_file(file_path: str, file_ext: str) -> Dict[str, Any]:
+    """Entry point run inside parser pool workers"""
+    return ResumeParser().parse_file(file_path, file_ext)
+
+
+class ResumeParser:
+    def __init__(self, pdf_engines: Optional[Sequence[str]] = None):
+        names = settings.PDF_ENGINES if pdf_engines is None else pdf_engines
+        unknown = [name for name in names if name not in PDF_ENGINES]
+        if unknown:
+            raise ValueError(f"Unknown PDF engines: {', '.join(unknown)}")
+        self.pdf_engines = [PDF_ENGINES[name] for name in names]
+
+    async def parse_resume(self, file_path: str, file_ext: str, content_hash: Optional[str] = None) -> Dict[str, Any]:
+        """Parse resume file in the parser pool, off the event loop.
+
+        Returns the structured data under "parsed_content" and how the text
+        was extracted (winning engine, seconds, attempts) under "extraction".
+        With the file's content_hash, earlier results for the same bytes are
+        reused and "cached" is true.
+        """
+
+        if file_ext.lower() not in SUPPORTED_EXTENSIONS:
+            raise ValueError(f"Unsupported file format: {file_ext}")
+
+        if content_hash is None:
+            return await self._parse_in_pool(file_path, file_ext)
+
+        cached = await parse_result_cache.get(content_hash, file_ext)
+        if cached is not None:
+            return {**cached, "cached": True}
+
+        async def parse():
+            result = await self._parse_in_pool(file_path, file_ext)
+            await parse_result_cache.set(content_hash, file_ext, result)
+            return result
+
+        # Concurrent uploads of the same file share one parse
+        return await parse_flights.do(parse_result_cache.make_key(content_hash, file_ext), parse)
 
-    async def parse_resume(self, file_path: str, file_ext: str) -> Dict[str, Any]:
-        """Parse resume file and extract structured data"""
+    async def _parse_in_pool(self, file_path: str, file_ext: str) -> Dict[str, Any]:
+        started = time.perf_counter()
+        result = await parser_pool.run(parse_resume_file, file_path, file_ext)
+        extraction_metrics.record(result["extraction"])
+        return {**result, "parse_seconds": round(time.perf_counter() - started, 4), "cached": False}
+
+    def parse_file(self, file_path: str, file_ext: str) -> Dict[str, Any]:
+        """Parse resume file synchronously; CPU bound, so callers on the event loop use parse_resume"""
 
         if file_ext.lower() == '.pdf':
-            text = self._extract_pdf_text(file_path)
+            text, extraction = self._extract_pdf_text(file_path)
         elif file_ext.lower() in ['.docx', '.doc']:
+            started = time.perf_counter()
             text = self._extract_docx_text(file_path)
+            seconds = round(time.perf_counter() - started, 4)
+            extraction = {
+                "engine": "python-docx",
+                "seconds": seconds,
+                "attempts": [{"engine": "python-docx", "seconds": seconds, "chars": len(text)}]
+            }
         else:
             raise ValueError(f"Unsupported file format: {file_ext}")
 
         # Parse the extracted text
         parsed_data = self._parse_text_content(text)
 
-        return parsed_data
+        return {"parsed_content": parsed_data, "extraction": extraction}
 
-    def _extract_pdf_text(self, file_path: str) -> str:
-        """Extract text from PDF file"""
-        text = ""
-        try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-        except Exception as e:
-            raise Exception(f"Failed to extract PDF text: {str(e)}")
+    def _extract_pdf_text(self, file_path: str) -> Tuple[str, Dict[str, Any]]:
+        """Extract text from PDF file with the first engine that returns any text"""
+        attempts = []
+        fallback: Optional[Tuple[str, str]] = None
 
-        return text
+        for engine in self.pdf_engines:
+            if not engine.available:
+                continue
+
+            started = time.perf_counter()
+            try:
+                text = engine.extract(file_path)
+            except Exception as e:
+                attempts.append({
+                    "engine": engine.name,
+                    "seconds": round(time.perf_counter() - started, 4),
+                    "error": str(e)
+                })
+                continue
+
+            attempts.append({"engine": engine.name, "seconds": round(time.perf_counter() - started, 4), "chars": len(text)})
+            if text.strip():
+                return text, self._extraction(engine.name, attempts)
+            # Scanned or image-only pages: try the next engine, but keep the empty result
+            if fallback is None:
+                fallback = (text, engine.name)
+
+        if fallback is not None:
+            return fallback[0], self._extraction(fallback[1], attempts)
+
+        errors = "; ".join(f"{a['engine']}: {a['error']}" for a in attempts) or "no PDF engine is installed"
+        raise Exception(f"Failed to extract PDF text: {errors}")
+
+    @staticmethod
+    def _extraction(engine: str, attempts: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {
+            "engine": engine,
+            "seconds": round(sum(attempt["seconds"] for attempt in attempts), 4),
+            "attempts": attempts
+        }
 
     def _extract_docx_text(self, file_path: str) -> str:
         """Extract text from DOCX file"""
@@ -53,37 +249,37 @@ class ResumeParser:
     def _parse_text_content(self, text: str) -> Dict[str, Any]:
         """Parse extracted text into structured data"""
 
+        # One pass finds every section; each extractor only reads its own lines
+        sections = segment_sections(text)
+
         # Simple text parsing - in production, you'd use more sophisticated NLP
         parsed_data = {
-            "personal_info": self._extract_personal_info(text),
-            "summary": self._extract_summary(text),
-            "experience": self._extract_experience(text),
-            "education": self._extract_education(text),
+            "personal_info": self._extract_personal_info(text, sections.header()),
+            "summary": self._extract_summary(sections.lines("summary")),
+            "experience": self._extract_experience(sections.lines("experience")),
+            "education": self._extract_education(sections.text("education") if sections.has("education") else text),
+            # Skills named in experience bullets count too, so the whole text is matched
             "skills": self._extract_skills(text),
-            "projects": [],
-            "certifications": [],
+            "projects": self._extract_projects(sections.lines("projects")),
+            "certifications": self._extract_certifications(sections.lines("certifications")),
             "languages": []
         }
 
         return parsed_data
 
-    def _extract_personal_info(self, text: str) -> Dict[str, str]:
-        """Extract personal information from text"""
-
-        # Email regex
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        email_match = re.search(email_pattern, text)
+    def _extract_personal_info(self, text: str, header: List[str]) -> Dict[str, str]:
+        """Extract personal information from the lines above the first section, then the whole text"""
 
-        # Phone regex
-        phone_pattern = r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b|\(\d{3}\)\s*\d{3}[-.]?\d{4}'
-        phone_match = re.search(phone_pattern, text)
+        header_text = "\n".join(header)
+        email_match = EMAIL_PATTERN.search(header_text) or EMAIL_PATTERN.search(text)
+        phone_match = PHONE_PATTERN.search(header_text) or PHONE_PATTERN.search(text)
 
         # Extract name (first line that's not email/phone)
-        lines = text.split('\n')
+        lines = header if header else text.split('\n')
         name = ""
         for line in lines[:5]:  # Check first 5 lines
             line = line.strip()
-            if line and not re.search(email_pattern, line) and not re.search(phone_pattern, line):
+            if line and not EMAIL_PATTERN.search(line) and not PHONE_PATTERN.search(line):
                 if len(line.split()) >= 2:  # Likely a name
                     name = line
                     break
@@ -97,86 +293,69 @@ class ResumeParser:
             "github": ""
         }
 
-    def _extract_summary(self, text: str) -> str:
+    def _extract_summary(self, lines: List[str]) -> str:
         """Extract professional summary"""
+        return " ".join(line.strip() for line in lines if line.strip())
 
-        # Look for summary/objective section
-        summary_keywords = ['summary', 'objective', 'profile', 'about']
-        lines = text.split('\n')
-
-        summary_text = ""
-        in_summary = False
-
-        for i, line in enumerate(lines):
-            line_lower = line.lower().strip()
-
-            # Check if this line is a summary header
-            if any(keyword in line_lower for keyword in summary_keywords):
-                in_summary = True
-                continue
-
-            # If we're in summary section
-            if in_summary:
-                # Stop if we hit another section
-                if line.isupper() and len(line.strip()) > 0:
-                    break
-
-                if line.strip():
-                    summary_text += line.strip() + " "
-
-                # Stop after a few lines or if we hit a blank line followed by caps
-                if i < len(lines) - 1 and not lines[i + 1].strip() and i < len(lines) - 2:
-                    if lines[i + 2].isupper():
-                        break
-
-        return summary_text.strip()
-
-    def _extract_experience(self, text: str) -> List[Dict[str, Any]]:
+    def _extract_experience(self, lines: List[str]) -> List[Dict[str, Any]]:
         """Extract work experience"""
 
         # Simple extraction - look for patterns
         experience = []
-
-        # This is a simplified version - real implementation would be more sophisticated
-        lines = text.split('\n')
         current_job = {}
-        in_experience = False
 
         for line in lines:
             line = line.strip()
             if not line:
                 continue
 
-            # Check for experience section
-            if 'experience' in line.lower() or 'employment' in line.lower():
-                in_experience = True
-                continue
-
-            if in_experience:
-                # Look for job titles (simple heuristic)
-                if any(word in line.lower() for word in ['engineer', 'developer', 'manager', 'analyst', 'specialist']):
-                    if current_job:
-                        experience.append(current_job)
-
-                    current_job = {
-                        "title": line,
-                        "company": "",
-                        "location": "",
-                        "start_date": "",
-                        "end_date": "",
-                        "bullets": []
-                    }
-
-                # Look for bullet points
-                elif line.startswith('•') or line.startswith('-') or line.startswith('*'):
-                    if current_job:
-                        current_job["bullets"].append(line[1:].strip())
+            # Look for job titles (simple heuristic)
+            if any(word in line.lower() for word in ['engineer', 'developer', 'manager', 'analyst', 'specialist']):
+                if current_job:
+                    experience.append(current_job)
+
+                current_job = {
+                    "title": line,
+                    "company": "",
+                    "location": "",
+                    "start_date": "",
+                    "end_date": "",
+                    "bullets": []
+                }
+
+            # Look for bullet points
+            elif line[0] in BULLET_CHARS:
+                if current_job:
+                    current_job["bullets"].append(line[1:].strip())
 
         if current_job:
             experience.append(current_job)
 
         return experience
 
+    def _extract_projects(self, lines: List[str]) -> List[Dict[str, Any]]:
+        """Extract projects: a plain line names a project, bullets below it describe it"""
+
+        projects = []
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+
+            if line[0] in BULLET_CHARS:
+                if projects:
+                    projects[-1]["bullets"].append(line[1:].strip())
+            elif projects and not projects[-1]["description"] and not projects[-1]["bullets"]:
+                projects[-1]["description"] = line
+            else:
+                projects.append({"name": line, "description": "", "technologies": [], "url": None, "bullets": []})
+
+        return projects
+
+    def _extract_certifications(self, lines: List[str]) -> List[str]:
+        """Extract certifications, one per line"""
+        return [line.strip().lstrip(BULLET_CHARS).strip() for line in lines if line.strip()]
+
     def _extract_education(self, text: str) -> List[Dict[str, Any]]:
         """Extract education information"""
 
@@ -196,19 +375,4 @@ class ResumeParser:
 
     def _extract_skills(self, text: str) -> List[str]:
         """Extract skills"""
-
-        # Common technical skills
-        common_skills = [
-            'python', 'java', 'javascript', 'react', 'node.js', 'sql', 'aws', 'docker',
-            'kubernetes', 'git', 'html', 'css', 'mongodb', 'postgresql', 'linux',
-            'machine learning', 'data analysis', 'project management', 'agile'
-        ]
-
-        found_skills = []
-        text_lower = text.lower()
-
-        for skill in common_skills:
-            if skill in text_lower:
-                found_skills.append(skill.title())
-
-        return found_skills
+        return skill_matcher.find(text)
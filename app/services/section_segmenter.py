@@ -0,0 +1,116 @@
+import re
+from typing import Dict, List, Optional, Tuple
+
+# Heading text (lowercase, without trailing colon) -> canonical section
+SECTION_HEADINGS: Dict[str, str] = {}
+for _section, _headings in {
+    "summary": (
+        "summary", "professional summary", "career summary", "executive summary", "objective",
+        "career objective", "profile", "professional profile", "about", "about me"
+    ),
+    "experience": (
+        "experience", "work experience", "professional experience", "relevant experience",
+        "employment", "employment history", "work history", "career history"
+    ),
+    "education": ("education", "education and training", "academic background", "academic history"),
+    "skills": (
+        "skills", "technical skills", "core skills", "key skills", "skills and tools",
+        "core competencies", "competencies"
+    ),
+    "projects": ("projects", "personal projects", "selected projects", "key projects", "academic projects"),
+    "certifications": (
+        "certifications", "certification", "certificates", "licenses", "licenses and certifications",
+        "licenses & certifications", "certifications and licenses"
+    ),
+    # Sections the parser does not extract; they still end the section before them
+    "other": (
+        "awards", "honors", "honors and awards", "awards and honors", "achievements", "publications",
+        "volunteer", "volunteering", "volunteer experience", "interests", "hobbies", "references",
+        "languages", "activities", "leadership", "affiliations", "memberships", "courses", "training"
+    ),
+}.items():
+    for _heading in _headings:
+        SECTION_HEADINGS[_heading] = _section
+
+HEADING_MAX_LENGTH = max(len(heading) for heading in SECTION_HEADINGS) + 4
+
+_HEADING_STRIP = " \t:-–—|•*#=_"
+_WHITESPACE = re.compile(r"\s+")
+
+
+def classify_heading(line: str) -> Tuple[Optional[str], str]:
+    """Section a line opens and any content after "Heading:"; (None, "") for ordinary lines"""
+    stripped = line.strip()
+    if not stripped:
+        return None, ""
+
+    label, separator, rest = stripped.partition(":")
+    if len(label) <= HEADING_MAX_LENGTH:
+        section = SECTION_HEADINGS.get(_WHITESPACE.sub(" ", label.strip(_HEADING_STRIP).lower()))
+        if section is not None:
+            return section, rest.strip() if separator else ""
+
+    return None, ""
+
+
+class ResumeSections:
+    """Lines of a resume and the spans each section covers.
+
+    Spans are half-open (start, end) line ranges that exclude the heading
+    line itself. A section that appears more than once (e.g. two Experience
+    blocks) has several spans; lines() returns them concatenated.
+    """
+
+    def __init__(self, lines: List[str], header_end: int, spans: Dict[str, List[Tuple[int, int]]], inline: Dict[int, str]):
+        self.all_lines = lines
+        self.header_end = header_end
+        self.spans = spans
+        self._inline = inline
+
+    def header(self) -> List[str]:
+        """Lines before the first heading; usually name and contact details"""
+        return self.all_lines[:self.header_end]
+
+    def has(self, section: str) -> bool:
+        return section in self.spans
+
+    def lines(self, section: str) -> List[str]:
+        result = []
+        for start, end in self.spans.get(section, []):
+            # "Skills: Python, SQL" keeps its content on the heading line
+            if start - 1 in self._inline:
+                result.append(self._inline[start - 1])
+            result.extend(self.all_lines[start:end])
+        return result
+
+    def text(self, section: str) -> str:
+        return "\n".join(self.lines(section))
+
+
+def segment_sections(text: str) -> ResumeSections:
+    """Split resume text into sections in a single pass over its lines"""
+    lines = text.split("\n")
+    spans: Dict[str, List[Tuple[int, int]]] = {}
+    inline: Dict[int, str] = {}
+    header_end = len(lines)
+    current: Optional[str] = None
+    current_start = 0
+
+    for index, line in enumerate(lines):
+        section, rest = classify_heading(line)
+        if section is None:
+            continue
+
+        if current is None:
+            header_end = index
+        else:
+            spans.setdefault(current, []).append((current_start, index))
+
+        current, current_start = section, index + 1
+        if rest:
+            inline[index] = rest
+
+    if current is not None:
+        spans.setdefault(current, []).append((current_start, len(lines)))
+
+    return ResumeSections(lines, header_end, spans, inline)
@@ -0,0 +1,64 @@
+import asyncio
+import copy
+from typing import Any, Awaitable, Callable, Dict
+
+
+class _Flight:
+    def __init__(self, task: asyncio.Future):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into one execution.
+
+    The first caller for a key starts the work; callers arriving while it
+    is in flight await the same result, each getting its own deep copy so
+    one caller changing it cannot affect another. Errors are raised to
+    every waiter.
+    A waiter that is cancelled only stops waiting; the shared work is
+    cancelled once no waiters are left.
+    """
+
+    def __init__(self):
+        self._flights: Dict[str, _Flight] = {}
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run fn() unless an identical call is already in flight, and return its result"""
+        flight = self._flights.get(key)
+
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(fn()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _, flight=flight: self._forget(key, flight))
+            self.executions += 1
+        else:
+            self.coalesced += 1
+
+        flight.waiters += 1
+        try:
+            # shield keeps one waiter's cancellation from cancelling the shared task
+            return copy.deepcopy(await asyncio.shield(flight.task))
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Forget the flight now, not when the task finishes cancelling,
+                # so a caller arriving in between starts fresh work
+                self._forget(key, flight)
+                flight.task.cancel()
+
+    def in_flight(self) -> int:
+        return len(self._flights)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._flights)
+        }
+
+    def _forget(self, key: str, flight: _Flight):
+        if self._flights.get(key) is flight:
+            del self._flights[key]
@@ -0,0 +1,151 @@
+import logging
+import re
+from collections import deque
+from typing import Dict, Iterable, List, Optional
+
+from app.config import settings
+from app.utils.constants import AMBIGUOUS_SKILLS, SKILLS_DICTIONARY
+from app.utils.helpers import hash_string
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize(text: str) -> str:
+    """Lowercase and collapse whitespace, so skills wrapped across PDF lines still match"""
+    return _collapse(text).lower()
+
+
+def _collapse(text: str) -> str:
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def _is_word_char(ch: str) -> bool:
+    # + and # are part of words so "C" does not match in "C++" or "C#"
+    return ch.isalnum() or ch in "+#"
+
+
+class SkillMatcher:
+    """Finds every dictionary skill in a text in one pass (Aho-Corasick).
+
+    The automaton is built once from the skills; matching is linear in the
+    length of the text no matter how many skills the dictionary holds.
+    Matches must sit on word boundaries, so "git" does not match inside
+    "digital" nor "java" inside "javascript". Ambiguous skills, ones that
+    are also everyday words, match only in their dictionary casing and
+    only when another skill is found in the same text.
+
+    At the built-in dictionary size a plain substring loop is faster
+    (about 0.4 ms against 2-3 ms on a two-page resume), but it ignores word
+    boundaries, and a boundary-aware regex grows with the dictionary
+    (about 1 ms at 58 skills, 85 ms at 10k). SKILLS_DICTIONARY_PATH lets
+    deployments add thousands of skills, so the flat cost wins; see
+    scripts/benchmark_skill_matcher.py.
+    """
+
+    def __init__(self, skills: Iterable[str], ambiguous: Iterable[str] = ()):
+        self.skills: List[str] = []
+        self._lengths: List[int] = []
+        # Dictionary spelling an ambiguous skill must match exactly, by skill id
+        self._exact: Dict[int, str] = {}
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+
+        ambiguous_keys = {normalize(skill) for skill in ambiguous}
+        seen = set()
+        for skill in skills:
+            key = normalize(skill)
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            if key in ambiguous_keys:
+                self._exact[len(self.skills)] = _collapse(skill)
+            self._add(key, len(self.skills))
+            self.skills.append(skill.strip())
+            self._lengths.append(len(key))
+
+        self._build_failure_links()
+        # Identifies the dictionary, for caches of results derived from it
+        exact = sorted(self._exact.values())
+        self.fingerprint = hash_string("\n".join(self.skills) + ("\nambiguous:" + ",".join(exact) if exact else ""))
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    def find(self, text: str, limit: Optional[int] = None) -> List[str]:
+        """Skills found in text, in the order they first appear"""
+        original = _collapse(text)
+        text = original.lower()
+        if len(text) != len(original):
+            # A few characters change length when lowercased; offsets would no longer line up
+            original = text
+        goto, fail, output, lengths, exact = self._goto, self._fail, self._output, self._lengths, self._exact
+        first_seen: Dict[int, int] = {}
+        state = 0
+
+        for end, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+
+            for skill_id in output[state]:
+                if skill_id in first_seen:
+                    continue
+                start = end - lengths[skill_id] + 1
+                if start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if end + 1 < len(text) and _is_word_char(text[end + 1]):
+                    continue
+                if skill_id in exact and original[start:end + 1] != exact[skill_id]:
+                    continue
+                first_seen[skill_id] = start
+
+        if all(skill_id in exact for skill_id in first_seen):
+            # "Swift" alone in a text with no other skill is most likely the word
+            first_seen = {}
+
+        found = [self.skills[skill_id] for skill_id in sorted(first_seen, key=first_seen.get)]
+        return found[:limit] if limit is not None else found
+
+    def _add(self, key: str, skill_id: int):
+        state = 0
+        for ch in key:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][ch] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(skill_id)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(ch, 0)
+                # Skills that are suffixes of this one also end here
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+                queue.append(next_state)
+
+
+def load_skills(path: Optional[str] = None) -> List[str]:
+    """Built-in skills plus one skill per line from path"""
+    skills = list(SKILLS_DICTIONARY)
+    if path:
+        try:
+            with open(path, encoding="utf-8") as file:
+                skills.extend(line.strip() for line in file if line.strip() and not line.startswith("#"))
+        except OSError as e:
+            logger.error(f"Could not read skills dictionary {path}: {str(e)}")
+    return skills
+
+
+skill_matcher = SkillMatcher(load_skills(settings.SKILLS_DICTIONARY_PATH), ambiguous=AMBIGUOUS_SKILLS)
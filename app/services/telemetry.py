@@ -0,0 +1,189 @@
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple
+
+from app.config import settings
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)  # seconds
+TOKEN_BUCKETS = (50, 100, 250, 500, 1000, 2000, 4000, 8000, 16000)
+COST_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1)  # USD
+
+
+class Histogram:
+    """Fixed-bucket histogram with count and sum, in the Prometheus style"""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                return
+        self.counts[-1] += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-th quantile"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def snapshot(self) -> Dict[str, Any]:
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        buckets["+Inf"] = self.count
+
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "mean": round(self.sum / self.count, 6) if self.count else None,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "buckets": buckets
+        }
+
+
+def completion_cost(model: str, prompt_tokens: int, completion_tokens: int) -> Optional[float]:
+    """USD cost of a completion from AI_MODEL_PRICES; None for unpriced models"""
+    # Longest prefix wins, so dated or preview model names use their family's price
+    prefix = max((name for name in settings.AI_MODEL_PRICES if model.startswith(name)), key=len, default=None)
+    if prefix is None:
+        return None
+
+    input_price, output_price = settings.AI_MODEL_PRICES[prefix]
+    return (prompt_tokens * input_price + completion_tokens * output_price) / 1_000_000
+
+
+class _LLMStageMetrics:
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cost_usd = 0.0
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.prompt_tokens = Histogram(TOKEN_BUCKETS)
+        self.completion_tokens = Histogram(TOKEN_BUCKETS)
+        self.cost = Histogram(COST_BUCKETS)
+
+    def snapshot(self) -> Dict[str, Any]:
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "retries": self.retries,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_hit_ratio": round(self.cache_hits / lookups, 3) if lookups else None,
+            "cost_usd": round(self.cost_usd, 6),
+            "latency_seconds": self.latency.snapshot(),
+            "prompt_tokens": self.prompt_tokens.snapshot(),
+            "completion_tokens": self.completion_tokens.snapshot(),
+            "cost_per_call_usd": self.cost.snapshot()
+        }
+
+
+class MetricsRegistry:
+    """In-process registry of LLM call and pipeline stage metrics.
+
+    LLM metrics are keyed by (stage, model): latency, prompt/completion
+    tokens, cost, retries, errors and response cache hits. Pipeline
+    metrics time the steps of a match run (JD analysis, enhancement,
+    scoring) so their share of the end-to-end latency is visible.
+    """
+
+    def __init__(self):
+        self._llm: Dict[Tuple[str, str], _LLMStageMetrics] = {}
+        self._pipeline: Dict[str, Histogram] = {}
+
+    def _get_llm(self, stage: str, model: str) -> _LLMStageMetrics:
+        metrics = self._llm.get((stage, model))
+        if metrics is None:
+            metrics = _LLMStageMetrics()
+            self._llm[(stage, model)] = metrics
+        return metrics
+
+    def record_llm_call(
+        self,
+        stage: str,
+        model: str,
+        latency: float,
+        retries: int = 0,
+        prompt_tokens: Optional[int] = None,
+        completion_tokens: Optional[int] = None,
+        error: bool = False
+    ):
+        """Record one provider call, including its retries"""
+        metrics = self._get_llm(stage, model)
+        metrics.calls += 1
+        metrics.retries += retries
+        metrics.latency.observe(latency)
+
+        if error:
+            metrics.errors += 1
+            return
+
+        if prompt_tokens is not None and completion_tokens is not None:
+            metrics.prompt_tokens.observe(prompt_tokens)
+            metrics.completion_tokens.observe(completion_tokens)
+
+            cost = completion_cost(model, prompt_tokens, completion_tokens)
+            if cost is not None:
+                metrics.cost_usd += cost
+                metrics.cost.observe(cost)
+
+    def record_cache_lookup(self, stage: str, model: str, hit: bool):
+        metrics = self._get_llm(stage, model)
+        if hit:
+            metrics.cache_hits += 1
+        else:
+            metrics.cache_misses += 1
+
+    def observe_stage(self, stage: str, latency: float):
+        histogram = self._pipeline.get(stage)
+        if histogram is None:
+            histogram = Histogram(LATENCY_BUCKETS)
+            self._pipeline[stage] = histogram
+        histogram.observe(latency)
+
+    @contextmanager
+    def time_stage(self, stage: str) -> Iterator[None]:
+        """Time a pipeline stage; works around awaits inside the block"""
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.observe_stage(stage, time.monotonic() - started)
+
+    def snapshot(self) -> Dict[str, Any]:
+        llm: Dict[str, Dict[str, Any]] = {}
+        for (stage, model), metrics in sorted(self._llm.items()):
+            llm.setdefault(stage, {})[model] = metrics.snapshot()
+
+        return {
+            "llm": llm,
+            "pipeline": {stage: histogram.snapshot() for stage, histogram in sorted(self._pipeline.items())},
+            "total_cost_usd": round(sum(metrics.cost_usd for metrics in self._llm.values()), 6)
+        }
+
+    def reset(self):
+        self._llm.clear()
+        self._pipeline.clear()
+
+
+telemetry = MetricsRegistry()
@@ -0,0 +1,114 @@
+import math
+import re
+from typing import Any, Dict, List, Optional
+
+# Words, numbers and individual punctuation marks, roughly how BPE tokenizers split text
+TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+# Per-message overhead the chat format adds on top of the content
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def estimate_tokens(text: Optional[str]) -> int:
+    """Estimate the token count of text without a tokenizer download.
+
+    Long words are counted as one token per ~4 characters, which tends to
+    slightly overestimate real BPE counts for English prose.
+    """
+    if not text:
+        return 0
+
+    return sum(math.ceil(len(piece) / 4) for piece in TOKEN_PATTERN.findall(text))
+
+
+def estimate_message_tokens(*messages: str) -> int:
+    """Estimate prompt tokens for a list of chat message contents"""
+    return sum(estimate_tokens(message) + MESSAGE_OVERHEAD_TOKENS for message in messages)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut text so its estimated token count fits within max_tokens"""
+    if max_tokens <= 0:
+        return ""
+
+    used = 0
+    for match in TOKEN_PATTERN.finditer(text):
+        used += math.ceil(len(match.group()) / 4)
+        if used > max_tokens:
+            return text[:match.start()].rstrip()
+
+    return text
+
+
+def fit_items_to_budget(items: List[str], max_items: int, max_tokens: int) -> List[str]:
+    """Keep leading items while both the count and the joined token estimate fit"""
+    fitted = []
+    used = 0
+
+    for item in items[:max_items]:
+        # +1 for the ", " separator
+        cost = estimate_tokens(item) + 1
+        if used + cost > max_tokens:
+            break
+        fitted.append(item)
+        used += cost
+
+    return fitted
+
+
+class TokenUsageTracker:
+    """Records estimated vs. actual token usage per prompt stage for budget tuning"""
+
+    def __init__(self):
+        self._stages: Dict[str, Dict[str, int]] = {}
+
+    def record(
+        self,
+        stage: str,
+        estimated_prompt_tokens: int,
+        max_tokens: int,
+        prompt_tokens: Optional[int] = None,
+        completion_tokens: Optional[int] = None
+    ):
+        """Record one completion; actual counts are optional (e.g. cached or stubbed replies)"""
+        entry = self._stages.setdefault(stage, {
+            "calls": 0,
+            "calls_with_usage": 0,
+            "estimated_prompt_tokens": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "max_tokens": 0,
+            "budget_exhausted": 0
+        })
+
+        entry["calls"] += 1
+        entry["max_tokens"] += max_tokens
+
+        if prompt_tokens is not None and completion_tokens is not None:
+            entry["calls_with_usage"] += 1
+            entry["estimated_prompt_tokens"] += estimated_prompt_tokens
+            entry["prompt_tokens"] += prompt_tokens
+            entry["completion_tokens"] += completion_tokens
+            if completion_tokens >= max_tokens:
+                entry["budget_exhausted"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Summarize usage per stage, including estimator accuracy and budget headroom"""
+        summary = {}
+        for stage, entry in self._stages.items():
+            with_usage = entry["calls_with_usage"]
+            summary[stage] = {
+                **entry,
+                "estimate_ratio": round(entry["estimated_prompt_tokens"] / entry["prompt_tokens"], 3)
+                if entry["prompt_tokens"] else None,
+                "avg_completion_tokens": round(entry["completion_tokens"] / with_usage, 1)
+                if with_usage else None,
+                "avg_max_tokens": round(entry["max_tokens"] / entry["calls"], 1)
+            }
+        return summary
+
+    def reset(self):
+        self._stages.clear()
+
+
+token_usage = TokenUsageTracker()
@@ -45,6 +45,18 @@ COMMON_TECHNICAL_SKILLS = [
     'Jenkins', 'Terraform', 'Ansible', 'Microservices'
 ]
 
+# Skills recognized in resumes and job descriptions; SKILLS_DICTIONARY_PATH adds more
+SKILLS_DICTIONARY = COMMON_TECHNICAL_SKILLS + [
+    'Project Management', 'Agile', 'Scrum', 'Vue.js', 'Angular', 'Spring Boot',
+    'Django', 'Flask', 'Elasticsearch', 'Kafka', 'FastAPI', 'Golang', 'Rust', 'C++', 'C#',
+    'Ruby', 'PHP', 'Scala', 'Kotlin', 'Swift', 'GCP', 'Azure', 'MySQL', 'DynamoDB',
+    'Spark', 'Airflow', 'Pandas', 'NumPy', 'TensorFlow', 'PyTorch', 'Deep Learning', 'NLP'
+]
+
+# Skills that are also everyday words ("swift delivery", "spark interest"); they only count
+# when written in their dictionary casing and alongside at least one other skill
+AMBIGUOUS_SKILLS = ['Rust', 'Ruby', 'Scala', 'Swift', 'Spark']
+
 COMMON_SOFT_SKILLS = [
     'Leadership', 'Communication', 'Problem Solving', 'Team Collaboration',
     'Project Management', 'Critical Thinking', 'Adaptability',
@@ -56,6 +56,7 @@ def initialize_session_state():
         "current_page": "Dashboard",
         "uploaded_resume": None,
         "parsed_resume": None,
+        "resume_id": None,
         "job_descriptions": [],
         "current_job": None,
         "ai_suggestions": [],
@@ -475,14 +476,14 @@ def process_uploaded_resume(uploaded_file):
         # Step 1: Upload file
         status_text.text("Uploading file...")
         progress_bar.progress(20)
-        time.sleep(1)
+        uploaded = upload_resume_file(uploaded_file)
 
         # Step 2: Parse content
         status_text.text("Parsing resume content...")
         progress_bar.progress(50)
 
-        # Mock parsing (in real app, this would call the API)
-        parsed_data = {
+        # Mock parsing when the API is unreachable (demo mode)
+        parsed_data = uploaded["parsed_content"] if uploaded else {
             "personal_info": {
                 "name": "John Doe",
                 "email": "john.doe@email.com",
@@ -516,11 +517,13 @@ def process_uploaded_resume(uploaded_file):
 
         # Step 3: Extract sections
         status_text.text("Extracting sections and formatting...")
-        time.sleep(1)
+        # The saved resume's id is what the streaming match endpoint needs
+        resume_id = save_master_resume(parsed_data, uploaded_file.name) if uploaded else None
         progress_bar.progress(100)
 
         st.session_state.uploaded_resume = uploaded_file
         st.session_state.parsed_resume = parsed_data
+        st.session_state.resume_id = resume_id
 
         status_text.text("✅ Resume processed successfully!")
         time.sleep(1)
@@ -678,10 +681,10 @@ def render_job_match_page():
     if st.button("🔍 Analyze Job Description", type="primary"):
         if job_title and company and job_description:
             with st.spinner("Analyzing job description..."):
-                # Mock analysis
-                time.sleep(2)
+                analyzed = analyze_job(job_title, company, job_description, job_url)
 
-                analysis = {
+                # Mock analysis when the API is unreachable (demo mode)
+                analysis = analyzed["analysis"] if analyzed else {
                     "required_skills": ["Python", "React", "AWS", "Docker", "Kubernetes"],
                     "experience_level": "Senior",
                     "key_responsibilities": [
@@ -692,6 +695,7 @@ def render_job_match_page():
                 }
 
                 st.session_state.current_job = {
+                    "job_id": analyzed["job_id"] if analyzed else None,
                     "title": job_title,
                     "company": company,
                     "description": job_description,
@@ -741,6 +745,22 @@ def render_resume_matching_interface():
         return
 
     if st.button("🚀 Generate AI Suggestions", type="primary"):
+        resume_id = st.session_state.get("resume_id")
+        job_id = (st.session_state.get("current_job") or {}).get("job_id")
+
+        if resume_id and job_id:
+            # Render each suggestion the moment the API streams it
+            st.subheader("💡 AI Suggestions")
+            st.session_state.ai_suggestions = []
+
+            with st.spinner("Generating AI suggestions..."):
+                for suggestion in stream_match_suggestions(resume_id, job_id):
+                    st.session_state.ai_suggestions.append(suggestion)
+                    render_ai_suggestion(len(st.session_state.ai_suggestions) - 1, suggestion)
+
+            st.success("✅ AI suggestions generated!")
+            return
+
         with st.spinner("Generating AI suggestions..."):
             time.sleep(3)
 
@@ -777,34 +797,39 @@ def render_ai_suggestions():
     suggestions = st.session_state.get("ai_suggestions", [])
 
     for i, suggestion in enumerate(suggestions):
-        with st.expander(f"Suggestion {i+1}: {suggestion['section'].title()} (Score: {suggestion['score']}%)"):
+        render_ai_suggestion(i, suggestion)
 
-            col1, col2 = st.columns(2)
+def render_ai_suggestion(i: int, suggestion: dict):
+    """Render a single AI suggestion with accept/reject buttons"""
 
-            with col1:
-                st.write("**Original:**")
-                st.write(suggestion["original"])
+    with st.expander(f"Suggestion {i+1}: {suggestion['section'].title()} (Score: {suggestion['score']}%)"):
 
-            with col2:
-                st.write("**AI Suggestion:**")
-                st.write(suggestion["suggested"])
+        col1, col2 = st.columns(2)
 
-            st.write("**Reason:**", suggestion["reason"])
+        with col1:
+            st.write("**Original:**")
+            st.write(suggestion["original"])
 
-            # Accept/Reject buttons
-            col1, col2, col3 = st.columns(3)
+        with col2:
+            st.write("**AI Suggestion:**")
+            st.write(suggestion["suggested"])
 
-            with col1:
-                if st.button("✅ Accept", key=f"accept_{i}"):
-                    st.success("Suggestion accepted!")
+        st.write("**Reason:**", suggestion["reason"])
 
-            with col2:
-                if st.button("❌ Reject", key=f"reject_{i}"):
-                    st.info("Suggestion rejected.")
+        # Accept/Reject buttons
+        col1, col2, col3 = st.columns(3)
 
-            with col3:
-                if st.button("✏️ Edit", key=f"edit_{i}"):
-                    st.info("Edit functionality would open here.")
+        with col1:
+            if st.button("✅ Accept", key=f"accept_{i}"):
+                st.success("Suggestion accepted!")
+
+        with col2:
+            if st.button("❌ Reject", key=f"reject_{i}"):
+                st.info("Suggestion rejected.")
+
+        with col3:
+            if st.button("✏️ Edit", key=f"edit_{i}"):
+                st.info("Edit functionality would open here.")
 
 def render_export_page_content():
     """Render export page"""
@@ -932,8 +957,27 @@ def render_settings_page():
 
 # API Integration Functions (Mock implementations for demo)
 
+def auth_headers() -> Dict[str, str]:
+    return {"Authorization": f"Bearer {st.session_state.access_token}"}
+
 def login_user(email: str, password: str) -> bool:
-    """Login user via API (mock implementation)"""
+    """Login user via API, falling back to demo mode when the API is unreachable"""
+    try:
+        response = requests.post(
+            f"{API_BASE_URL}/api/auth/login",
+            json={"email": email, "password": password},
+            timeout=10
+        )
+        if response.ok:
+            st.session_state.access_token = response.json()["access_token"]
+            me = requests.get(f"{API_BASE_URL}/api/auth/me", headers=auth_headers(), timeout=10)
+            if me.ok:
+                st.session_state.authenticated = True
+                st.session_state.user_info = me.json()
+                return True
+    except requests.RequestException:
+        pass
+
     # In demo mode, accept any valid-looking credentials
     if "@" in email and len(password) >= 6:
         st.session_state.authenticated = True
@@ -951,6 +995,86 @@ def register_user(name: str, email: str, password: str) -> bool:
     # In demo mode, always succeed
     return True
 
+def upload_resume_file(uploaded_file) -> Optional[Dict]:
+    """Upload and parse a resume via the API; None in demo mode or on failure"""
+    try:
+        response = requests.post(
+            f"{API_BASE_URL}/api/resume/upload",
+            files={"file": (uploaded_file.name, uploaded_file.getvalue(), uploaded_file.type)},
+            headers=auth_headers(),
+            timeout=120
+        )
+        return response.json() if response.ok else None
+    except requests.RequestException:
+        return None
+
+def save_master_resume(parsed_data: Dict, filename: str) -> Optional[str]:
+    """Save parsed content as the master resume and return its id"""
+    try:
+        response = requests.post(
+            f"{API_BASE_URL}/api/resume/save",
+            json={"title": "Master Resume", "content": parsed_data, "filename": filename, "is_master": True},
+            headers=auth_headers(),
+            timeout=30
+        )
+        return response.json()["resume_id"] if response.ok else None
+    except requests.RequestException:
+        return None
+
+def analyze_job(job_title: str, company: str, job_description: str, job_url: str) -> Optional[Dict]:
+    """Analyze and store a job description via the API; the reply carries job_id and analysis"""
+    try:
+        response = requests.post(
+            f"{API_BASE_URL}/api/job-match/analyze-job",
+            data={"job_title": job_title, "company": company, "job_content": job_description, "job_url": job_url or None},
+            headers=auth_headers(),
+            timeout=120
+        )
+        return response.json() if response.ok else None
+    except requests.RequestException:
+        return None
+
+def stream_match_suggestions(resume_id: str, job_description_id: str):
+    """Stream AI suggestions from the API, yielding each one as it arrives"""
+
+    try:
+        response = requests.post(
+            f"{API_BASE_URL}/api/job-match/match-resume/stream",
+            data={"resume_id": resume_id, "job_description_id": job_description_id},
+            headers=auth_headers(),
+            stream=True,
+            timeout=300
+        )
+        response.raise_for_status()
+
+        for line in response.iter_lines(decode_unicode=True):
+            if not line:
+                continue
+
+            event = json.loads(line)
+
+            if event["type"] == "suggestion":
+                data = event["data"]
+                yield {
+                    "section": data["section"],
+                    "original": data["original_content"],
+                    "suggested": data["suggested_content"],
+                    "reason": data["explanation"],
+                    "score": data["relevance_score"]
+                }
+            elif event["type"] == "match_score":
+                st.session_state.match_analysis = event["data"]
+            elif event["type"] == "ats_compliance":
+                st.session_state.match_analysis = {
+                    **(st.session_state.match_analysis or {}),
+                    "ats_compliance": event["data"]
+                }
+            elif event["type"] == "error":
+                st.error(event["detail"])
+
+    except requests.RequestException as e:
+        st.error(f"Failed to generate suggestions: {str(e)}")
+
 def logout_user():
     """Logout user and clear session"""
 
@@ -0,0 +1,210 @@
+"""Benchmark ResumeParser speed, memory and accuracy per extraction engine.
+
+Parses a corpus from scripts/generate_resume_corpus.py (generated on the
+first run if the directory has no manifest.json) once per engine: each
+PDF engine on the PDF files, python-docx on the DOCX files. Each engine
+runs in a fresh process so peak RSS is its own. Reports files/sec and
+p50/p99 parse time over --repeat runs, peak Python allocation of a single
+parse (tracemalloc, so memory held by C extensions is only in the RSS
+figure), and field-level accuracy against the manifest's ground truth.
+
+    python scripts/benchmark_parser.py --corpus corpus --count 60 --repeat 3
+    python scripts/benchmark_parser.py --corpus corpus --min-accuracy 0.7   # exits 1 below this
+
+Accuracy is scored per field from 0 to 1 and averaged over files:
+name, email and summary must match exactly, phone by its digits;
+experience counts jobs found at the right position with the right
+title; bullets and skills are F1 over the expected and parsed sets;
+education scores whether an education entry was found when expected.
+With --min-accuracy, an engine that could not run (e.g. its library is
+not installed) also fails the check.
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import re
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, Iterable, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from generate_resume_corpus import generate_corpus  # noqa: E402
+
+DOCX_ENGINE = "python-docx"
+FIELDS = ("name", "email", "phone", "summary", "experience", "bullets", "education", "skills")
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of sorted samples"""
+    if not samples:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(samples)))
+    return samples[min(rank, len(samples)) - 1]
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def _f1(expected: Iterable[str], found: Iterable[str]) -> float:
+    expected, found = {_normalize(item) for item in expected}, {_normalize(item) for item in found}
+    if not expected and not found:
+        return 1.0
+    matched = len(expected & found)
+    if not matched:
+        return 0.0
+    precision, recall = matched / len(found), matched / len(expected)
+    return 2 * precision * recall / (precision + recall)
+
+
+def score_fields(truth: Dict[str, Any], parsed: Dict[str, Any]) -> Dict[str, float]:
+    """Accuracy of each field of one parse, from 0 to 1"""
+    info = parsed.get("personal_info", {})
+    jobs = parsed.get("experience", [])
+    expected_jobs = truth["experience"]
+
+    positioned = sum(
+        1 for expected, found in zip(expected_jobs, jobs)
+        if _normalize(expected["title"]) in _normalize(found.get("title", ""))
+    )
+    job_slots = max(len(expected_jobs), len(jobs))
+
+    return {
+        "name": float(info.get("name", "").strip() == truth["name"]),
+        "email": float(info.get("email", "") == truth["email"]),
+        "phone": float(re.sub(r"\D", "", info.get("phone", "")) == re.sub(r"\D", "", truth["phone"])),
+        "summary": float(_normalize(parsed.get("summary", "")) == _normalize(truth["summary"])),
+        "experience": positioned / job_slots if job_slots else 1.0,
+        "bullets": _f1(
+            [bullet for job in expected_jobs for bullet in job["bullets"]],
+            [bullet for job in jobs for bullet in job.get("bullets", [])]
+        ),
+        "education": float(bool(parsed.get("education")) == bool(truth["education"])),
+        "skills": _f1(truth["skills"], parsed.get("skills", [])),
+    }
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is in KB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def bench_engine(engine: str, corpus: str, entries: List[Dict[str, Any]], repeat: int) -> Dict[str, Any]:
+    """Parse every file with one engine; runs in its own process"""
+    from app.services.resume_parser import ResumeParser
+
+    parser = ResumeParser(pdf_engines=[] if engine == DOCX_ENGINE else [engine])
+    paths = [(os.path.join(corpus, entry["file"]), f".{entry['format']}") for entry in entries]
+
+    # Warm up so imports and first-call setup are not timed
+    parser.parse_file(*paths[0])
+    baseline_rss = _peak_rss_mb()
+
+    timings = []
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for path, file_ext in paths:
+            parse_started = time.perf_counter()
+            parser.parse_file(path, file_ext)
+            timings.append((time.perf_counter() - parse_started) * 1000)
+    elapsed = time.perf_counter() - started
+
+    # A separate pass under tracemalloc, which would otherwise slow the timed runs
+    scores = {field: [] for field in FIELDS}
+    peak_alloc = 0
+    tracemalloc.start()
+    for entry, (path, file_ext) in zip(entries, paths):
+        tracemalloc.reset_peak()
+        parsed = parser.parse_file(path, file_ext)["parsed_content"]
+        peak_alloc = max(peak_alloc, tracemalloc.get_traced_memory()[1])
+        for field, score in score_fields(entry["truth"], parsed).items():
+            scores[field].append(score)
+    tracemalloc.stop()
+
+    timings.sort()
+    accuracy = {field: round(statistics.mean(values), 4) for field, values in scores.items()}
+    return {
+        "engine": engine,
+        "files": len(paths),
+        "files_per_sec": round(len(timings) / elapsed, 1),
+        "p50_ms": round(percentile(timings, 50), 2),
+        "p99_ms": round(percentile(timings, 99), 2),
+        "peak_alloc_kb": round(peak_alloc / 1024, 1),
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+        "rss_growth_mb": round(_peak_rss_mb() - baseline_rss, 1),
+        "accuracy": accuracy,
+        "overall_accuracy": round(statistics.mean(accuracy.values()), 4),
+    }
+
+
+def load_corpus(corpus: str, count: int, seed: int) -> List[Dict[str, Any]]:
+    manifest_path = os.path.join(corpus, "manifest.json")
+    if not os.path.exists(manifest_path):
+        print(f"No manifest in {corpus}, generating {count} resumes with seed {seed}")
+        asyncio.run(generate_corpus(corpus, count, seed))
+
+    with open(manifest_path) as f:
+        return json.load(f)["files"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", default="corpus")
+    parser.add_argument("--count", type=int, default=60, help="Resumes to generate when the corpus is missing")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--engines", nargs="+", default=["pymupdf", "pdfplumber", "pypdf2", DOCX_ENGINE])
+    parser.add_argument("--repeat", type=int, default=3, help="Timed passes over the corpus per engine")
+    parser.add_argument("--min-accuracy", type=float, default=None, help="Exit 1 if any engine scores below this")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    entries = load_corpus(args.corpus, args.count, args.seed)
+    context = multiprocessing.get_context("spawn")
+    results = []
+    skipped = []
+
+    for engine in args.engines:
+        wanted = "docx" if engine == DOCX_ENGINE else "pdf"
+        files = [entry for entry in entries if entry["format"] == wanted]
+        if not files:
+            continue
+        with context.Pool(1) as pool:
+            try:
+                results.append(pool.apply(bench_engine, (engine, args.corpus, files, args.repeat)))
+            except Exception as e:
+                print(f"{engine}: skipped ({type(e).__name__}: {e})", file=sys.stderr)
+                skipped.append(engine)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{'engine':<12}{'files':>6}{'files/s':>9}{'p50 ms':>9}{'p99 ms':>9}"
+              f"{'alloc KB':>10}{'rss MB':>8}{'+rss MB':>9}{'accuracy':>10}")
+        for row in results:
+            print(f"{row['engine']:<12}{row['files']:>6}{row['files_per_sec']:>9}{row['p50_ms']:>9}{row['p99_ms']:>9}"
+                  f"{row['peak_alloc_kb']:>10}{row['peak_rss_mb']:>8}{row['rss_growth_mb']:>9}{row['overall_accuracy']:>10}")
+
+        print(f"\n{'engine':<12}" + "".join(f"{field:>11}" for field in FIELDS))
+        for row in results:
+            print(f"{row['engine']:<12}" + "".join(f"{row['accuracy'][field]:>11}" for field in FIELDS))
+
+    if args.min_accuracy is not None:
+        failing = [row["engine"] for row in results if row["overall_accuracy"] < args.min_accuracy]
+        if failing:
+            print(f"\nBelow {args.min_accuracy} accuracy: {', '.join(failing)}", file=sys.stderr)
+        if skipped:
+            print(f"\nCould not run: {', '.join(skipped)}", file=sys.stderr)
+        if failing or skipped:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
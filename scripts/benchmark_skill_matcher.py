@@ -0,0 +1,109 @@
+"""Benchmark SkillMatcher against the substring loops it replaced.
+
+The old extractors ran `skill in text_lower` once per skill, which costs
+O(skills x text) and matches inside other words ("git" in "digital").
+This script pads the built-in dictionary with synthetic skills up to each
+requested size, then times both approaches on the same resume text and
+counts the matches that only the substring loop reports. It also times a
+single regex alternation with the matcher's word boundaries, the cheapest
+way to get the same answers without an automaton.
+
+    python scripts/benchmark_skill_matcher.py --sizes 100 1000 10000 --pages 2 --repeat 20
+"""
+import argparse
+import os
+import random
+import re
+import statistics
+import sys
+import time
+from typing import Callable, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.skill_matcher import SkillMatcher, normalize  # noqa: E402
+from app.utils.constants import SKILLS_DICTIONARY  # noqa: E402
+
+FILLER_WORDS = (
+    "designed built digital platform javascript services improved latency team agile delivery reduced cost "
+    "kubernetes clusters python pipelines migrated legacy postgresql databases mentored engineers across "
+    "regions launched analytics features for customers using react and node.js with git workflows"
+).split()
+
+
+def build_dictionary(size: int) -> List[str]:
+    synthetic = [f"tool{i} framework" if i % 3 else f"lang{i}" for i in range(max(0, size - len(SKILLS_DICTIONARY)))]
+    return list(SKILLS_DICTIONARY) + synthetic
+
+
+def build_text(pages: int, seed: int = 7) -> str:
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(pages * 50):
+        lines.append("- " + " ".join(rng.choice(FILLER_WORDS) for _ in range(rng.randint(8, 16))))
+    return "\n".join(lines)
+
+
+def substring_loop(skills: List[str]) -> Callable[[str], List[str]]:
+    def find(text: str) -> List[str]:
+        text_lower = text.lower()
+        return [skill for skill in skills if skill.lower() in text_lower]
+    return find
+
+
+def boundary_regex(skills: List[str]) -> Callable[[str], List[str]]:
+    # Zero-width lookahead so overlapping skills ("Machine Learning", "Learning") are all found
+    keys = sorted({normalize(skill) for skill in skills}, key=len, reverse=True)
+    pattern = re.compile(r"(?<![^\W_])(?<![+#])(?=(" + "|".join(map(re.escape, keys)) + r")(?![^\W_])(?![+#]))")
+
+    def find(text: str) -> List[str]:
+        return list(dict.fromkeys(match.group(1) for match in pattern.finditer(normalize(text))))
+    return find
+
+
+def time_it(find: Callable[[str], List[str]], text: str, repeat: int) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        find(text)
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[len(SKILLS_DICTIONARY), 1000, 10000])
+    parser.add_argument("--pages", type=int, default=2, help="Resume length, about 50 lines per page")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    text = build_text(args.pages)
+    print(f"Text: {len(text):,} chars, {args.repeat} runs per measurement\n")
+    print(
+        f"{'skills':>8} {'build ms':>9} {'loop p50':>9} {'regex p50':>10} {'matcher p50':>12} {'speedup':>8} "
+        f"{'loop-only matches':>18}"
+    )
+
+    for size in args.sizes:
+        skills = build_dictionary(size)
+
+        started = time.perf_counter()
+        matcher = SkillMatcher(skills)
+        build_ms = (time.perf_counter() - started) * 1000
+
+        loop = substring_loop(skills)
+        loop_p50 = statistics.median(time_it(loop, text, args.repeat))
+        regex_p50 = statistics.median(time_it(boundary_regex(skills), text, args.repeat))
+        matcher_p50 = statistics.median(time_it(matcher.find, text, args.repeat))
+
+        # Substring hits the boundary-aware matcher rejects, e.g. "Git" inside "digital"
+        false_positives = sorted(set(loop(text)) - set(matcher.find(text)))
+
+        print(
+            f"{len(matcher):>8} {build_ms:>9.1f} {loop_p50:>8.2f}ms {regex_p50:>8.2f}ms {matcher_p50:>10.2f}ms "
+            f"{loop_p50 / matcher_p50:>7.1f}x  {', '.join(false_positives[:4]) or '-'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""Generate a deterministic corpus of synthetic PDF and DOCX resumes.
+
+Every resume is rendered by ExportService, the same reportlab and
+python-docx code that produces user exports, so the corpus looks like
+the files the parser actually meets. Resumes vary in size (number of
+jobs and bullets) and layout (which optional sections and contact
+fields are present). The content each file was built from is written
+to manifest.json as ground truth for scripts/benchmark_parser.py.
+
+The same --seed always produces the same resumes.
+
+    python scripts/generate_resume_corpus.py --out corpus --count 60 --seed 7
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.resume import Education, ExportRequest, Experience, PersonalInfo, Resume, ResumeContent  # noqa: E402
+from app.services.export_service import ExportService  # noqa: E402
+from app.utils.constants import SKILLS_DICTIONARY  # noqa: E402
+
+FORMATS = ("pdf", "docx")
+
+# Jobs per resume and bullets per job
+SIZES = {
+    "small": ((1, 2), (2, 3)),
+    "medium": ((3, 5), (4, 6)),
+    "large": ((8, 12), (6, 10)),
+}
+
+# Optional parts each layout leaves out
+LAYOUTS = {
+    "full": (),
+    "no_summary": ("summary",),
+    "no_phone": ("phone",),
+    "no_skills_section": ("skills",),
+    "experience_only": ("summary", "skills", "education"),
+}
+
+FIRST_NAMES = ["Jane", "Omar", "Priya", "Lucas", "Mei", "Daniel", "Amara", "Sven", "Carmen", "Kenji"]
+LAST_NAMES = ["Doe", "Haddad", "Raman", "Silva", "Chen", "Okafor", "Lindqvist", "Ortega", "Sato", "Novak"]
+TITLES = [
+    "Software Engineer", "Senior Software Engineer", "Backend Developer", "Data Analyst",
+    "Engineering Manager", "Platform Engineer", "Data Scientist", "Technical Lead"
+]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Health", "Hooli", "Stark Logistics", "Wayne Finance"]
+DEGREES = ["Bachelor of Science in Computer Science", "Master of Science in Data Science", "Bachelor of Engineering"]
+SCHOOLS = ["State University", "Institute of Technology", "City College"]
+
+# Bullet templates; the filler words are chosen so no dictionary skill matches outside {skill}
+BULLETS = [
+    "Built {skill} services handling {n} requests per second",
+    "Reduced release time by {n} percent by automating {skill} deployments",
+    "Mentored {n} engineers on {skill} code reviews and testing practice",
+    "Migrated {n} legacy jobs to {skill} with zero downtime",
+    "Designed {skill} reporting used by {n} internal teams",
+]
+SUMMARY = "Engineer with {years} years of experience shipping {first} and {second} systems for customers."
+
+
+def build_content(rng: random.Random, size: str, layout: str) -> Dict[str, Any]:
+    """Resume content for one file, plus the skills that appear anywhere in it"""
+    omit = LAYOUTS[layout]
+    (min_jobs, max_jobs), (min_bullets, max_bullets) = SIZES[size]
+    skills = rng.sample(SKILLS_DICTIONARY, rng.randint(5, 12))
+    mentioned = set()
+
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    personal_info = PersonalInfo(
+        name=f"{first} {last}",
+        email=f"{first.lower()}.{last.lower()}{rng.randint(1, 99)}@example.com",
+        phone=None if "phone" in omit else f"555-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}"
+    )
+
+    experience = []
+    year = 2024
+    for _ in range(rng.randint(min_jobs, max_jobs)):
+        bullets = []
+        for _ in range(rng.randint(min_bullets, max_bullets)):
+            skill = rng.choice(skills)
+            mentioned.add(skill)
+            bullets.append(rng.choice(BULLETS).format(skill=skill, n=rng.randint(2, 90)))
+        start = year - rng.randint(1, 4)
+        experience.append(Experience(
+            title=rng.choice(TITLES),
+            company=rng.choice(COMPANIES),
+            start_date=str(start),
+            end_date=None if year == 2024 else str(year),
+            bullets=bullets
+        ))
+        year = start
+
+    summary = None
+    if "summary" not in omit:
+        first_skill, second_skill = rng.sample(skills, 2)
+        mentioned.update((first_skill, second_skill))
+        summary = SUMMARY.format(years=2024 - year, first=first_skill, second=second_skill)
+
+    education = []
+    if "education" not in omit:
+        education.append(Education(
+            degree=rng.choice(DEGREES),
+            school=rng.choice(SCHOOLS),
+            graduation_year=str(year - rng.randint(0, 2))
+        ))
+
+    listed = [] if "skills" in omit else skills
+    content = ResumeContent(
+        personal_info=personal_info,
+        summary=summary,
+        experience=experience,
+        education=education,
+        skills=listed
+    )
+    return {"content": content, "skills": sorted(mentioned | set(listed))}
+
+
+async def generate_corpus(out_dir: str, count: int, seed: int = 7) -> List[Dict[str, Any]]:
+    """Write count resumes and manifest.json to out_dir; returns the manifest entries"""
+    os.makedirs(out_dir, exist_ok=True)
+    rng = random.Random(seed)
+    exporter = ExportService(export_directory=out_dir)
+    entries = []
+
+    for index in range(count):
+        file_format = FORMATS[index % len(FORMATS)]
+        size = rng.choice(list(SIZES))
+        layout = rng.choice(list(LAYOUTS))
+        built = build_content(rng, size, layout)
+        content = built["content"]
+
+        resume = Resume(id=f"synthetic-{index}", user_id="benchmark", title=f"Synthetic {index}", content=content)
+        request = ExportRequest(resume_id=resume.id, format=file_format, filename=f"resume_{index:04d}_{size}_{layout}")
+        file_path = await exporter.generate_resume_file(resume, request, "benchmark")
+
+        entries.append({
+            "file": os.path.basename(file_path),
+            "format": file_format,
+            "size": size,
+            "layout": layout,
+            "truth": {
+                "name": content.personal_info.name,
+                "email": content.personal_info.email,
+                "phone": content.personal_info.phone or "",
+                "summary": content.summary or "",
+                "experience": [
+                    {"title": exp.title, "company": exp.company, "bullets": exp.bullets}
+                    for exp in content.experience
+                ],
+                "education": len(content.education),
+                "skills": built["skills"]
+            }
+        })
+
+    with open(os.path.join(out_dir, "manifest.json"), "w") as f:
+        json.dump({"seed": seed, "files": entries}, f, indent=2)
+
+    return entries
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", default="corpus")
+    parser.add_argument("--count", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    entries = asyncio.run(generate_corpus(args.out, args.count, args.seed))
+    total = sum(os.path.getsize(os.path.join(args.out, entry["file"])) for entry in entries)
+    print(f"Wrote {len(entries)} resumes ({total / 1024:.0f} KB) and manifest.json to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
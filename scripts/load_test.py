@@ -0,0 +1,206 @@
+"""End-to-end load generator for the resume API.
+
+Each virtual user registers, logs in and stores an API key, then loops
+through upload -> save -> analyze-job -> match-resume -> export. Latency
+percentiles and throughput are reported per endpoint.
+
+Run the backend against the OpenAI stub so no API credit is spent:
+    python scripts/openai_stub.py --port 8001 &
+    OPENAI_BASE_URL=http://localhost:8001/v1 uvicorn app.main:app --port 8000 &
+    python scripts/load_test.py --base-url http://localhost:8000 --users 20 --iterations 5
+"""
+import argparse
+import asyncio
+import io
+import json
+import statistics
+import time
+import uuid
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+import httpx
+from docx import Document
+
+RESUME_CONTENT = {
+    "personal_info": {
+        "name": "Load Test User",
+        "email": "loadtest@example.com",
+        "phone": "555-123-4567",
+        "location": "Remote"
+    },
+    "summary": "Backend engineer building Python services on AWS.",
+    "experience": [
+        {
+            "title": f"Software Engineer {job}",
+            "company": f"Company {job}",
+            "start_date": "2019-01",
+            "end_date": "2021-01",
+            "bullets": [f"Built service {job}-{bullet} handling production traffic" for bullet in range(5)]
+        }
+        for job in range(4)
+    ],
+    "education": [{"degree": "B.S. Computer Science", "school": "State University", "graduation_year": "2018"}],
+    "skills": ["Python", "SQL", "Docker", "Git"],
+    "projects": [],
+    "certifications": [],
+    "languages": []
+}
+
+JOB_DESCRIPTION = """Senior Backend Engineer
+
+We are looking for an engineer with Python, FastAPI, AWS, Docker and PostgreSQL experience.
+- Design and build scalable backend services for millions of users
+- Mentor engineers and lead technical design reviews
+- Own reliability and performance of production systems
+"""
+
+
+def build_resume_docx() -> bytes:
+    """Render RESUME_CONTENT as a DOCX upload"""
+    doc = Document()
+    info = RESUME_CONTENT["personal_info"]
+    doc.add_paragraph(info["name"])
+    doc.add_paragraph(f"{info['email']} | {info['phone']}")
+    doc.add_paragraph("SUMMARY")
+    doc.add_paragraph(RESUME_CONTENT["summary"])
+    doc.add_paragraph("EXPERIENCE")
+    for exp in RESUME_CONTENT["experience"]:
+        doc.add_paragraph(exp["title"])
+        for bullet in exp["bullets"]:
+            doc.add_paragraph(f"• {bullet}")
+    doc.add_paragraph("SKILLS")
+    doc.add_paragraph(", ".join(RESUME_CONTENT["skills"]))
+
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+class Recorder:
+    """Collects per-endpoint latencies and failures"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.failures: Dict[str, int] = defaultdict(int)
+
+    async def request(self, client: httpx.AsyncClient, name: str, method: str, url: str, **kwargs) -> Optional[httpx.Response]:
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            self.failures[name] += 1
+            return None
+
+        self.latencies[name].append(time.perf_counter() - started)
+        if response.status_code >= 400:
+            self.failures[name] += 1
+            return None
+        return response
+
+    def report(self, elapsed: float) -> Dict[str, Dict[str, float]]:
+        summary = {}
+        for name in sorted(set(self.latencies) | set(self.failures)):
+            samples = sorted(self.latencies.get(name, []))
+            summary[name] = {
+                "requests": len(samples),
+                "failures": self.failures.get(name, 0),
+                "throughput_rps": round(len(samples) / elapsed, 2) if elapsed else 0.0,
+                "p50_ms": round(percentile(samples, 50) * 1000, 1),
+                "p95_ms": round(percentile(samples, 95) * 1000, 1),
+                "p99_ms": round(percentile(samples, 99) * 1000, 1),
+                "mean_ms": round(statistics.fmean(samples) * 1000, 1) if samples else 0.0
+            }
+        return summary
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of sorted samples"""
+    if not samples:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(samples)))
+    return samples[min(rank, len(samples)) - 1]
+
+
+async def virtual_user(client: httpx.AsyncClient, recorder: Recorder, iterations: int, api_key: str, resume_file: bytes):
+    email = f"load-{uuid.uuid4().hex[:12]}@example.com"
+    password = "LoadTest123"
+
+    await recorder.request(client, "auth/register", "POST", "/api/auth/register",
+                           json={"name": "Load Test", "email": email, "password": password})
+    login = await recorder.request(client, "auth/login", "POST", "/api/auth/login",
+                                   json={"email": email, "password": password})
+    if login is None:
+        return
+
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    await recorder.request(client, "auth/set-api-key", "POST", "/api/auth/set-api-key",
+                           json={"openai_api_key": api_key}, headers=headers)
+
+    for _ in range(iterations):
+        await recorder.request(
+            client, "resume/upload", "POST", "/api/resume/upload",
+            files={"file": ("resume.docx", resume_file,
+                            "application/vnd.openxmlformats-officedocument.wordprocessingml.document")},
+            headers=headers
+        )
+
+        saved = await recorder.request(client, "resume/save", "POST", "/api/resume/save",
+                                       json={"title": "Load test resume", "content": RESUME_CONTENT},
+                                       headers=headers)
+        job = await recorder.request(client, "job-match/analyze-job", "POST", "/api/job-match/analyze-job",
+                                     data={"job_title": "Senior Backend Engineer", "company": "Acme",
+                                           "job_content": JOB_DESCRIPTION},
+                                     headers=headers)
+        if saved is None or job is None:
+            continue
+
+        resume_id = saved.json()["resume_id"]
+        await recorder.request(client, "job-match/match-resume", "POST", "/api/job-match/match-resume",
+                               data={"resume_id": resume_id, "job_description_id": job.json()["job_id"]},
+                               headers=headers)
+        await recorder.request(client, "export/generate", "POST", "/api/export/generate",
+                               data={"resume_id": resume_id, "format": "docx"},
+                               headers=headers)
+
+
+async def main(args: argparse.Namespace):
+    resume_file = build_resume_docx()
+    recorder = Recorder()
+    limits = httpx.Limits(max_connections=args.users * 2)
+
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*[
+            virtual_user(client, recorder, args.iterations, args.api_key, resume_file)
+            for _ in range(args.users)
+        ])
+        elapsed = time.perf_counter() - started
+
+    report = recorder.report(elapsed)
+
+    if args.json:
+        print(json.dumps({"elapsed_s": round(elapsed, 2), "endpoints": report}, indent=2))
+        return
+
+    print(f"Completed in {elapsed:.1f}s with {args.users} users x {args.iterations} iterations\n")
+    print(f"{'endpoint':<26}{'reqs':>6}{'fail':>6}{'rps':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name, row in report.items():
+        print(f"{name:<26}{row['requests']:>6}{row['failures']:>6}{row['throughput_rps']:>8}"
+              f"{row['p50_ms']:>10}{row['p95_ms']:>10}{row['p99_ms']:>10}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load test the resume API end to end")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--users", type=int, default=10, help="Concurrent virtual users")
+    parser.add_argument("--iterations", type=int, default=3, help="Pipeline runs per user")
+    parser.add_argument("--api-key", default="sk-loadtest-0000000000000000000000",
+                        help="API key stored for each user; any value works against the stub")
+    parser.add_argument("--timeout", type=float, default=300.0)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,176 @@
+"""Local stand-in for the OpenAI chat completions API.
+
+Answers the prompts AIService sends with canned JSON bodies after a
+configurable latency, and injects 429/5xx errors at configurable rates, so
+the backend can be load-tested without spending API credit.
+
+Usage:
+    python scripts/openai_stub.py --port 8001 --latency lognormal --latency-ms 800 --error-rate 0.02
+
+Then point the backend at it:
+    OPENAI_BASE_URL=http://localhost:8001/v1 uvicorn app.main:app
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import re
+import time
+import uuid
+from typing import Any, Dict, List
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+DEFAULT_RESPONSES = {
+    "jd_analysis": {
+        "required_skills": ["Python", "FastAPI", "AWS", "Docker", "PostgreSQL"],
+        "preferred_qualifications": ["Bachelor's degree"],
+        "key_responsibilities": ["Design scalable services", "Mentor engineers"],
+        "company_culture_keywords": ["collaborative"],
+        "experience_level": "senior",
+        "industry": "technology"
+    },
+    "bullet": {
+        "enhanced_bullet": "Delivered {bullet} using Python and AWS, cutting latency by 30%",
+        "improvement_explanation": "Added technologies and a measurable outcome",
+        "relevance_score": 82
+    }
+}
+
+BATCH_BULLET_PATTERN = re.compile(r'(\d+)\. "([^"]*)"')
+SINGLE_BULLET_PATTERN = re.compile(r'Original bullet point: "([^"]*)"')
+
+
+class StubConfig:
+    def __init__(self, args: argparse.Namespace):
+        self.latency = args.latency
+        self.latency_ms = args.latency_ms
+        self.jitter_ms = args.jitter_ms
+        self.error_rate = args.error_rate
+        self.rate_limit_rate = args.rate_limit_rate
+        self.retry_after = args.retry_after
+        self.responses = dict(DEFAULT_RESPONSES)
+        if args.responses:
+            with open(args.responses) as f:
+                self.responses.update(json.load(f))
+
+    def sample_latency(self) -> float:
+        """Sample a response delay in seconds"""
+        mean = self.latency_ms / 1000
+        jitter = self.jitter_ms / 1000
+
+        if self.latency == "fixed":
+            return mean
+        if self.latency == "uniform":
+            return max(0.0, random.uniform(mean - jitter, mean + jitter))
+
+        # Lognormal with the given mean; jitter acts as the standard deviation
+        sigma = math.sqrt(math.log(1 + (jitter / mean) ** 2)) if mean > 0 and jitter > 0 else 0.0
+        mu = math.log(mean) - sigma ** 2 / 2 if mean > 0 else 0.0
+        return random.lognormvariate(mu, sigma) if mean > 0 else 0.0
+
+
+def estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+def build_reply(prompt: str, responses: Dict[str, Any]) -> Dict[str, Any]:
+    """Pick a canned body matching the kind of prompt AIService sent"""
+    if "Analyze the following job description" in prompt:
+        return responses["jd_analysis"]
+
+    template = responses["bullet"]
+
+    def enhance(bullet: str) -> Dict[str, Any]:
+        return {
+            **template,
+            "enhanced_bullet": template["enhanced_bullet"].format(bullet=bullet.rstrip(".").lower())
+        }
+
+    if "Bullet points:" in prompt:
+        return {"bullets": [
+            {"id": int(batch_idx), **enhance(bullet)}
+            for batch_idx, bullet in BATCH_BULLET_PATTERN.findall(prompt)
+        ]}
+
+    match = SINGLE_BULLET_PATTERN.search(prompt)
+    return enhance(match.group(1) if match else "the work")
+
+
+def create_app(config: StubConfig) -> FastAPI:
+    app = FastAPI(title="OpenAI stub")
+    counters = {"requests": 0, "errors": 0, "rate_limited": 0}
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        counters["requests"] += 1
+
+        await asyncio.sleep(config.sample_latency())
+
+        roll = random.random()
+        if roll < config.rate_limit_rate:
+            counters["rate_limited"] += 1
+            return JSONResponse(
+                status_code=429,
+                headers={"retry-after": str(config.retry_after)},
+                content={"error": {"message": "Rate limit reached", "type": "requests", "code": "rate_limit_exceeded"}}
+            )
+        if roll < config.rate_limit_rate + config.error_rate:
+            counters["errors"] += 1
+            return JSONResponse(
+                status_code=500,
+                content={"error": {"message": "The server had an error", "type": "server_error", "code": None}}
+            )
+
+        messages: List[Dict[str, str]] = body.get("messages", [])
+        prompt = messages[-1]["content"] if messages else ""
+        content = json.dumps(build_reply(prompt, config.responses))
+
+        prompt_tokens = sum(estimate_tokens(m.get("content", "")) for m in messages)
+        completion_tokens = min(estimate_tokens(content), body.get("max_tokens") or 4000)
+
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "stub"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop"
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens
+            }
+        }
+
+    @app.get("/stats")
+    async def stats():
+        return counters
+
+    return app
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="OpenAI-compatible stub server for load testing")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--latency", choices=["fixed", "uniform", "lognormal"], default="lognormal")
+    parser.add_argument("--latency-ms", type=float, default=800, help="Mean response latency")
+    parser.add_argument("--jitter-ms", type=float, default=400, help="Spread (uniform) or std dev (lognormal)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction answered with 429")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds sent with 429s")
+    parser.add_argument("--responses", help="JSON file overriding the canned jd_analysis/bullet bodies")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    uvicorn.run(create_app(StubConfig(args)), host=args.host, port=args.port, log_level="warning")
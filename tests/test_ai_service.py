@@ -0,0 +1,228 @@
+import asyncio
+import json
+import re
+from types import SimpleNamespace
+
+from app.config import settings
+from app.services.ai_service import AIService
+
+
+class FakeCompletions:
+    """Stand-in for client.chat.completions that answers bullet prompts"""
+
+    def __init__(self, delay: float = 0.05, malformed_batches: bool = False):
+        self.delay = delay
+        self.malformed_batches = malformed_batches
+        self.calls = 0
+        self.batch_calls = 0
+        self.max_tokens = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        self.max_tokens.append(kwargs["max_tokens"])
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+
+        prompt = kwargs["messages"][-1]["content"]
+        if "Analyze the following job description" in prompt:
+            content = json.dumps({"required_skills": ["Python", "Docker"], "key_responsibilities": []})
+        elif "Bullet points:" in prompt:
+            self.batch_calls += 1
+            if self.malformed_batches:
+                content = "Sorry, here are your bullets: ..."
+            else:
+                content = json.dumps({"bullets": [
+                    {
+                        "id": int(batch_idx),
+                        "enhanced_bullet": f"Enhanced: {bullet}",
+                        "improvement_explanation": "Added metrics",
+                        "relevance_score": 80
+                    }
+                    for batch_idx, bullet in re.findall(r'(\d+)\. "([^"]*)"', prompt)
+                ]})
+        else:
+            bullet = prompt.split('Original bullet point: "')[1].split('"')[0]
+            content = json.dumps({
+                "enhanced_bullet": f"Enhanced: {bullet}",
+                "improvement_explanation": "Added metrics",
+                "relevance_score": 80
+            })
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def make_fake_client(delay: float = 0.05, malformed_batches: bool = False):
+    completions = FakeCompletions(delay, malformed_batches)
+    client = SimpleNamespace(api_key="sk-test-key", chat=SimpleNamespace(completions=completions))
+    return client, completions
+
+
+def make_service_with_client(client) -> AIService:
+    service = AIService()
+    service.api_key = client.api_key
+    service.client = client
+    return service
+
+
+def make_experience(jobs: int, bullets_per_job: int):
+    return [
+        {"title": f"Engineer {j}", "bullets": [f"job {j} bullet {b}" for b in range(bullets_per_job)]}
+        for j in range(jobs)
+    ]
+
+
+def test_experience_bullets_enhanced_concurrently_in_order(monkeypatch):
+    """Bullets are fanned out concurrently and returned in (exp_idx, bullet_idx) order"""
+    monkeypatch.setattr(settings, "AI_BULLET_BATCH_SIZE", 1)
+    monkeypatch.setattr(settings, "AI_MAX_BULLETS_TO_ENHANCE", 0)
+    service = AIService()
+    client, completions = make_fake_client(delay=0.05)
+    experience = make_experience(jobs=3, bullets_per_job=4)
+
+    suggestions = asyncio.run(
+        service._enhance_experience_section(experience, {"required_skills": ["Python"]}, client)
+    )
+
+    assert completions.calls == 12
+    assert completions.max_in_flight > 1
+    assert [(s.subsection_index, s.item_index) for s in suggestions] == [
+        (j, b) for j in range(3) for b in range(4)
+    ]
+    assert suggestions[5].original_content == "job 1 bullet 1"
+    assert suggestions[5].suggested_content == "Enhanced: job 1 bullet 1"
+
+
+def test_experience_concurrency_is_capped(monkeypatch):
+    """Per-request concurrency never exceeds the configured cap"""
+    monkeypatch.setattr(settings, "AI_BULLET_BATCH_SIZE", 1)
+    monkeypatch.setattr(settings, "AI_MAX_CONCURRENCY_PER_REQUEST", 2)
+    service = AIService()
+    client, completions = make_fake_client(delay=0.02)
+
+    asyncio.run(
+        service._enhance_experience_section(make_experience(jobs=2, bullets_per_job=5), {}, client)
+    )
+
+    assert completions.calls == 10
+    assert completions.max_in_flight == 2
+
+
+def test_batched_bullets_use_one_completion_per_batch(monkeypatch):
+    """Bullets are packed into batches and split back into per-bullet suggestions"""
+    monkeypatch.setattr(settings, "AI_BULLET_BATCH_SIZE", 5)
+    monkeypatch.setattr(settings, "AI_MAX_BULLETS_TO_ENHANCE", 0)
+    service = AIService()
+    client, completions = make_fake_client(delay=0.01)
+
+    suggestions = asyncio.run(
+        service._enhance_experience_section(make_experience(jobs=3, bullets_per_job=4), {}, client)
+    )
+
+    assert completions.calls == 3
+    assert completions.batch_calls == 3
+    assert [(s.subsection_index, s.item_index) for s in suggestions] == [
+        (j, b) for j in range(3) for b in range(4)
+    ]
+    assert suggestions[7].suggested_content == "Enhanced: job 1 bullet 3"
+
+
+def test_malformed_batch_reply_falls_back_to_per_bullet(monkeypatch):
+    """A batch reply that isn't valid JSON is retried bullet by bullet"""
+    monkeypatch.setattr(settings, "AI_BULLET_BATCH_SIZE", 10)
+    service = AIService()
+    client, completions = make_fake_client(delay=0.01, malformed_batches=True)
+
+    suggestions = asyncio.run(
+        service._enhance_experience_section(make_experience(jobs=2, bullets_per_job=3), {}, client)
+    )
+
+    assert completions.batch_calls == 1
+    assert completions.calls == 1 + 6
+    assert [s.original_content for s in suggestions] == [
+        f"job {j} bullet {b}" for j in range(2) for b in range(3)
+    ]
+
+
+def test_stream_yields_suggestions_as_they_complete(monkeypatch):
+    """Streaming emits heuristic suggestions first, then every bullet as it lands"""
+    monkeypatch.setattr(settings, "AI_BULLET_BATCH_SIZE", 1)
+    client, completions = make_fake_client(delay=0.01)
+    service = make_service_with_client(client)
+    resume_sections = {
+        "summary": "Backend engineer",
+        "experience": make_experience(jobs=2, bullets_per_job=2),
+        "skills": ["Python"]
+    }
+
+    async def collect():
+        return [
+            suggestion
+            async for suggestion in service.stream_resume_suggestions(
+                resume_sections, "Analyze me: Python and Docker role", bypass_cache=True
+            )
+        ]
+
+    suggestions = asyncio.run(collect())
+
+    assert [s.section for s in suggestions[:2]] == ["skills", "summary"]
+    assert sorted((s.subsection_index, s.item_index) for s in suggestions[2:]) == [
+        (0, 0), (0, 1), (1, 0), (1, 1)
+    ]
+
+
+def test_unchanged_bullets_reuse_previous_suggestions(monkeypatch):
+    """Only edited bullets are sent again; the rest are carried over from the earlier run"""
+    monkeypatch.setattr(settings, "AI_BULLET_BATCH_SIZE", 1)
+    service = AIService()
+    service.cache = None
+    client, completions = make_fake_client(delay=0.01)
+    jd_analysis = {"required_skills": ["Python"], "key_responsibilities": []}
+    experience = make_experience(jobs=2, bullets_per_job=2)
+
+    first = asyncio.run(service._enhance_experience_section(experience, jd_analysis, client))
+    assert completions.calls == 4
+    assert all(s.fingerprint and not s.is_reused for s in first)
+
+    experience[1]["bullets"][0] = "job 1 bullet 0, now with metrics"
+    second = asyncio.run(service._enhance_experience_section(
+        experience, jd_analysis, client, previous_suggestions=first
+    ))
+
+    assert completions.calls == 5
+    assert [s.is_reused for s in second] == [True, True, False, True]
+    assert second[2].suggested_content == "Enhanced: job 1 bullet 0, now with metrics"
+
+    # A different JD context invalidates every fingerprint
+    changed_context = {"required_skills": ["Go"], "key_responsibilities": []}
+    third = asyncio.run(service._enhance_experience_section(
+        experience, changed_context, client, previous_suggestions=second
+    ))
+
+    assert completions.calls == 9
+    assert not any(s.is_reused for s in third)
+
+
+def test_only_most_relevant_bullets_are_enhanced(monkeypatch):
+    """Bullets beyond the cap are ranked locally and never reach the LLM"""
+    monkeypatch.setattr(settings, "AI_BULLET_BATCH_SIZE", 1)
+    monkeypatch.setattr(settings, "AI_MAX_BULLETS_TO_ENHANCE", 2)
+    service = AIService()
+    service.cache = None
+    client, completions = make_fake_client(delay=0.01)
+    experience = [{"title": "Engineer", "bullets": [
+        "Organized the team holiday party",
+        "Built Python microservices on Docker and AWS",
+        "Answered phones at the front desk",
+        "Automated Python data pipelines on AWS"
+    ]}]
+    jd_analysis = {"required_skills": ["Python", "Docker", "AWS"], "key_responsibilities": ["Build backend services"]}
+
+    suggestions = asyncio.run(service._enhance_experience_section(experience, jd_analysis, client))
+
+    assert completions.calls == 2
+    assert [s.item_index for s in suggestions] == [1, 3]
@@ -0,0 +1,125 @@
+import asyncio
+import copy
+import time
+
+from app.models.resume import Education, Experience, PersonalInfo, ResumeContent
+from app.services.ats_engine import ATSComplianceEngine
+from app.services.job_analyzer import JobAnalyzer
+from app.utils.constants import ATS_COMPLIANCE_FACTORS
+
+
+def make_resume_text(bullets=None):
+    content = ResumeContent(
+        personal_info=PersonalInfo(
+            name="Jane Doe",
+            email="jane@example.com",
+            phone="(555) 123-4567",
+            linkedin="linkedin.com/in/janedoe"
+        ),
+        summary="Backend engineer focused on Python services and cloud infrastructure.",
+        experience=[
+            Experience(
+                title="Senior Engineer",
+                company="Acme",
+                start_date="Jan 2020",
+                is_current=True,
+                bullets=bullets if bullets is not None else [
+                    "Led migration of 40 services to Kubernetes, cutting deploy time by 60%",
+                    "Built Python and PostgreSQL APIs serving 2M requests per day",
+                    "Reduced AWS spend by $120k per year through rightsizing and autoscaling"
+                ]
+            )
+        ],
+        education=[Education(degree="BSc Computer Science", school="State University", graduation_year="2016")],
+        skills=["Python", "PostgreSQL", "Kubernetes", "AWS", "Docker"]
+    )
+    return asyncio.run(JobAnalyzer().convert_resume_to_text(content))
+
+
+def test_scores_every_factor_of_a_clean_resume():
+    result = ATSComplianceEngine().analyze(make_resume_text(), keywords=["Python", "Kubernetes"])
+
+    factors = result["compliance_factors"]
+    assert list(factors) == ATS_COMPLIANCE_FACTORS
+    assert factors["section_headings"]["score"] == 100
+    assert factors["contact_info"]["score"] == 100
+    assert factors["keywords"]["score"] == 100
+    assert factors["date_format"]["score"] == 100
+    assert factors["bullet_points"]["score"] == 100
+    assert factors["file_format"]["score"] == 100
+    assert result["overall_score"] == round(sum(f["score"] for f in factors.values()) / len(factors))
+    # The sample is well formed but far shorter than a real resume
+    assert result["critical_issues"] == [factors["length"]["feedback"]]
+
+
+def test_flags_missing_sections_contact_and_garbled_text():
+    text = "Experienced developer\nWorked on things\tand stuff (cid:12)\nDid tasks | helped team"
+
+    result = ATSComplianceEngine().analyze(text)
+
+    factors = result["compliance_factors"]
+    assert factors["section_headings"]["score"] == 0
+    assert factors["contact_info"]["score"] == 0
+    assert factors["file_format"]["score"] == 0
+    assert factors["formatting"]["score"] < 70
+    assert factors["contact_info"]["feedback"] in result["critical_issues"]
+    assert factors["formatting"]["feedback"] in result["recommendations"]
+
+
+def test_job_keywords_use_word_boundaries():
+    engine = ATSComplianceEngine()
+    text = make_resume_text()
+
+    result = engine.analyze(text, keywords=["Python", "Go", "Java"])
+
+    # "Go" only counts as a whole word and "Java" is absent
+    assert result["compliance_factors"]["keywords"]["score"] == 33
+    assert "Go, Java" in result["compliance_factors"]["keywords"]["feedback"]
+
+
+def test_mixed_date_formats_are_penalized():
+    text = make_resume_text() + "\nEngineer at Beta (03/2017 - 12/2019)"
+
+    result = ATSComplianceEngine().analyze(text)
+
+    assert result["compliance_factors"]["date_format"]["score"] == 80
+
+
+def test_results_are_cached_by_text_and_keywords():
+    engine = ATSComplianceEngine(max_entries=2)
+    text = make_resume_text()
+
+    first = engine.analyze(text, keywords=["Python"])
+    second = engine.analyze(text, keywords=["python"])
+    engine.analyze(text, keywords=["AWS"])
+
+    assert second == first
+    assert engine.stats() == {"entries": 2, "hits": 1, "misses": 2, "hit_ratio": 0.333}
+
+    engine.analyze("other resume")
+    engine.analyze(text, keywords=["Python"])
+    assert engine.stats()["misses"] == 4
+
+
+def test_changing_a_result_does_not_change_the_cache():
+    engine = ATSComplianceEngine()
+    text = make_resume_text()
+
+    first = engine.analyze(text, keywords=["Python"])
+    expected = copy.deepcopy(first)
+    first["recommendations"].append("Injected")
+    first["compliance_factors"].clear()
+    second = engine.analyze(text, keywords=["Python"])
+    second["overall_score"] = 0
+
+    assert engine.analyze(text, keywords=["Python"]) == expected
+
+
+def test_scoring_is_fast():
+    engine = ATSComplianceEngine()
+    text = make_resume_text([f"Improved service {i} latency by {i}% using Python and Redis caching" for i in range(40)])
+
+    started = time.perf_counter()
+    engine.analyze(text, keywords=["Python", "Redis", "Kafka"])
+
+    assert time.perf_counter() - started < 0.05
@@ -0,0 +1,98 @@
+import asyncio
+import json
+import os
+import sys
+
+import pytest
+
+# The benchmark scripts are run directly, not installed as a package
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
+
+import benchmark_parser  # noqa: E402
+from benchmark_parser import _f1, percentile, score_fields  # noqa: E402
+from generate_resume_corpus import generate_corpus  # noqa: E402
+
+
+TRUTH = {
+    "name": "Jane Doe",
+    "email": "jane.doe7@example.com",
+    "phone": "555-123-4567",
+    "summary": "Engineer with 5 years of experience.",
+    "experience": [
+        {"title": "Software Engineer", "company": "Acme Corp", "bullets": ["Built Python services", "Led Docker rollout"]},
+        {"title": "Data Analyst", "company": "Globex", "bullets": ["Designed SQL reporting"]},
+    ],
+    "education": 1,
+    "skills": ["Docker", "Python", "SQL"],
+}
+
+
+def test_percentile_uses_nearest_rank():
+    samples = [float(n) for n in range(1, 101)]
+
+    assert percentile(samples, 50) == 50.0
+    assert percentile(samples, 99) == 99.0
+    assert percentile(samples, 100) == 100.0
+    assert percentile([4.0], 99) == 4.0
+    assert percentile([], 50) == 0.0
+
+
+def test_f1_ignores_case_and_whitespace():
+    assert _f1([], []) == 1.0
+    assert _f1(["Python"], []) == 0.0
+    assert _f1(["Python", "SQL"], [" python ", "sql"]) == 1.0
+    # One of two expected found, plus one spurious: precision 1/2, recall 1/2
+    assert _f1(["Python", "SQL"], ["Python", "Java"]) == pytest.approx(0.5)
+
+
+def test_score_fields_perfect_and_partial_parses():
+    perfect = {
+        "personal_info": {"name": "Jane Doe ", "email": "jane.doe7@example.com", "phone": "(555) 123 4567"},
+        "summary": "Engineer with  5 years of experience.",
+        "experience": [
+            {"title": "Software Engineer at Acme Corp", "bullets": ["Built Python services", "Led Docker rollout"]},
+            {"title": "Data Analyst", "bullets": ["Designed SQL reporting"]},
+        ],
+        "education": [{"degree": "BSc"}],
+        "skills": ["Python", "Docker", "SQL"],
+    }
+    assert set(score_fields(TRUTH, perfect).values()) == {1.0}
+
+    partial = {
+        "personal_info": {"name": "Jane", "email": "jane.doe7@example.com"},
+        "experience": [{"title": "Data Analyst", "bullets": ["Built Python services"]}],
+        "skills": ["Python"],
+    }
+    scores = score_fields(TRUTH, partial)
+
+    assert scores["name"] == 0.0
+    assert scores["phone"] == 0.0
+    assert scores["summary"] == 0.0
+    # The only parsed job sits where the first expected job should be
+    assert scores["experience"] == 0.0
+    assert scores["bullets"] == pytest.approx(0.5)
+    assert scores["education"] == 0.0
+    assert scores["skills"] == pytest.approx(0.5)
+
+
+def test_same_seed_generates_the_same_corpus(tmp_path):
+    first = asyncio.run(generate_corpus(str(tmp_path / "a"), 4, seed=11))
+    second = asyncio.run(generate_corpus(str(tmp_path / "b"), 4, seed=11))
+    other = asyncio.run(generate_corpus(str(tmp_path / "c"), 4, seed=12))
+
+    assert first == second
+    assert [entry["truth"] for entry in first] != [entry["truth"] for entry in other]
+    assert json.loads((tmp_path / "a" / "manifest.json").read_text())["files"] == first
+    assert sorted(os.listdir(tmp_path / "a")) == sorted([entry["file"] for entry in first] + ["manifest.json"])
+
+
+def test_engine_that_cannot_run_fails_the_accuracy_check(tmp_path, monkeypatch):
+    asyncio.run(generate_corpus(str(tmp_path), 2, seed=11))
+    monkeypatch.setattr(sys, "argv", [
+        "benchmark_parser.py", "--corpus", str(tmp_path), "--engines", "no-such-engine", "--min-accuracy", "0.5"
+    ])
+
+    with pytest.raises(SystemExit) as exit_info:
+        benchmark_parser.main()
+
+    assert exit_info.value.code == 1
@@ -0,0 +1,176 @@
+import asyncio
+import io
+import json
+import os
+import zipfile
+
+import docx
+import pytest
+from fastapi import HTTPException, UploadFile
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.api import resume as resume_api
+from app.config import settings
+from app.services import resume_parser as resume_parser_module
+from app.services.bulk_import import BulkImporter
+from app.services.parse_cache import ParseResultCache
+from app.services.parser_pool import ParserPool, ParserPoolFullError
+from app.services.resume_parser import ResumeParser
+
+
+def docx_bytes(name):
+    document = docx.Document()
+    document.add_paragraph(name)
+    document.add_paragraph(f"{name.split()[0].lower()}@example.com")
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def importer(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_DIRECTORY", str(tmp_path))
+    monkeypatch.setattr(resume_parser_module, "parser_pool", ParserPool(workers=0))
+    monkeypatch.setattr(resume_parser_module, "parse_result_cache", ParseResultCache())
+    return BulkImporter(ResumeParser(), max_in_flight=2, max_files=10)
+
+
+def make_archive(tmp_path, entries):
+    path = tmp_path / "upload.zip"
+    with zipfile.ZipFile(path, "w") as archive:
+        for name, content in entries.items():
+            archive.writestr(name, content)
+    return str(path)
+
+
+def collect(importer, items):
+    async def run():
+        return [json.loads(line) async for line in importer.run(items)]
+    return asyncio.run(run())
+
+
+def test_streams_one_result_per_archive_entry(importer, tmp_path):
+    archive = make_archive(tmp_path, {
+        "a/jane.docx": docx_bytes("Jane Doe"),
+        "a/john.docx": docx_bytes("John Roe"),
+        "notes.txt": b"not a resume",
+        "broken.pdf": b"not a pdf",
+        "__MACOSX/._jane.docx": b"",
+    })
+
+    lines = collect(importer, [{"filename": "batch.zip", "archive": archive}])
+    results = {line["filename"]: line for line in lines if line["type"] == "result"}
+
+    assert results["batch.zip/a/jane.docx"]["parsed_content"]["personal_info"]["email"] == "jane@example.com"
+    assert results["batch.zip/a/john.docx"]["status"] == "parsed"
+    assert results["batch.zip/notes.txt"]["error"] == "Unsupported file format"
+    assert results["batch.zip/broken.pdf"]["status"] == "failed"
+    assert lines[-1] == {"type": "summary", "files": 4, "parsed": 2, "failed": 2}
+    # The scratch copy of the archive is removed once the stream ends
+    assert not (tmp_path / "upload.zip").exists()
+
+
+def test_reports_staging_errors_and_caps_file_count(importer, tmp_path):
+    importer.max_files = 2
+    archive = make_archive(tmp_path, {f"r{i}.docx": docx_bytes(f"Person {i}") for i in range(4)})
+
+    lines = collect(importer, [
+        {"filename": "huge.pdf", "error": "File too large"},
+        {"filename": "batch.zip", "archive": archive},
+    ])
+
+    assert lines[0] == {"type": "result", "filename": "huge.pdf", "status": "failed", "error": "File too large"}
+    assert any("limited to 2 files" in line.get("error", "") for line in lines)
+    assert lines[-1] == {"type": "summary", "files": 3, "parsed": 1, "failed": 2}
+
+
+def test_rejects_invalid_archives(importer, tmp_path):
+    path = tmp_path / "fake.zip"
+    path.write_bytes(b"plain bytes")
+
+    lines = collect(importer, [{"filename": "fake.zip", "archive": str(path)}])
+
+    assert lines[0]["error"] == "Not a valid ZIP archive"
+
+
+class BusyPoolParser:
+    """Parser whose pool is full for the first few calls"""
+
+    def __init__(self, busy_calls):
+        self.busy_calls = busy_calls
+        self.running = 0
+        self.most_running = 0
+
+    async def parse_resume(self, file_path, file_ext, content_hash):
+        if self.busy_calls:
+            self.busy_calls -= 1
+            raise ParserPoolFullError("Too many files are waiting to be parsed; try again later")
+        self.running += 1
+        self.most_running = max(self.most_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        return {"parsed_content": {}, "extraction": {}, "cached": False}
+
+
+def stored_items(count):
+    return [
+        {"filename": f"r{i}.pdf", "file_path": f"r{i}.pdf", "file_ext": ".pdf", "content_hash": f"h{i}"}
+        for i in range(count)
+    ]
+
+
+def test_retries_while_the_parser_pool_is_full_and_caps_pool_use():
+    parser = BusyPoolParser(busy_calls=3)
+    importer = BulkImporter(parser, max_in_flight=4, max_parsing=1, pool_wait_seconds=5)
+
+    lines = collect(importer, stored_items(3))
+
+    assert lines[-1] == {"type": "summary", "files": 3, "parsed": 3, "failed": 0}
+    assert parser.most_running == 1
+
+
+def test_reports_a_file_failed_when_the_pool_stays_full():
+    importer = BulkImporter(BusyPoolParser(busy_calls=1000), pool_wait_seconds=0.2)
+
+    lines = collect(importer, stored_items(1))
+
+    assert lines[0]["status"] == "failed"
+    assert "busy" in lines[0]["error"]
+
+
+def call_bulk_upload(files):
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="token")
+    return asyncio.run(resume_api.bulk_upload_resumes(files=files, credentials=credentials))
+
+
+@pytest.fixture
+def signed_in(tmp_path, monkeypatch):
+    async def get_current_user(token):
+        return object()
+
+    monkeypatch.setattr(settings, "UPLOAD_DIRECTORY", str(tmp_path / "uploads"))
+    monkeypatch.setattr(resume_api.auth_service, "get_current_user", get_current_user)
+
+
+def test_bulk_upload_rejects_too_many_files_before_storing_any(signed_in, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "BULK_IMPORT_MAX_FILES", 1)
+    files = [UploadFile(file=io.BytesIO(docx_bytes("Jane Doe")), filename=f"r{i}.docx") for i in range(2)]
+
+    with pytest.raises(HTTPException) as error:
+        call_bulk_upload(files)
+
+    assert error.value.status_code == 400
+    assert not (tmp_path / "uploads").exists()
+
+
+def test_staged_archive_is_removed_when_the_stream_never_starts(signed_in, tmp_path):
+    with open(make_archive(tmp_path, {"jane.docx": docx_bytes("Jane Doe")}), "rb") as archive:
+        response = call_bulk_upload([UploadFile(file=archive, filename="batch.zip")])
+
+    staged = response.background.args[0][0]["archive"]
+    assert os.path.exists(staged)
+
+    # The client disconnected before the first line: only the background task runs
+    asyncio.run(response.background())
+
+    assert not os.path.exists(staged)
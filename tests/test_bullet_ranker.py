@@ -0,0 +1,38 @@
+from app.services.bullet_ranker import BulletRanker, tokenize
+
+
+def test_tokenize_keeps_technical_terms():
+    assert tokenize("Built C++ and C# services with Node.js for the team.") == [
+        "built", "c++", "c#", "services", "node.js", "team"
+    ]
+
+
+def test_skill_overlap_outranks_unrelated_bullets():
+    ranker = BulletRanker()
+    bullets = [
+        "Coordinated office supplies and vendor invoices",
+        "Designed Kubernetes deployments for Go services",
+        "Migrated Go services to Kubernetes and Terraform"
+    ]
+
+    scores = ranker.score(bullets, ["Go", "Kubernetes", "Terraform"], ["Operate cloud infrastructure"])
+
+    assert scores[0] == 0.0
+    assert scores[2] > scores[1] > scores[0]
+
+
+def test_skills_match_on_word_boundaries():
+    ranker = BulletRanker()
+
+    scores = ranker.score(["Wrote JavaScript widgets", "Wrote Java services"], ["Java"], [])
+
+    assert scores[0] == 0.0
+    assert scores[1] > 0.0
+
+
+def test_select_returns_top_n_in_original_order():
+    ranker = BulletRanker()
+    bullets = ["Python APIs", "Filed reports", "Python and SQL pipelines", "Ran meetings"]
+
+    assert ranker.select(bullets, ["Python", "SQL"], [], limit=2) == [0, 2]
+    assert ranker.select(bullets, ["Python", "SQL"], [], limit=0) == [0, 1, 2, 3]
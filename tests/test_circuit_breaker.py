@@ -0,0 +1,203 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import openai
+
+from app.services.circuit_breaker import CircuitBreaker
+from tests.test_ai_service import make_fake_client, make_service_with_client
+
+
+def make_breaker(**kwargs) -> CircuitBreaker:
+    options = {
+        "window_seconds": 60.0,
+        "min_calls": 4,
+        "error_rate_threshold": 0.5,
+        "latency_slo_seconds": 1.0,
+        "slow_call_rate_threshold": 0.5,
+        "open_seconds": 30.0
+    }
+    options.update(kwargs)
+    return CircuitBreaker(**options)
+
+
+def test_breaker_opens_on_error_rate_once_min_calls_seen():
+    breaker = make_breaker()
+
+    breaker.record_failure(0.1)
+    breaker.record_failure(0.1)
+    breaker.record_success(0.1)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker.record_failure(0.1)
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+    assert breaker.stats()["rejected"] == 1
+
+
+def test_breaker_opens_on_slow_calls():
+    breaker = make_breaker()
+
+    for _ in range(4):
+        breaker.record_success(2.5)
+
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_half_open_allows_one_probe_and_closes_on_success():
+    breaker = make_breaker(open_seconds=0.0)
+    for _ in range(4):
+        breaker.record_failure(0.1)
+
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+
+    breaker.record_success(0.1)
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.stats()["window_calls"] == 0
+
+
+def test_half_open_probe_failure_reopens():
+    breaker = make_breaker(open_seconds=0.05)
+    for _ in range(4):
+        breaker.record_failure(0.1)
+
+    asyncio.run(asyncio.sleep(0.06))
+    assert breaker.allow_request()
+    breaker.record_failure(0.1)
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.times_opened == 2
+
+
+def test_disabled_breaker_never_opens():
+    breaker = make_breaker(enabled=False)
+    for _ in range(10):
+        breaker.record_failure(0.1)
+
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request()
+
+
+def test_open_circuit_serves_rule_based_suggestions():
+    """No completion is attempted; skills and summary come from the JobAnalyzer path"""
+    client, completions = make_fake_client()
+    service = make_service_with_client(client)
+    service.breaker = make_breaker()
+    for _ in range(4):
+        service.breaker.record_failure(0.1)
+
+    resume_sections = {
+        "summary": "Backend engineer.",
+        "experience": [{"title": "Engineer", "bullets": ["Built APIs"]}],
+        "skills": ["Python"]
+    }
+    suggestions = asyncio.run(service.enhance_resume_content(
+        resume_sections,
+        "We need Python, Docker and AWS experience."
+    ))
+
+    assert completions.calls == 0
+    assert service.is_degraded()
+    assert {s.section for s in suggestions} == {"summary", "skills"}
+    assert all(s.is_degraded for s in suggestions)
+    skills = next(s for s in suggestions if s.section == "skills")
+    assert "Docker" in skills.suggested_content
+
+
+RESUME_SECTIONS = {
+    "summary": "Backend engineer.",
+    "experience": [{"title": "Engineer", "bullets": ["Built APIs"]}],
+    "skills": ["Python"]
+}
+
+
+def test_half_open_request_without_the_probe_is_served_degraded():
+    """While another request holds the probe, a new run falls back instead of dropping bullets"""
+    client, completions = make_fake_client()
+    service = make_service_with_client(client)
+    service.breaker = make_breaker(open_seconds=0.0)
+    for _ in range(4):
+        service.breaker.record_failure(0.1)
+    assert service.breaker.allow_request()
+
+    suggestions = asyncio.run(service.enhance_resume_content(RESUME_SECTIONS, "We need Python and Docker."))
+
+    assert completions.calls == 0
+    assert suggestions and all(s.is_degraded for s in suggestions)
+
+
+def test_circuit_opening_mid_run_marks_the_run_degraded():
+    """Bullets refused by the breaker send the run to the fallback path, not silently missing"""
+    client, completions = make_fake_client(delay=0.05)
+    service = make_service_with_client(client)
+    service.cache = None
+    # The JD analysis is the probe; it is slower than the SLO, so the circuit re-opens
+    service.breaker = make_breaker(open_seconds=0.0, latency_slo_seconds=0.01)
+    for _ in range(4):
+        service.breaker.record_failure(0.1)
+    assert service.breaker.state == CircuitBreaker.HALF_OPEN
+    service.breaker.open_seconds = 30.0
+
+    suggestions = asyncio.run(service.enhance_resume_content(
+        RESUME_SECTIONS, "We need Python and Docker.", bypass_cache=True
+    ))
+
+    assert completions.calls == 1
+    assert {s.section for s in suggestions} == {"summary", "skills"}
+    assert all(s.is_degraded for s in suggestions)
+
+
+def test_breaker_latency_excludes_local_queueing():
+    """Time spent waiting in the scheduler does not count against the latency SLO"""
+
+    class QueueingScheduler:
+        async def run(self, api_key, call, estimated_tokens, on_retry=None):
+            await asyncio.sleep(0.05)
+            return await call()
+
+        @staticmethod
+        def is_retryable(error):
+            return False
+
+    client, _ = make_fake_client(delay=0)
+    service = make_service_with_client(client)
+    service.cache = None
+    service.scheduler = QueueingScheduler()
+    service.breaker = make_breaker(latency_slo_seconds=0.02)
+
+    async def run():
+        for bullet in range(4):
+            await service._enhance_bullet(0, bullet, f"Bullet {bullet}", [], [], client, bypass_cache=True)
+
+    asyncio.run(run())
+
+    assert service.breaker.state == CircuitBreaker.CLOSED
+
+
+def test_probe_rejected_for_a_bad_key_leaves_the_circuit_half_open():
+    """A 401 on the probe shows nothing about the provider, so it neither closes nor re-opens"""
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    error = openai.AuthenticationError("Invalid API key", response=httpx.Response(401, request=request), body=None)
+
+    async def create(**kwargs):
+        raise error
+
+    client = SimpleNamespace(api_key="sk-bad-key", chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    service = make_service_with_client(client)
+    service.cache = None
+    service.breaker = make_breaker(open_seconds=0.0)
+    for _ in range(4):
+        service.breaker.record_failure(0.1)
+    assert service.breaker.state == CircuitBreaker.HALF_OPEN
+
+    try:
+        asyncio.run(service._request_completion(client, "system", "prompt", 0.2, 50, "bullet"))
+        assert False, "expected AuthenticationError"
+    except openai.AuthenticationError:
+        pass
+
+    assert service.breaker.state == CircuitBreaker.HALF_OPEN
+    # The probe was freed, so the next request can test the provider
+    assert service.breaker.probe_available()
@@ -0,0 +1,102 @@
+import asyncio
+from types import SimpleNamespace
+from typing import List, Tuple
+
+from app.config import settings
+from app.services.ai_service import AIService
+from app.services.fair_queue import FairQueue, INTERACTIVE, BULK
+
+
+def run_in_grant_order(queue: FairQueue, requests: List[Tuple[str, str, int]]) -> List[str]:
+    """Queue every request behind a held slot, then record the order slots are granted in"""
+    order = []
+
+    async def worker(user: str, priority: str, cost: int):
+        async with queue.slot(user, priority, cost):
+            order.append(user)
+            await asyncio.sleep(0)
+
+    async def scenario():
+        await queue.acquire("blocker")
+        tasks = [asyncio.create_task(worker(*request)) for request in requests]
+        await asyncio.sleep(0)
+        queue.release()
+        await asyncio.gather(*tasks)
+
+    asyncio.run(scenario())
+    return order
+
+
+def test_users_are_served_round_robin():
+    queue = FairQueue(capacity=1)
+    requests = [("heavy", INTERACTIVE, 1)] * 6 + [("light", INTERACTIVE, 1)] * 2
+
+    order = run_in_grant_order(queue, requests)
+
+    assert order[:4] == ["heavy", "light", "heavy", "light"]
+    assert order[4:] == ["heavy"] * 4
+
+
+def test_batch_cost_is_charged_against_user_deficit():
+    queue = FairQueue(capacity=1)
+    requests = [("batcher", INTERACTIVE, 3)] * 2 + [("single", INTERACTIVE, 1)] * 6
+
+    order = run_in_grant_order(queue, requests)
+
+    # A 3-bullet batch waits out three single-bullet turns of the other user
+    assert order.index("batcher") >= 2
+    assert order[:5].count("single") >= 3
+
+
+def test_priority_classes_share_slots_by_weight():
+    queue = FairQueue(capacity=1, class_weights={INTERACTIVE: 3, BULK: 1})
+    requests = [("job", BULK, 1)] * 4 + [("web", INTERACTIVE, 1)] * 6
+
+    order = run_in_grant_order(queue, requests)
+
+    assert order[:4].count("web") == 3
+    assert order[:8].count("job") == 2
+    assert queue.metrics.stats()[BULK]["granted"] == 4
+
+
+def test_cancelled_waiter_does_not_leak_a_slot():
+    queue = FairQueue(capacity=1)
+
+    async def scenario():
+        await queue.acquire("a")
+        waiter = asyncio.create_task(queue.acquire("b"))
+        await asyncio.sleep(0)
+        assert queue.metrics.stats()[INTERACTIVE]["queue_depth"] == 1
+
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        queue.release()
+
+        # The slot is free again for the next caller
+        await asyncio.wait_for(queue.acquire("c"), timeout=1)
+        return queue.stats()
+
+    stats = asyncio.run(scenario())
+
+    assert stats["active"] == 1
+    assert stats["queued"] == 0
+    assert stats["classes"][INTERACTIVE]["queue_depth"] == 0
+
+
+def test_idle_key_queues_are_evicted(monkeypatch):
+    """Queues of API keys that have gone quiet do not accumulate"""
+    monkeypatch.setattr(settings, "AI_KEY_QUEUE_IDLE_SECONDS", 0)
+    service = AIService()
+    first = SimpleNamespace(api_key="sk-user-a")
+    second = SimpleNamespace(api_key="sk-user-b")
+
+    async def run():
+        async with service._get_key_queue(first).slot("user"):
+            # A queue with a slot held is never evicted
+            service._get_key_queue(second)
+            assert len(service._key_queues) == 2
+        service._get_key_queue(SimpleNamespace(api_key="sk-user-c"))
+
+    asyncio.run(run())
+
+    assert len(service._key_queues) == 1
@@ -0,0 +1,107 @@
+import asyncio
+import io
+import os
+
+from fastapi import FastAPI, Request, UploadFile
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.main import app as main_app
+from app.services.file_store import FileTooLargeError, save_upload
+from app.utils.upload_limit import UploadSizeLimitMiddleware
+
+
+def test_save_upload_hashes_in_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_DIRECTORY", str(tmp_path))
+    monkeypatch.setattr(settings, "UPLOAD_CHUNK_SIZE", 4)
+    content = b"resume bytes spread over several chunks"
+
+    stored = asyncio.run(save_upload(UploadFile(io.BytesIO(content), filename="a.pdf"), ".pdf", len(content)))
+
+    assert stored["size"] == len(content)
+    assert stored["file_path"] == os.path.join(str(tmp_path), f"{stored['content_hash']}.pdf")
+    with open(stored["file_path"], "rb") as f:
+        assert f.read() == content
+
+
+def test_save_upload_stops_at_the_limit_and_leaves_no_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_DIRECTORY", str(tmp_path))
+    monkeypatch.setattr(settings, "UPLOAD_CHUNK_SIZE", 4)
+
+    class CountingReader(io.BytesIO):
+        reads = 0
+
+        def read(self, size=-1):
+            CountingReader.reads += 1
+            return super().read(size)
+
+    source = CountingReader(b"x" * 1000)
+    try:
+        asyncio.run(save_upload(UploadFile(source, filename="big.pdf"), ".pdf", max_size=10))
+        assert False, "expected FileTooLargeError"
+    except FileTooLargeError:
+        pass
+
+    # Aborted on the chunk that crossed the limit, not after reading the whole file
+    assert CountingReader.reads == 3
+    assert os.listdir(tmp_path) == []
+
+
+def make_limited_app(limit):
+    app = FastAPI()
+    app.add_middleware(UploadSizeLimitMiddleware, limits={"/upload": limit})
+
+    @app.post("/upload")
+    async def upload(request: Request):
+        return {"size": len(await request.body())}
+
+    @app.post("/other")
+    async def other(request: Request):
+        return {"size": len(await request.body())}
+
+    return app
+
+
+def test_middleware_rejects_declared_length_over_limit():
+    client = TestClient(make_limited_app(10))
+
+    assert client.post("/upload", content=b"x" * 5).json() == {"size": 5}
+    assert client.post("/upload", content=b"x" * 11).status_code == 413
+    assert client.post("/other", content=b"x" * 11).status_code == 200
+
+
+def test_middleware_counts_bytes_without_content_length():
+    client = TestClient(make_limited_app(10))
+
+    def chunks():
+        for _ in range(5):
+            yield b"x" * 4
+
+    response = client.post("/upload", content=chunks())
+
+    assert response.status_code == 413
+
+
+def test_app_limits_both_upload_endpoints_and_413s_carry_cors_headers(monkeypatch):
+    limits = next(m.options["limits"] for m in main_app.user_middleware if m.cls is UploadSizeLimitMiddleware)
+    middleware_classes = [m.cls for m in main_app.user_middleware]
+    # user_middleware lists the outermost first; the limit has to run inside CORS
+    assert middleware_classes.index(CORSMiddleware) < middleware_classes.index(UploadSizeLimitMiddleware)
+
+    client = TestClient(main_app)
+    headers = {"Origin": "http://localhost:8501", "Content-Type": "multipart/form-data; boundary=x"}
+
+    for path in ("/api/resume/upload", "/api/resume/bulk-upload"):
+        monkeypatch.setitem(limits, path, 1024)
+
+        def chunks():
+            # No Content-Length, so the body is counted as it arrives
+            for _ in range(4):
+                yield b"x" * 1024
+
+        for body in (b"x" * 4096, chunks()):
+            response = client.post(path, content=body, headers=headers)
+
+            assert response.status_code == 413
+            assert response.headers["access-control-allow-origin"] == "*"
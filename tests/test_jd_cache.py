@@ -0,0 +1,69 @@
+import asyncio
+
+from app.config import settings
+from app.services.ai_service import AIService
+from app.services.jd_cache import JDAnalysisCache, normalize_job_description
+from app.services.job_analyzer import JobAnalyzer
+from app.services.llm_cache import LLMResponseCache
+from tests.test_ai_service import make_fake_client
+
+JOB_POSTING = """Senior Backend Engineer
+
+We are looking for a Python and AWS engineer.
+- Design and build scalable REST API services
+We are an Equal Opportunity Employer and value diversity.
+"""
+
+
+def test_normalization_ignores_whitespace_case_and_boilerplate():
+    """Re-pasted postings with cosmetic differences normalize identically"""
+    repasted = "  SENIOR backend engineer\n\n\nwe are looking for a python and AWS engineer.\n" \
+               "- Design and build   scalable REST API services\n"
+
+    assert normalize_job_description(JOB_POSTING) == normalize_job_description(repasted)
+    assert "equal opportunity" not in normalize_job_description(JOB_POSTING)
+
+
+def test_llm_analyses_are_scoped_per_tenant_unless_shared():
+    """LLM-derived analyses are only visible to other API keys when sharing is enabled"""
+    private = JDAnalysisCache(store=LLMResponseCache())
+    shared = JDAnalysisCache(store=LLMResponseCache(), share_llm_analyses=True)
+    analysis = {"required_skills": ["Python"]}
+
+    async def run(cache):
+        await cache.set(JOB_POSTING, "llm:gpt", analysis, tenant="sk-user-a")
+        return await cache.get(JOB_POSTING, "llm:gpt", tenant="sk-user-b")
+
+    assert asyncio.run(run(private)) is None
+    assert asyncio.run(run(shared)) == analysis
+
+
+def test_job_analyzer_reuses_cached_analysis():
+    """A second analysis of the same posting is served from the shared cache"""
+    analyzer = JobAnalyzer()
+    analyzer.jd_cache = JDAnalysisCache(store=LLMResponseCache())
+
+    first = asyncio.run(analyzer.analyze_job_description(JOB_POSTING))
+    second = asyncio.run(analyzer.analyze_job_description(JOB_POSTING.upper()))
+
+    assert first == second
+    assert "Python" in first["required_skills"]
+    assert analyzer.jd_cache.stats()["hits"] == 1
+
+
+def test_llm_response_cache_does_not_leak_analyses_between_tenants(monkeypatch):
+    """With analysis sharing off, two keys analysing one posting each make a call"""
+    monkeypatch.setattr(settings, "LLM_CACHE_SHARE_ACROSS_KEYS", True)
+    service = AIService()
+    service.cache = LLMResponseCache()
+    service.jd_cache = JDAnalysisCache(store=LLMResponseCache())
+    client_a, completions_a = make_fake_client(delay=0)
+    client_b, completions_b = make_fake_client(delay=0)
+    client_b.api_key = "sk-other-key"
+
+    asyncio.run(service._analyze_job_description(JOB_POSTING, client_a))
+    analysis = asyncio.run(service._analyze_job_description(JOB_POSTING, client_b))
+
+    assert completions_a.calls == 1
+    assert completions_b.calls == 1
+    assert analysis["required_skills"] == ["Python", "Docker"]
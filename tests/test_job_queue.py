@@ -0,0 +1,148 @@
+import asyncio
+import uuid
+from typing import Dict, List, Optional
+
+from fastapi import HTTPException
+
+from app.models.resume import MatchAnalysis, MatchJob, MatchJobStatus
+from app.services.job_queue import MatchJobQueue, QueueFullError
+
+
+class FakeMatchJobCRUD:
+    """In-memory stand-in for MatchJobCRUD"""
+
+    def __init__(self, jobs: Optional[List[MatchJob]] = None):
+        self.jobs: Dict[str, MatchJob] = {job.id: job for job in jobs or []}
+
+    async def create_job(self, job: MatchJob) -> MatchJob:
+        job = job.copy(update={"id": str(uuid.uuid4())})
+        self.jobs[job.id] = job
+        return job
+
+    async def claim_job(self, job_id: str) -> Optional[MatchJob]:
+        job = self.jobs[job_id]
+        if job.status != MatchJobStatus.QUEUED:
+            return None
+        job.status = MatchJobStatus.RUNNING
+        job.attempts += 1
+        return job
+
+    async def finish_job(self, job_id: str, result=None, error=None):
+        job = self.jobs[job_id]
+        job.status = MatchJobStatus.FAILED if error is not None else MatchJobStatus.SUCCEEDED
+        job.result = result
+        job.error = error
+
+    async def recover_jobs(self, max_attempts: int) -> List[str]:
+        for job in self.jobs.values():
+            if job.status == MatchJobStatus.RUNNING:
+                job.status = MatchJobStatus.FAILED if job.attempts >= max_attempts else MatchJobStatus.QUEUED
+        return [job.id for job in self.jobs.values() if job.status == MatchJobStatus.QUEUED]
+
+
+def make_job(**kwargs) -> MatchJob:
+    return MatchJob(user_id="user", resume_id="resume", job_description_id="jd", **kwargs)
+
+
+def make_result(job: MatchJob) -> MatchAnalysis:
+    return MatchAnalysis(
+        resume_id=job.resume_id,
+        job_description_id=job.job_description_id,
+        overall_score=70,
+        ats_compliance_score=80
+    )
+
+
+def test_workers_bound_concurrency_and_store_results():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def run_job(job: MatchJob) -> MatchAnalysis:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return make_result(job)
+
+    crud = FakeMatchJobCRUD()
+    queue = MatchJobQueue(run_job, crud=crud, workers=3)
+
+    async def scenario():
+        await queue.start()
+        jobs = [await queue.submit(make_job()) for _ in range(10)]
+        await queue._queue.join()
+        await queue.stop()
+        return jobs
+
+    jobs = asyncio.run(scenario())
+
+    assert max_in_flight == 3
+    assert all(crud.jobs[job.id].status == MatchJobStatus.SUCCEEDED for job in jobs)
+    assert crud.jobs[jobs[0].id].result.overall_score == 70
+    assert queue.stats()["succeeded"] == 10
+
+
+def test_failed_job_records_error():
+    async def run_job(job: MatchJob) -> MatchAnalysis:
+        raise HTTPException(status_code=404, detail="Resume or job description not found")
+
+    crud = FakeMatchJobCRUD()
+    queue = MatchJobQueue(run_job, crud=crud, workers=1)
+
+    async def scenario():
+        await queue.start()
+        job = await queue.submit(make_job())
+        await queue._queue.join()
+        await queue.stop()
+        return job
+
+    job = asyncio.run(scenario())
+
+    assert crud.jobs[job.id].status == MatchJobStatus.FAILED
+    assert crud.jobs[job.id].error == "Resume or job description not found"
+
+
+def test_start_recovers_interrupted_jobs():
+    interrupted = make_job(id="interrupted", status=MatchJobStatus.RUNNING, attempts=1)
+    exhausted = make_job(id="exhausted", status=MatchJobStatus.RUNNING, attempts=3)
+    queued = make_job(id="queued")
+    crud = FakeMatchJobCRUD([interrupted, exhausted, queued])
+    ran = []
+
+    async def run_job(job: MatchJob) -> MatchAnalysis:
+        ran.append(job.id)
+        return make_result(job)
+
+    queue = MatchJobQueue(run_job, crud=crud, workers=1, max_attempts=3)
+
+    async def scenario():
+        await queue.start()
+        await queue._queue.join()
+        await queue.stop()
+
+    asyncio.run(scenario())
+
+    assert ran == ["interrupted", "queued"]
+    assert crud.jobs["interrupted"].attempts == 2
+    assert crud.jobs["exhausted"].status == MatchJobStatus.FAILED
+
+
+def test_submit_rejects_when_full():
+    async def run_job(job: MatchJob) -> MatchAnalysis:
+        await asyncio.sleep(1)
+
+    queue = MatchJobQueue(run_job, crud=FakeMatchJobCRUD(), workers=1, max_pending=2)
+
+    async def scenario():
+        await queue.start()
+        await queue.stop()  # No workers draining, so submissions pile up
+        await queue.submit(make_job())
+        await queue.submit(make_job())
+        try:
+            await queue.submit(make_job())
+        except QueueFullError:
+            return True
+        return False
+
+    assert asyncio.run(scenario())
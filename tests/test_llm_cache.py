@@ -0,0 +1,87 @@
+import asyncio
+
+from app.config import settings
+from app.services.ai_service import AIService
+from app.services.llm_cache import LLMResponseCache
+from tests.test_ai_service import make_fake_client
+
+
+def test_lru_evicts_least_recently_used():
+    """The in-memory tier keeps only the most recently used entries"""
+    cache = LLMResponseCache(max_entries=2)
+
+    async def run():
+        await cache.set("a", "1")
+        await cache.set("b", "2")
+        await cache.get("a")
+        await cache.set("c", "3")
+        return await cache.get("a"), await cache.get("b"), await cache.get("c")
+
+    assert asyncio.run(run()) == ("1", None, "3")
+    assert cache.stats()["hits"] == 3
+    assert cache.stats()["misses"] == 1
+
+
+def test_expired_entries_are_misses(monkeypatch):
+    """Entries older than the TTL are not served"""
+    import app.services.llm_cache as llm_cache
+
+    cache = LLMResponseCache(ttl_seconds=10)
+    now = [1000.0]
+    monkeypatch.setattr(llm_cache.time, "time", lambda: now[0])
+
+    async def run():
+        await cache.set("key", "value")
+        fresh = await cache.get("key")
+        now[0] += 11
+        return fresh, await cache.get("key")
+
+    assert asyncio.run(run()) == ("value", None)
+
+
+def test_sqlite_tier_survives_restart(tmp_path):
+    """A new cache instance on the same database file sees earlier entries"""
+    db_path = str(tmp_path / "llm_cache.db")
+
+    asyncio.run(LLMResponseCache(db_path=db_path).set("key", '{"ok": true}'))
+    restarted = LLMResponseCache(db_path=db_path)
+
+    assert asyncio.run(restarted.get("key")) == '{"ok": true}'
+    assert restarted.stats()["disk_hits"] == 1
+
+
+def test_ai_service_serves_repeat_prompts_from_cache():
+    """Identical completions are only paid for once unless the cache is bypassed"""
+    service = AIService()
+    service.cache = LLMResponseCache()
+    client, completions = make_fake_client(delay=0)
+    experience = [{"bullets": ["Built APIs", "Wrote tests"]}]
+
+    first = asyncio.run(service._enhance_experience_section(experience, {}, client))
+    second = asyncio.run(service._enhance_experience_section(experience, {}, client))
+    calls_after_repeat = completions.calls
+    asyncio.run(service._enhance_experience_section(experience, {}, client, bypass_cache=True))
+
+    assert [s.suggested_content for s in first] == [s.suggested_content for s in second]
+    assert calls_after_repeat == 1
+    assert completions.calls == 2
+
+
+def test_cached_completions_are_scoped_to_the_api_key(monkeypatch):
+    """Another key repeating a prompt pays for its own completion unless sharing is enabled"""
+    experience = [{"bullets": ["Built APIs"]}]
+
+    def run_two_keys():
+        service = AIService()
+        service.cache = LLMResponseCache()
+        client_a, completions_a = make_fake_client(delay=0)
+        client_b, completions_b = make_fake_client(delay=0)
+        client_b.api_key = "sk-other-key"
+        asyncio.run(service._enhance_experience_section(experience, {}, client_a))
+        asyncio.run(service._enhance_experience_section(experience, {}, client_b))
+        return completions_a.calls, completions_b.calls
+
+    assert run_two_keys() == (1, 1)
+
+    monkeypatch.setattr(settings, "LLM_CACHE_SHARE_ACROSS_KEYS", True)
+    assert run_two_keys() == (1, 0)
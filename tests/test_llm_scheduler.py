@@ -0,0 +1,122 @@
+import asyncio
+import time
+
+import httpx
+import openai
+import pytest
+
+from app.services.llm_scheduler import RateLimitScheduler, TokenBucket
+
+
+def make_status_error(error_class, status_code: int, headers=None):
+    response = httpx.Response(
+        status_code,
+        headers=headers or {},
+        request=httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    )
+    return error_class("provider error", response=response, body=None)
+
+
+def make_scheduler(**kwargs):
+    defaults = dict(requests_per_minute=6000, tokens_per_minute=10_000_000, base_delay=0.01, max_delay=1.0)
+    defaults.update(kwargs)
+    return RateLimitScheduler(**defaults)
+
+
+def test_rate_limited_call_is_retried_after_retry_after():
+    """A 429 is retried once its Retry-After has elapsed instead of being dropped"""
+    scheduler = make_scheduler()
+    attempts = []
+
+    async def call():
+        attempts.append(time.monotonic())
+        if len(attempts) == 1:
+            raise make_status_error(openai.RateLimitError, 429, {"retry-after": "0.05"})
+        return "ok"
+
+    assert asyncio.run(scheduler.run("sk-a", call, estimated_tokens=10)) == "ok"
+    assert attempts[1] - attempts[0] >= 0.05
+    assert scheduler.stats()["retries"] == 1
+
+
+def test_non_retryable_errors_fail_fast():
+    """Client errors such as a bad request are raised without retrying"""
+    scheduler = make_scheduler()
+    attempts = []
+
+    async def call():
+        attempts.append(1)
+        raise make_status_error(openai.BadRequestError, 400)
+
+    with pytest.raises(openai.BadRequestError):
+        asyncio.run(scheduler.run("sk-a", call, estimated_tokens=10))
+    assert len(attempts) == 1
+
+
+def test_server_errors_give_up_after_max_retries():
+    """Persistent 5xx replies are retried max_retries times, then raised"""
+    scheduler = make_scheduler(max_retries=2)
+    attempts = []
+
+    async def call():
+        attempts.append(1)
+        raise make_status_error(openai.InternalServerError, 503)
+
+    with pytest.raises(openai.InternalServerError):
+        asyncio.run(scheduler.run("sk-a", call, estimated_tokens=10))
+    assert len(attempts) == 3
+    assert scheduler.stats()["failures"] == 1
+
+
+def test_requests_are_paced_to_the_quota():
+    """Once the burst allowance is spent, calls are admitted at the per-key rate"""
+    # 600 rpm with 0.1s of burst = 1 request up front, then one every 0.1s
+    scheduler = make_scheduler(requests_per_minute=600, headroom=1.0, burst_seconds=0.1)
+
+    async def call():
+        return "ok"
+
+    async def run():
+        started = time.monotonic()
+        await asyncio.gather(*[scheduler.run("sk-a", call, estimated_tokens=1) for _ in range(4)])
+        return time.monotonic() - started
+
+    assert asyncio.run(run()) >= 0.28
+
+
+def test_token_bucket_pause_blocks_admission():
+    """Pausing a bucket after a 429 delays the next admission"""
+    bucket = TokenBucket(rate_per_second=10, capacity=10)
+    bucket.pause(1.0)
+
+    assert bucket.delay_for(1) > 0.9
+
+
+def test_idle_key_limiters_are_evicted():
+    """Limiters for keys that have gone quiet and refilled are dropped as new keys arrive"""
+    # 1000 requests/s with a 10-request bucket: a used bucket is full again within milliseconds
+    scheduler = make_scheduler(requests_per_minute=60_000, headroom=1.0, burst_seconds=0.01)
+
+    async def call():
+        return "ok"
+
+    async def main():
+        for key in range(50):
+            await scheduler.run(f"sk-user-{key}", call, estimated_tokens=10)
+            await asyncio.sleep(0.005)
+
+    asyncio.run(main())
+
+    assert scheduler.stats()["keys"] <= 2
+
+
+def test_limiter_in_use_or_refilling_is_kept():
+    scheduler = make_scheduler(requests_per_minute=60, headroom=1.0, burst_seconds=1.0)
+    busy = scheduler._get_limiter("sk-busy")
+    busy.in_use = 1
+    drained = scheduler._get_limiter("sk-drained")
+    drained.requests.consume(1)
+
+    scheduler._get_limiter("sk-new")
+
+    assert scheduler.stats()["keys"] == 3
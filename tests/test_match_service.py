@@ -0,0 +1,142 @@
+import asyncio
+import json
+
+from app.models.resume import (
+    AISuggestion, Experience, JobDescription, PersonalInfo, Resume, ResumeContent, SuggestionType
+)
+from app.services import match_service as match_service_module
+from app.services.circuit_breaker import CircuitOpenError
+from app.services.match_service import MatchService
+from app.services.telemetry import telemetry
+from tests.test_ai_service import make_fake_client, make_service_with_client
+
+
+class FakeMatchCRUD:
+    def __init__(self):
+        self.saved = []
+
+    async def get_latest_match_analysis(self, resume_id, job_description_id):
+        return None
+
+    async def create_match_analysis(self, match_analysis):
+        match_analysis.id = f"match-{len(self.saved)}"
+        self.saved.append(match_analysis)
+        return match_analysis
+
+
+def make_inputs():
+    resume = Resume(
+        id="resume-1",
+        user_id="user-1",
+        title="Master",
+        content=ResumeContent(
+            personal_info=PersonalInfo(name="Jane Doe", email="jane@example.com"),
+            skills=["Python"]
+        )
+    )
+    job_desc = JobDescription(
+        id="job-1", user_id="user-1", title="Engineer", company="Acme",
+        content="We need Python and Docker.", required_skills=["Python", "Docker"]
+    )
+    return {"user_api_key": "sk-user", "resume": resume, "job_desc": job_desc}
+
+
+def make_suggestion(reused: bool) -> AISuggestion:
+    return AISuggestion(
+        section="experience", original_content="Built APIs", suggested_content="Built REST APIs",
+        explanation="Added detail", relevance_score=80, suggestion_type=SuggestionType.ENHANCEMENT,
+        fingerprint="fp", is_reused=reused
+    )
+
+
+def run_streamed_match(monkeypatch, stream):
+    service = MatchService()
+    service.match_crud = FakeMatchCRUD()
+    monkeypatch.setattr(match_service_module.ai_service, "stream_resume_suggestions", stream)
+    events = []
+
+    async def report(event_type, data):
+        events.append(event_type)
+
+    match = asyncio.run(service.match_resume(
+        "user-1", "resume-1", "job-1", inputs=make_inputs(), on_progress=report
+    ))
+    return match, events, service.match_crud.saved
+
+
+def test_streamed_run_reports_progress_and_stores_the_same_analysis(monkeypatch):
+    """The streaming path goes through the shared pipeline, so counts and telemetry match"""
+    telemetry.reset()
+
+    async def stream(**kwargs):
+        yield make_suggestion(reused=True)
+        yield make_suggestion(reused=False)
+
+    match, events, saved = run_streamed_match(monkeypatch, stream)
+
+    assert events == ["suggestion", "suggestion", "match_score", "ats_compliance"]
+    assert saved == [match]
+    assert match.reused_suggestions == 1
+    assert match.regenerated_suggestions == 1
+    assert not match.is_degraded
+    assert {"stream_suggestions", "scoring", "ats_compliance", "match_resume"} <= set(telemetry.snapshot()["pipeline"])
+
+
+def test_circuit_opening_mid_stream_marks_the_stored_run_degraded(monkeypatch):
+    async def stream(**kwargs):
+        yield make_suggestion(reused=False)
+        raise CircuitOpenError("LLM circuit is open")
+
+    match, events, _ = run_streamed_match(monkeypatch, stream)
+
+    assert events[0] == "suggestion"
+    assert len(match.suggestions) == 1
+    assert match.is_degraded
+
+
+class StoringMatchCRUD(FakeMatchCRUD):
+    async def get_latest_match_analysis(self, resume_id, job_description_id):
+        return self.saved[-1] if self.saved else None
+
+
+def test_bullet_scored_below_threshold_is_not_sent_again(monkeypatch):
+    """Rejected bullets are hidden but remembered, so an unchanged resume costs no LLM call"""
+    client, completions = make_fake_client(delay=0)
+    answer = completions.create
+
+    async def create(**kwargs):
+        response = await answer(**kwargs)
+        reply = json.loads(response.choices[0].message.content)
+        # The model finds the lunch bullet irrelevant to the job
+        for bullet in reply.get("bullets", [reply]):
+            if "lunches" in bullet.get("enhanced_bullet", ""):
+                bullet["relevance_score"] = 20
+        response.choices[0].message.content = json.dumps(reply)
+        return response
+
+    completions.create = create
+    ai = make_service_with_client(client)
+    ai.cache = None
+    monkeypatch.setattr(match_service_module, "ai_service", ai)
+
+    service = MatchService()
+    service.match_crud = StoringMatchCRUD()
+    inputs = make_inputs()
+    inputs["user_api_key"] = None
+    inputs["resume"].content.experience = [Experience(
+        title="Engineer", company="Acme", start_date="2020",
+        bullets=["Built Python services on Docker", "Organized team lunches"]
+    )]
+
+    first = asyncio.run(service.match_resume("user-1", "resume-1", "job-1", inputs=inputs))
+    calls_after_first = completions.calls
+    second = asyncio.run(service.match_resume("user-1", "resume-1", "job-1", inputs=inputs))
+
+    assert [s.original_content for s in first.suggestions if s.section == "experience"] == [
+        "Built Python services on Docker"
+    ]
+    assert len(first.rejected_suggestions) == 1
+    assert completions.calls == calls_after_first
+    assert second.reused_suggestions == 1
+    assert len(second.rejected_suggestions) == 1
+    assert "rejected_suggestions" not in second.dict()
@@ -0,0 +1,74 @@
+import asyncio
+
+from app.services.openai_clients import OpenAIClientPool
+
+
+def test_pool_reuses_client_per_api_key():
+    """The same API key always gets the same warm client"""
+    pool = OpenAIClientPool(max_clients=4)
+
+    first = pool.get("sk-user-a")
+    again = pool.get("sk-user-a")
+    other = pool.get("sk-user-b")
+
+    assert first is again
+    assert first is not other
+    assert pool.stats()["created"] == 2
+    assert pool.stats()["reused"] == 1
+
+
+def test_pool_evicts_and_closes_least_recently_used():
+    """Clients beyond the pool size are evicted LRU-first and closed"""
+    pool = OpenAIClientPool(max_clients=2)
+
+    async def run():
+        a = pool.get("sk-user-a")
+        b = pool.get("sk-user-b")
+        pool.get("sk-user-a")
+        pool.get("sk-user-c")
+        await asyncio.sleep(0.01)
+        return a, b
+
+    a, b = asyncio.run(run())
+
+    assert b.is_closed()
+    assert not a.is_closed()
+    assert pool.get("sk-user-a") is a
+    assert pool.stats()["evicted"] == 1
+
+
+def test_evicted_client_stays_open_until_its_lease_is_released():
+    """A client still in use is only closed once the last lease ends"""
+    pool = OpenAIClientPool(max_clients=1)
+
+    async def run():
+        async with pool.lease("sk-user-a") as a:
+            pool.get("sk-user-b")
+            await asyncio.sleep(0.01)
+            open_while_leased = not a.is_closed()
+        await asyncio.sleep(0.01)
+        return a, open_while_leased
+
+    a, open_while_leased = asyncio.run(run())
+
+    assert open_while_leased
+    assert a.is_closed()
+    assert pool.stats()["awaiting_close"] == 0
+
+
+def test_pinned_client_is_never_evicted():
+    """The server key's client survives any amount of per-user churn"""
+    pool = OpenAIClientPool(max_clients=1)
+
+    async def run():
+        server = pool.pin("sk-server")
+        for user in range(3):
+            pool.get(f"sk-user-{user}")
+        await asyncio.sleep(0.01)
+        return server
+
+    server = asyncio.run(run())
+
+    assert not server.is_closed()
+    assert pool.get("sk-server") is server
+    assert pool.stats()["pinned"] == 1
@@ -0,0 +1,85 @@
+import asyncio
+import io
+
+import docx
+from fastapi import UploadFile
+
+from app.config import settings
+from app.services import resume_parser as resume_parser_module
+from app.services.file_store import save_upload
+from app.services.llm_cache import LLMResponseCache
+from app.services.parse_cache import ParseResultCache
+from app.services.parser_pool import ParserPool
+from app.services.resume_parser import ResumeParser
+
+
+def make_docx(path):
+    document = docx.Document()
+    document.add_paragraph("Jane Doe")
+    document.add_paragraph("jane@example.com")
+    document.save(str(path))
+    return str(path)
+
+
+def test_cache_counts_hits_and_time_saved():
+    cache = ParseResultCache(store=LLMResponseCache(max_entries=10))
+
+    async def scenario():
+        assert await cache.get("abc", ".pdf") is None
+        await cache.set("abc", ".pdf", {"parsed_content": {}, "parse_seconds": 1.5})
+        return await cache.get("abc", ".pdf"), await cache.get("abc", ".docx")
+
+    hit, other_ext = asyncio.run(scenario())
+
+    assert hit["parse_seconds"] == 1.5
+    assert other_ext is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+    assert cache.stats()["seconds_saved"] == 1.5
+
+
+def test_key_changes_with_parser_configuration(monkeypatch):
+    cache = ParseResultCache()
+    key = cache.make_key("abc", ".pdf")
+
+    monkeypatch.setattr(settings, "PDF_ENGINES", ["pypdf2"])
+
+    assert cache.make_key("abc", ".pdf") != key
+
+
+def test_same_content_is_parsed_once(tmp_path, monkeypatch):
+    cache = ParseResultCache(store=LLMResponseCache(max_entries=10))
+    monkeypatch.setattr(resume_parser_module, "parse_result_cache", cache)
+    monkeypatch.setattr(resume_parser_module, "parser_pool", ParserPool(workers=0))
+    path = make_docx(tmp_path / "resume.docx")
+    parser = ResumeParser()
+
+    async def scenario():
+        concurrent = await asyncio.gather(*(parser.parse_resume(path, ".docx", "hash-1") for _ in range(3)))
+        return concurrent, await parser.parse_resume(path, ".docx", "hash-1")
+
+    concurrent, again = asyncio.run(scenario())
+
+    assert [result["cached"] for result in concurrent] == [False] * 3
+    assert again["cached"] is True
+    assert again["parsed_content"] == concurrent[0]["parsed_content"]
+    assert resume_parser_module.parser_pool.stats()["completed"] == 1
+
+
+def test_identical_uploads_are_stored_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_DIRECTORY", str(tmp_path))
+
+    async def upload(content):
+        return await save_upload(UploadFile(file=io.BytesIO(content), filename="resume.pdf"), ".pdf")
+
+    first = asyncio.run(upload(b"%PDF-1.4 same bytes"))
+    second = asyncio.run(upload(b"%PDF-1.4 same bytes"))
+    other = asyncio.run(upload(b"%PDF-1.4 other bytes"))
+
+    assert first["file_path"] == second["file_path"]
+    assert not first["deduplicated"] and second["deduplicated"]
+    assert first["size"] == len(b"%PDF-1.4 same bytes")
+    assert other["content_hash"] != first["content_hash"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted([
+        f"{first['content_hash']}.pdf", f"{other['content_hash']}.pdf"
+    ])
@@ -0,0 +1,145 @@
+import asyncio
+import time
+
+import docx
+import pytest
+
+from app.services import resume_parser as resume_parser_module
+from app.services.parser_pool import ParserPool, ParserPoolFullError, ParserTimeoutError, ParserWorkerError, _Worker
+from app.services.resume_parser import ResumeParser
+
+
+def run_with_pool(pool, scenario):
+    async def main():
+        pool.start()
+        try:
+            return await scenario()
+        finally:
+            await pool.stop()
+
+    return asyncio.run(main())
+
+
+def test_runs_work_in_worker_processes_and_reraises_errors():
+    pool = ParserPool(workers=2, timeout=10)
+
+    async def scenario():
+        results = await asyncio.gather(*(pool.run(pow, 2, n) for n in range(6)))
+        with pytest.raises(ValueError):
+            await pool.run(int, "not a number")
+        return results
+
+    assert run_with_pool(pool, scenario) == [1, 2, 4, 8, 16, 32]
+    assert pool.stats()["completed"] == 6
+    assert pool.stats()["failed"] == 1
+
+
+def test_runaway_parse_is_killed_and_worker_replaced():
+    pool = ParserPool(workers=1, timeout=0.5)
+
+    async def scenario():
+        started = time.monotonic()
+        with pytest.raises(ParserTimeoutError):
+            await pool.run(time.sleep, 30)
+        elapsed = time.monotonic() - started
+
+        # The replacement worker serves the next file
+        return elapsed, await pool.run(pow, 3, 2)
+
+    elapsed, result = run_with_pool(pool, scenario)
+
+    assert elapsed < 5
+    assert result == 9
+    assert pool.stats()["timeouts"] == 1
+    assert pool.stats()["restarts"] == 1
+
+
+def test_killing_and_respawning_a_worker_does_not_block_the_loop(monkeypatch):
+    pool = ParserPool(workers=1, timeout=0.5)
+    kill = _Worker.kill
+
+    def slow_kill(worker):
+        # Stands in for a worker that takes its time to die
+        time.sleep(1)
+        kill(worker)
+
+    monkeypatch.setattr(_Worker, "kill", slow_kill)
+
+    async def scenario():
+        gaps = []
+
+        async def tick():
+            last = time.monotonic()
+            while True:
+                await asyncio.sleep(0.05)
+                now = time.monotonic()
+                gaps.append(now - last)
+                last = now
+
+        ticker = asyncio.create_task(tick())
+        with pytest.raises(ParserTimeoutError):
+            await pool.run(time.sleep, 30)
+        result = await pool.run(pow, 3, 2)
+        ticker.cancel()
+        return max(gaps), result
+
+    longest_gap, result = run_with_pool(pool, scenario)
+
+    assert longest_gap < 0.5
+    assert result == 9
+    assert pool.stats()["restarts"] == 1
+
+
+def test_stop_kills_workers_that_are_still_parsing():
+    pool = ParserPool(workers=1, timeout=30)
+
+    async def scenario():
+        pool.start()
+        parse = asyncio.create_task(pool.run(time.sleep, 30))
+        while not pool._busy:
+            await asyncio.sleep(0.01)
+        busy = next(iter(pool._busy))
+
+        started = time.monotonic()
+        await pool.stop()
+        with pytest.raises(ParserWorkerError):
+            await parse
+        return busy, time.monotonic() - started
+
+    busy, elapsed = asyncio.run(scenario())
+
+    assert not busy.process.is_alive()
+    assert elapsed < 5
+    assert pool.stats()["restarts"] == 0
+
+
+def test_rejects_parses_beyond_max_pending():
+    pool = ParserPool(workers=1, max_pending=1, timeout=10)
+
+    async def scenario():
+        slow = asyncio.create_task(pool.run(time.sleep, 0.5))
+        await asyncio.sleep(0)
+        with pytest.raises(ParserPoolFullError):
+            await pool.run(pow, 2, 2)
+        await slow
+
+    run_with_pool(pool, scenario)
+
+
+def test_resume_parser_dispatches_to_pool(tmp_path, monkeypatch):
+    path = tmp_path / "resume.docx"
+    document = docx.Document()
+    document.add_paragraph("Jane Doe")
+    document.add_paragraph("jane@example.com")
+    document.add_paragraph("Skills: Python, Docker")
+    document.save(str(path))
+
+    pool = ParserPool(workers=1, timeout=30, warm_modules=("app.services.resume_parser",))
+    monkeypatch.setattr(resume_parser_module, "parser_pool", pool)
+
+    parsed = run_with_pool(pool, lambda: ResumeParser().parse_resume(str(path), ".docx"))
+
+    assert parsed["parsed_content"]["personal_info"]["email"] == "jane@example.com"
+    assert "Python" in parsed["parsed_content"]["skills"]
+    assert parsed["extraction"]["engine"] == "python-docx"
+    assert pool.stats()["completed"] == 1
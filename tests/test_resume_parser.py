@@ -0,0 +1,143 @@
+import time
+
+import pytest
+from reportlab.lib.pagesizes import letter
+from reportlab.pdfgen import canvas
+
+from app.services.resume_parser import PDFEngine, PyMuPDFEngine, ResumeParser
+from app.services.section_segmenter import segment_sections
+
+
+def make_pdf(path, lines):
+    pdf = canvas.Canvas(str(path), pagesize=letter)
+    y = 750
+    for line in lines:
+        pdf.drawString(72, y, line)
+        y -= 16
+    pdf.save()
+    return str(path)
+
+
+@pytest.fixture
+def resume_pdf(tmp_path):
+    return make_pdf(tmp_path / "resume.pdf", ["Jane Doe", "jane@example.com", "Skills: Python, Docker"])
+
+
+def test_pymupdf_is_the_default_engine(resume_pdf):
+    result = ResumeParser().parse_file(resume_pdf, ".pdf")
+
+    assert result["extraction"]["engine"] == "pymupdf"
+    assert len(result["extraction"]["attempts"]) == 1
+    assert result["parsed_content"]["personal_info"]["email"] == "jane@example.com"
+
+
+def test_falls_back_when_an_engine_fails(resume_pdf, monkeypatch):
+    def broken(self, file_path):
+        raise RuntimeError("cannot open")
+
+    monkeypatch.setattr(PyMuPDFEngine, "extract", broken)
+
+    extraction = ResumeParser().parse_file(resume_pdf, ".pdf")["extraction"]
+
+    assert extraction["engine"] == "pdfplumber"
+    assert extraction["attempts"][0]["engine"] == "pymupdf"
+    assert extraction["attempts"][0]["error"] == "cannot open"
+
+
+def test_falls_back_on_empty_output(resume_pdf, monkeypatch):
+    monkeypatch.setattr(PyMuPDFEngine, "extract", lambda self, file_path: "  \n")
+
+    extraction = ResumeParser(pdf_engines=["pymupdf", "pypdf2"]).parse_file(resume_pdf, ".pdf")["extraction"]
+
+    assert extraction["engine"] == "pypdf2"
+    assert [attempt["engine"] for attempt in extraction["attempts"]] == ["pymupdf", "pypdf2"]
+
+
+def test_raises_when_every_engine_fails(tmp_path):
+    path = tmp_path / "broken.pdf"
+    path.write_bytes(b"not a pdf")
+
+    with pytest.raises(Exception, match="Failed to extract PDF text: pymupdf: .*pdfplumber: .*pypdf2: "):
+        ResumeParser().parse_file(str(path), ".pdf")
+
+
+def test_rejects_unknown_engines():
+    with pytest.raises(ValueError):
+        ResumeParser(pdf_engines=["tesseract"])
+
+
+def test_engine_without_extract_fails_when_constructed():
+    class IncompleteEngine(PDFEngine):
+        name = "incomplete"
+
+    with pytest.raises(TypeError):
+        IncompleteEngine()
+
+
+SAMPLE_TEXT = """Jane Doe
+jane@example.com | 555-123-4567
+SUMMARY
+Backend engineer with 8 years of experience.
+Focused on APIs.
+Work Experience
+Senior Software Engineer, Acme
+• Built Python services
+• Cut latency by 40%
+Data Analyst, Beta
+- Automated SQL reports
+Education
+BSc Computer Science, State University (bachelor)
+Skills: Python, Docker, Kubernetes
+PROJECTS
+Resume Tailor
+Matches resumes to jobs
+- FastAPI backend
+Certifications
+• AWS Certified Developer
+AWARDS
+Employee of the year
+"""
+
+
+def test_segments_sections_in_one_pass():
+    sections = segment_sections(SAMPLE_TEXT)
+
+    assert sections.header() == ["Jane Doe", "jane@example.com | 555-123-4567"]
+    assert sections.lines("summary") == ["Backend engineer with 8 years of experience.", "Focused on APIs."]
+    assert sections.lines("skills") == ["Python, Docker, Kubernetes"]
+    assert sections.lines("certifications") == ["• AWS Certified Developer"]
+    # Unextracted sections still close the one before them
+    assert sections.lines("other") == ["Employee of the year", ""]
+    assert not sections.has("languages")
+
+
+def test_extractors_read_only_their_section():
+    parsed = ResumeParser()._parse_text_content(SAMPLE_TEXT)
+
+    assert parsed["personal_info"]["name"] == "Jane Doe"
+    assert parsed["personal_info"]["phone"] == "555-123-4567"
+    assert parsed["summary"] == "Backend engineer with 8 years of experience. Focused on APIs."
+    assert [job["title"] for job in parsed["experience"]] == ["Senior Software Engineer, Acme", "Data Analyst, Beta"]
+    assert parsed["experience"][0]["bullets"] == ["Built Python services", "Cut latency by 40%"]
+    assert parsed["projects"] == [{
+        "name": "Resume Tailor",
+        "description": "Matches resumes to jobs",
+        "technologies": [],
+        "url": None,
+        "bullets": ["FastAPI backend"]
+    }]
+    assert parsed["certifications"] == ["AWS Certified Developer"]
+    assert len(parsed["education"]) == 1
+
+
+def test_parses_long_cvs_in_linear_time():
+    entry = "Research Engineer, Lab {i}\n" + "".join(f"- Published result {{i}}.{j} on distributed systems\n" for j in range(8))
+    pages = "".join(entry.format(i=i) for i in range(600))
+    text = "Jane Doe\nEXPERIENCE\n" + pages + "PUBLICATIONS\n" + "Paper title, venue, 2020\n" * 2000
+
+    started = time.perf_counter()
+    parsed = ResumeParser()._parse_text_content(text)
+    elapsed = time.perf_counter() - started
+
+    assert len(parsed["experience"]) == 600
+    assert elapsed < 1.0
@@ -0,0 +1,164 @@
+import asyncio
+
+import pytest
+
+from app.services.single_flight import SingleFlight
+from tests.test_ai_service import make_fake_client, make_service_with_client
+
+
+def test_concurrent_identical_calls_run_once():
+    """Callers arriving while a call is in flight share its result"""
+    flights = SingleFlight()
+    executions = []
+
+    async def work():
+        executions.append(1)
+        await asyncio.sleep(0.02)
+        return "result"
+
+    async def run():
+        return await asyncio.gather(*[flights.do("key", work) for _ in range(5)])
+
+    assert asyncio.run(run()) == ["result"] * 5
+    assert len(executions) == 1
+    assert flights.stats() == {"executions": 1, "coalesced": 4, "in_flight": 0}
+
+
+def test_errors_propagate_to_every_waiter():
+    """A failure of the shared call is raised to all callers"""
+    flights = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.01)
+        raise ValueError("provider down")
+
+    async def run():
+        return await asyncio.gather(*[flights.do("key", work) for _ in range(3)], return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_cancelled_waiter_does_not_cancel_others():
+    """One caller giving up leaves the shared call running for the rest"""
+    flights = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def run():
+        impatient = asyncio.ensure_future(flights.do("key", work))
+        patient = asyncio.ensure_future(flights.do("key", work))
+        await asyncio.sleep(0.01)
+        impatient.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await impatient
+        return await patient
+
+    assert asyncio.run(run()) == "result"
+
+
+def test_shared_call_is_cancelled_when_all_waiters_leave():
+    """Work nobody is waiting for any more is cancelled"""
+    flights = SingleFlight()
+    finished = []
+
+    async def work():
+        await asyncio.sleep(0.05)
+        finished.append(1)
+
+    async def run():
+        waiter = asyncio.ensure_future(flights.do("key", work))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        await asyncio.sleep(0.08)
+
+    asyncio.run(run())
+    assert finished == []
+    assert flights.in_flight() == 0
+
+
+def test_caller_after_last_waiter_leaves_starts_new_flight():
+    """A caller arriving while abandoned work is still cancelling is not handed the cancellation"""
+    flights = SingleFlight()
+    started = []
+
+    async def work():
+        started.append(1)
+        try:
+            await asyncio.sleep(0.05)
+        except asyncio.CancelledError:
+            # Cleanup that takes a turn of the event loop before the task is done
+            await asyncio.sleep(0)
+            raise
+        return "result"
+
+    async def run():
+        waiter = asyncio.ensure_future(flights.do("key", work))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        return await flights.do("key", work)
+
+    assert asyncio.run(run()) == "result"
+    assert len(started) == 2
+
+
+def test_duplicate_suggestion_requests_share_completions():
+    """A double-clicked match request pays for each completion once"""
+    client, completions = make_fake_client(delay=0.02)
+    service = make_service_with_client(client)
+    service.cache = None
+    resume_sections = {"experience": [{"bullets": ["Built APIs", "Wrote tests"]}], "skills": ["Python"]}
+
+    async def run():
+        return await asyncio.gather(*[
+            service.enhance_resume_content(resume_sections, "Analyze me: backend role", bypass_cache=True)
+            for _ in range(2)
+        ])
+
+    first, second = asyncio.run(run())
+    assert [s.suggested_content for s in first] == [s.suggested_content for s in second]
+    # One JD analysis and one bullet batch, shared by both requests
+    assert completions.calls == 2
+
+
+def test_each_waiter_gets_its_own_copy():
+    """A caller changing its result does not change what the others received"""
+    flights = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.02)
+        return {"required_skills": ["Python"]}
+
+    async def caller(mutate):
+        result = await flights.do("key", work)
+        if mutate:
+            result["required_skills"].append("Injected")
+        return result
+
+    async def run():
+        return await asyncio.gather(caller(True), caller(False), caller(False))
+
+    _, second, third = asyncio.run(run())
+    assert second == third == {"required_skills": ["Python"]}
+
+
+def test_coalesced_jd_analyses_are_independent():
+    client, completions = make_fake_client(delay=0.02)
+    service = make_service_with_client(client)
+    service.cache = None
+
+    async def run():
+        return await asyncio.gather(*[
+            service._analyze_job_description("Analyze me: platform role", client, bypass_cache=True)
+            for _ in range(2)
+        ])
+
+    first, second = asyncio.run(run())
+    first["required_skills"].clear()
+
+    assert completions.calls == 1
+    assert second["required_skills"] == ["Python", "Docker"]
@@ -0,0 +1,58 @@
+from app.services.job_analyzer import JobAnalyzer
+from app.services.resume_parser import ResumeParser
+from app.services.skill_matcher import SkillMatcher, load_skills
+
+
+def test_matches_on_word_boundaries_only():
+    matcher = SkillMatcher(["Git", "Java", "JavaScript", "C", "C++", "SQL", "Node.js"])
+
+    text = "Digital marketing lead. Wrote JavaScript, C++ and PostgreSQL; deployed Node.js apps with Git."
+
+    assert matcher.find(text) == ["JavaScript", "C++", "Node.js", "Git"]
+
+
+def test_finds_overlapping_and_multiword_skills_in_order_of_appearance():
+    matcher = SkillMatcher(["Machine Learning", "Learning", "AWS", "aws"])
+
+    found = matcher.find("Deployed models on AWS.\nApplied machine\nlearning at scale")
+
+    assert found == ["AWS", "Machine Learning", "Learning"]
+    assert len(matcher) == 3
+    assert matcher.find("machine learning", limit=1) == ["Machine Learning"]
+
+
+def test_parser_and_analyzer_share_the_matcher():
+    text = "Digital transformation role using Java and Kubernetes"
+
+    assert ResumeParser()._extract_skills(text) == ["Java", "Kubernetes"]
+    assert JobAnalyzer()._extract_skills(text) == ["Java", "Kubernetes"]
+
+
+def test_load_skills_appends_dictionary_file(tmp_path):
+    path = tmp_path / "skills.txt"
+    path.write_text("# comment\nSnowflake\n\ndbt\n")
+
+    skills = load_skills(str(path))
+
+    assert skills[-2:] == ["Snowflake", "dbt"]
+    assert "Python" in skills
+
+
+def test_large_dictionary_builds_and_matches():
+    skills = [f"skill{i}" for i in range(10000)] + ["Python"]
+    matcher = SkillMatcher(skills)
+
+    assert matcher.find("python, skill42 and skill9999 but not skill100000") == ["Python", "skill42", "skill9999"]
+
+
+def test_ambiguous_skills_need_their_casing_and_another_skill():
+    matcher = SkillMatcher(["Python", "Swift", "Spark", "Rust"], ambiguous=["Swift", "Spark", "Rust"])
+
+    assert matcher.find("Known for swift delivery and rust-proofing; Spark joy.") == []
+    assert matcher.find("Built iOS apps in Swift, ETL in Spark and a rust cli with Python") == ["Swift", "Spark", "Python"]
+    assert matcher.fingerprint != SkillMatcher(["Python", "Swift", "Spark", "Rust"]).fingerprint
+
+
+def test_built_in_ambiguous_skills_are_not_found_in_plain_prose():
+    assert ResumeParser()._extract_skills("Swift turnaround on requests, reviving a Ruby anniversary campaign") == []
+    assert JobAnalyzer()._extract_skills("Needs swift turnaround on python scripts") == ["Python"]
@@ -0,0 +1,73 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.main import app
+from app.services.ai_service import AIService
+from app.services.llm_cache import LLMResponseCache
+from app.services.telemetry import Histogram, MetricsRegistry, completion_cost
+
+
+def test_histogram_buckets_and_quantiles():
+    histogram = Histogram((1, 5, 10))
+    for value in (0.5, 2, 3, 4, 7, 20):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+
+    assert snapshot["count"] == 6
+    assert snapshot["buckets"] == {"1": 1, "5": 4, "10": 5, "+Inf": 6}
+    assert snapshot["p50"] == 5
+    assert snapshot["p95"] == float("inf")
+
+
+def test_completion_cost_uses_longest_model_prefix(monkeypatch):
+    monkeypatch.setattr(settings, "AI_MODEL_PRICES", {"gpt-4.1": [2.0, 8.0], "gpt-4.1-mini": [0.4, 1.6]})
+
+    assert completion_cost("gpt-4.1-mini-2025-04-14", 1_000_000, 0) == pytest.approx(0.4)
+    assert completion_cost("gpt-4.1-preview", 500_000, 100_000) == pytest.approx(1.8)
+    assert completion_cost("some-other-model", 1000, 1000) is None
+
+
+def test_ai_service_records_per_stage_telemetry(monkeypatch):
+    monkeypatch.setattr(settings, "AI_MODEL_PRICES", {"test-model": [1.0, 2.0]})
+
+    async def create(**kwargs):
+        content = json.dumps({"enhanced_bullet": "Better", "improvement_explanation": "x", "relevance_score": 70})
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=SimpleNamespace(prompt_tokens=300, completion_tokens=40, total_tokens=340)
+        )
+
+    client = SimpleNamespace(api_key="sk-telemetry", chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    service = AIService()
+    service.model = "test-model"
+    service.cache = LLMResponseCache(max_entries=10, ttl_seconds=60)
+    service.telemetry = MetricsRegistry()
+
+    async def enhance_twice():
+        for _ in range(2):
+            await service._enhance_bullet(0, 0, "Built APIs", ["Python"], [], client)
+
+    asyncio.run(enhance_twice())
+
+    bullet = service.telemetry.snapshot()["llm"]["bullet"]["test-model"]
+    assert bullet["calls"] == 1
+    assert bullet["cache_hits"] == 1
+    assert bullet["cache_misses"] == 1
+    assert bullet["prompt_tokens"]["sum"] == 300
+    assert bullet["completion_tokens"]["sum"] == 40
+    assert bullet["cost_usd"] == pytest.approx((300 * 1.0 + 40 * 2.0) / 1_000_000)
+    assert bullet["latency_seconds"]["count"] == 1
+
+
+def test_metrics_endpoints_require_authentication():
+    client = TestClient(app)
+
+    for path in ("/metrics/llm", "/metrics/telemetry", "/metrics/parser"):
+        assert client.get(path).status_code in (401, 403)
+        assert client.get(path, headers={"Authorization": "Bearer not-a-token"}).status_code == 401
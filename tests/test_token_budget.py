@@ -0,0 +1,49 @@
+import asyncio
+
+from app.config import settings
+from app.services.token_budget import (
+    estimate_tokens, truncate_to_tokens, fit_items_to_budget, TokenUsageTracker
+)
+from tests.test_ai_service import make_fake_client, make_service_with_client
+
+
+def test_estimate_tokens_counts_words_and_punctuation():
+    """Short words and punctuation are one token each; long words cost more"""
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("Built REST APIs.") == 5
+    assert estimate_tokens("internationalization") == 5
+
+
+def test_truncate_and_fit_respect_budgets():
+    """Trimming helpers never exceed the token budget"""
+    text = "word " * 100
+
+    assert estimate_tokens(truncate_to_tokens(text, 10)) <= 10
+    assert truncate_to_tokens("short text", 100) == "short text"
+    assert fit_items_to_budget(["Python", "Docker", "AWS", "Go"], max_items=3, max_tokens=100) == [
+        "Python", "Docker", "AWS"
+    ]
+    assert fit_items_to_budget(["Python", "Docker", "AWS"], max_items=10, max_tokens=6) == ["Python", "Docker"]
+
+
+def test_usage_tracker_reports_estimate_accuracy():
+    """Estimated prompt tokens are compared with what the provider reported"""
+    tracker = TokenUsageTracker()
+    tracker.record("bullet", estimated_prompt_tokens=110, max_tokens=250, prompt_tokens=100, completion_tokens=60)
+    tracker.record("bullet", estimated_prompt_tokens=90, max_tokens=250)
+
+    stats = tracker.stats()["bullet"]
+    assert stats["calls"] == 2
+    assert stats["estimate_ratio"] == 1.1
+    assert stats["avg_completion_tokens"] == 60
+
+
+def test_bullet_calls_use_stage_budget(monkeypatch):
+    """Bullet rewrites request the bullet budget, not the global MAX_TOKENS"""
+    monkeypatch.setattr(settings, "AI_BULLET_BATCH_SIZE", 1)
+    client, completions = make_fake_client(delay=0)
+    service = make_service_with_client(client)
+
+    asyncio.run(service._enhance_experience_section([{"bullets": ["Built APIs"]}], {}, client))
+
+    assert completions.max_tokens == [settings.AI_MAX_TOKENS_BULLET]